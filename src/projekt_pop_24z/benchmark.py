@@ -1,18 +1,46 @@
 from __future__ import annotations
-from typing import Callable
-from dataclasses import dataclass
-
-from tabulate import tabulate
-
-from src.projekt_pop_24z.utils.logger import LogParameters
+from typing import Callable, Iterable
+from dataclasses import dataclass, field, replace
+import enum
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark_functions.base import BatchFunction
+from src.projekt_pop_24z.utils.logger import LogParameters, LoggerAggregator
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.batched import BatchedSwarms
+from src.projekt_pop_24z.swarm.boundary import BoundaryStrategy, Clamp
+from src.projekt_pop_24z.swarm.cache import EvaluationCache
+from src.projekt_pop_24z.swarm.constraints import Constraints
+from src.projekt_pop_24z.swarm.evaluators import Evaluator
+from src.projekt_pop_24z.swarm.inertia import InertiaStrategy
 from src.projekt_pop_24z.swarm.pso import Task, Swarm, SwarmLogger
+from src.projekt_pop_24z.swarm.stopping import StoppingCriterion
+from src.projekt_pop_24z.swarm.surrogate import Screening
+from src.projekt_pop_24z.swarm.topology import Topology
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
 from src.projekt_pop_24z.utils.plotter import PlotDescription, Plotter, PlotType
-
+from src.projekt_pop_24z.utils.profiling import PhaseTimer
+from src.projekt_pop_24z.utils.run_log import RunLogWriter
 
 Bounds = list[list[float]]
 Coordinates = list[float]
 
 
+class Engine(enum.Enum):
+    PYTHON = enum.auto()
+    NUMPY = enum.auto()
+    ASYNC = enum.auto()
+    BATCHED = enum.auto()
+
+
+SWARM_ENGINES: dict[Engine, type[Swarm]] = {
+    Engine.PYTHON: Swarm,
+    Engine.NUMPY: VectorizedSwarm,
+    Engine.ASYNC: AsynchronousSwarm,
+}
+
+
 @dataclass
 class AlgorithmParameters:
     swarm_size: int
@@ -25,6 +53,17 @@ class AlgorithmParameters:
     social_constant: float
     dynamic_inertia: bool = False
     inertia_decay: float = 0
+    engine: Engine = Engine.PYTHON
+    stopping_criteria: list[StoppingCriterion] = field(default_factory=list)
+    evaluator: Evaluator | None = None
+    topology: Topology | None = None
+    profile: bool = False
+    screening: Screening | None = None
+    cache: EvaluationCache | None = None
+    inertia_strategy: InertiaStrategy | None = None
+    boundary: BoundaryStrategy = field(default_factory=Clamp)
+    v_max: float | Coordinates | None = None
+    constraints: Constraints | None = None
 
 
 @dataclass
@@ -33,6 +72,9 @@ class OptimizationResult:
     algorithm_parameters: AlgorithmParameters
     best_position: Coordinates
     best_cost: float
+    statistics: LoggerAggregator | None = None
+    evaluations: int = 0
+    profile: PhaseTimer | None = None
 
     @classmethod
     def aggregate(
@@ -54,30 +96,130 @@ class OptimizationResult:
             best_cost=best_costs,
         )
 
+    @classmethod
+    def from_runs(
+        cls, results: Iterable[OptimizationResult], length: int | None = None
+    ) -> OptimizationResult:
+        """Aggregate results one by one as the runs finish.
+
+        Same averages as `aggregate`, but only running sums are kept, so memory
+        does not grow with the number of runs. The per-iteration statistics
+        (std, quantile bands) are kept in `statistics`.
+
+        Args:
+            results (Iterable[OptimizationResult]): Results of the runs.
+            length (int | None): Length of the logged curves, see `LoggerAggregator`.
+
+        Returns:
+            OptimizationResult: The aggregated result.
+        """
+        aggregator = LoggerAggregator(length=length)
+        algorithm_parameters = None
+        best_position_sum = np.zeros(0)
+        best_cost_sum = 0.0
+        evaluations_sum = 0
+        profiles = []
+
+        for result in results:
+            aggregator.add(result.logger)
+            algorithm_parameters = algorithm_parameters or result.algorithm_parameters
+            if not len(best_position_sum):
+                best_position_sum = np.zeros(len(result.best_position))
+            best_position_sum += result.best_position
+            best_cost_sum += result.best_cost
+            evaluations_sum += result.evaluations
+            if result.profile is not None:
+                profiles.append(result.profile)
+
+        if algorithm_parameters is None:
+            raise ValueError("The results should not be empty.")
 
-def run_single_benchmark(
-    cost_function: Callable[[Coordinates], float],
-    parameters: AlgorithmParameters,
-    log_params: LogParameters,
-) -> tuple[OptimizationResult, SwarmLogger]:
+        return cls(
+            logger=aggregator.result(),
+            algorithm_parameters=algorithm_parameters,
+            best_position=(best_position_sum / aggregator.runs).tolist(),
+            best_cost=best_cost_sum / aggregator.runs,
+            statistics=aggregator,
+            evaluations=evaluations_sum // aggregator.runs,
+            profile=PhaseTimer.mean(profiles) if profiles else None,
+        )
+
+
+def make_logger(log_params: LogParameters) -> SwarmLogger:
+    """Create a logger, streaming to a new run directory of `log_dir` if set."""
+    sink = None
+    if log_params.log_dir is not None:
+        sink = RunLogWriter.create(
+            log_params.log_dir,
+            log_params.name,
+            positions_interval=log_params.log_positions_interval,
+        )
 
-    logger = SwarmLogger(
+    return SwarmLogger(
         epsilon=log_params.epsilon,
         name=log_params.name,
         optimum_position=log_params.optimum_value,
+        history_mode=log_params.history_mode,
+        history_interval=log_params.history_interval,
+        sink=sink,
     )
 
-    swarm = Swarm(
+
+def make_swarm(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    batch_cost_function: BatchFunction | None = None,
+    seed: int | None = None,
+) -> Swarm:
+    """Create a swarm of the configured engine, with a fresh logger."""
+    if parameters.engine not in SWARM_ENGINES:
+        raise ValueError(
+            f"The {parameters.engine.name} engine does not run a single swarm."
+        )
+
+    return SWARM_ENGINES[parameters.engine](
         swarm_size=parameters.swarm_size,
         bounds=parameters.bounds,
         dimensions=parameters.dimensions,
         task=parameters.task,
         cost_function=cost_function,
-        logger=logger,
+        logger=make_logger(log_params),
         dynamic_inertia=parameters.dynamic_inertia,
         inertia_decay=parameters.inertia_decay,
+        batch_cost_function=batch_cost_function,
+        stopping_criteria=parameters.stopping_criteria,
+        rng=seed,
+        evaluator=parameters.evaluator,
+        topology=parameters.topology,
+        profile=parameters.profile,
+        screening=parameters.screening,
+        # Every swarm starts with an empty cache of the configured size
+        cache=replace(parameters.cache) if parameters.cache is not None else None,
+        inertia_strategy=parameters.inertia_strategy,
+        boundary=parameters.boundary,
+        v_max=parameters.v_max,
+        constraints=parameters.constraints,
     )
 
+
+def run_single_benchmark(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    batch_cost_function: BatchFunction | None = None,
+    seed: int | None = None,
+) -> tuple[OptimizationResult, SwarmLogger]:
+
+    if parameters.engine is Engine.BATCHED:
+        [result] = run_batched_benchmark(
+            cost_function, parameters, log_params, batch_cost_function, [seed]
+        )
+        return result, result.logger
+
+    swarm = make_swarm(cost_function, parameters, log_params, batch_cost_function, seed)
+    logger = swarm.logger
+
     swarm.init_swarm()
 
     optimization_result = swarm.run_optimization(
@@ -86,31 +228,166 @@ def run_single_benchmark(
         cognitive_constant=parameters.cognitive_constant,
         social_constant=parameters.social_constant,
     )
+    logger.close()
 
     return (
         OptimizationResult(
             logger=logger,
             algorithm_parameters=parameters,
             best_position=optimization_result,
-            best_cost=cost_function(optimization_result),
+            best_cost=swarm.global_best_cost,
+            evaluations=swarm.evaluations,
+            profile=swarm.timer if parameters.profile else None,
         ),
         logger,
     )
 
 
+def run_batched_benchmark(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    batch_cost_function: BatchFunction | None,
+    seeds: list[int | None],
+) -> list[OptimizationResult]:
+    """Run one benchmark per seed at once with `BatchedSwarms`.
+
+    Gives the same results as running the `NUMPY` engine once per seed.
+    Only clamping to the bounds is supported; stopping criteria,
+    evaluators, topologies, profiling, screening, caching, inertia
+    strategies, velocity clamping and constraints are not.
+
+    Returns:
+        list[OptimizationResult]: One result per seed.
+    """
+    if (
+        parameters.stopping_criteria
+        or parameters.evaluator
+        or parameters.topology
+        or parameters.profile
+        or parameters.screening
+        or parameters.cache is not None
+        or parameters.inertia_strategy is not None
+        or type(parameters.boundary) is not Clamp
+        or parameters.v_max is not None
+        or parameters.constraints is not None
+    ):
+        raise ValueError(
+            "The BATCHED engine does not support stopping criteria, evaluators, "
+            "topologies, profiling, screening, caching, inertia strategies, "
+            "boundary strategies other than clamping, velocity clamping or "
+            "constraints."
+        )
+
+    swarms = BatchedSwarms(
+        swarm_size=parameters.swarm_size,
+        bounds=parameters.bounds,
+        dimensions=parameters.dimensions,
+        task=parameters.task,
+        cost_function=cost_function,
+        loggers=[make_logger(log_params) for _ in seeds],
+        dynamic_inertia=parameters.dynamic_inertia,
+        inertia_decay=parameters.inertia_decay,
+        batch_cost_function=batch_cost_function,
+        seeds=seeds,
+    )
+
+    best_positions = swarms.run_optimization(
+        iterations=parameters.iterations,
+        initial_inertia=parameters.initial_inertia,
+        cognitive_constant=parameters.cognitive_constant,
+        social_constant=parameters.social_constant,
+    )
+    for logger in swarms.loggers:
+        logger.close()
+
+    return [
+        OptimizationResult(
+            logger=logger,
+            algorithm_parameters=parameters,
+            best_position=best_position,
+            best_cost=best_cost,
+            evaluations=swarms.evaluations // swarms.runs,
+        )
+        for logger, best_position, best_cost in zip(
+            swarms.loggers,
+            best_positions.tolist(),
+            swarms.global_best_costs.tolist(),
+        )
+    ]
+
+
+def run_compact_batched_benchmark(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    batch_cost_function: BatchFunction | None,
+    seeds: list[int | None],
+) -> list[OptimizationResult]:
+    """`run_batched_benchmark` with compacted loggers, see `run_compact_benchmark`."""
+    results = run_batched_benchmark(
+        cost_function, parameters, log_params, batch_cost_function, seeds
+    )
+    for result in results:
+        result.logger = result.logger.compact()
+    return results
+
+
+def derive_run_seeds(seed: int | None, n_runs: int) -> list[int]:
+    """Derive independent per-run seeds from a master seed.
+
+    The seeds depend only on the master seed and the run index, so results do
+    not depend on how the runs are distributed across workers.
+
+    Args:
+        seed (int | None): Master seed, None for fresh entropy.
+        n_runs (int): Number of runs.
+
+    Returns:
+        list[int]: One seed per run.
+    """
+    return [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(n_runs)
+    ]
+
+
+def run_compact_benchmark(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    batch_cost_function: BatchFunction | None = None,
+    seed: int | None = None,
+) -> OptimizationResult:
+    """Run a single benchmark and return a result that is cheap to pickle.
+
+    The logger of the result keeps only the first and last particle positions
+    epochs, which is all the aggregated plots need.
+    """
+    result, logger = run_single_benchmark(
+        cost_function, parameters, log_params, batch_cost_function, seed
+    )
+    result.logger = logger.compact()
+    return result
+
+
 def run_benchmark_and_plot(
     cost_function: Callable[[Coordinates], float],
     parameters: AlgorithmParameters,
     log_params: LogParameters,
     plot_description: PlotDescription,
     plot_types: list[PlotType],
+    batch_cost_function: BatchFunction | None = None,
 ) -> OptimizationResult:
-    result, logger = run_single_benchmark(cost_function, parameters, log_params)
+    result, logger = run_single_benchmark(
+        cost_function, parameters, log_params, batch_cost_function
+    )
     plotter = Plotter(
         logger=logger,
         plot_description=plot_description,
         bounds=parameters.bounds,
         func=cost_function,
+        batch_func=batch_cost_function,
     )
 
     for plot_type in plot_types:
@@ -127,6 +404,55 @@ def run_benchmark_and_plot(
     return result
 
 
+def run_benchmark_aggregated(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    n_times: int,
+    batch_cost_function: BatchFunction | None = None,
+    workers: int = 1,
+    seed: int | None = None,
+) -> OptimizationResult:
+    """Run the benchmark `n_times` and aggregate the results.
+
+    With `workers` > 1 the independent runs are spread across a process pool.
+    Each run gets its own seed derived from `seed`, so the aggregated result
+    is the same for any number of workers. The `BATCHED` engine runs the
+    seeds in one batch per worker instead of one task per run.
+    """
+    run_seeds = derive_run_seeds(seed, n_times)
+
+    if parameters.engine is Engine.BATCHED:
+        run_function = run_compact_batched_benchmark
+        tasks = [
+            batch.tolist() for batch in np.array_split(run_seeds, min(workers, n_times))
+        ]
+    else:
+        run_function = run_compact_benchmark
+        tasks = run_seeds
+
+    run_args = (
+        [cost_function] * len(tasks),
+        [parameters] * len(tasks),
+        [log_params] * len(tasks),
+        [batch_cost_function] * len(tasks),
+        tasks,
+    )
+
+    length = parameters.iterations + 1
+
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return OptimizationResult.from_runs(
+                _flatten_results(executor.map(run_function, *run_args)), length
+            )
+    return OptimizationResult.from_runs(
+        _flatten_results(map(run_function, *run_args)), length
+    )
+
+
 def run_benchmark_and_plot_aggregated(
     cost_function: Callable[[Coordinates], float],
     parameters: AlgorithmParameters,
@@ -134,23 +460,32 @@ def run_benchmark_and_plot_aggregated(
     plot_description: PlotDescription,
     plot_types: list[PlotType],
     n_times: int,
+    batch_cost_function: BatchFunction | None = None,
+    workers: int = 1,
+    seed: int | None = None,
 ) -> OptimizationResult:
-    results: list[OptimizationResult] = []
-    loggers: list[SwarmLogger] = []
-
-    for _ in range(n_times):
-        result, logger = run_single_benchmark(cost_function, parameters, log_params)
-        loggers.append(logger)
-        results.append(result)
+    """Run the benchmark `n_times` and plot the aggregated results.
+
+    See `run_benchmark_aggregated` for how the runs are spread and seeded.
+    """
+    aggregated_result = run_benchmark_aggregated(
+        cost_function,
+        parameters,
+        log_params,
+        n_times,
+        batch_cost_function,
+        workers,
+        seed,
+    )
 
-    aggregated_logger = SwarmLogger.aggregate(loggers)
-    aggregated_result = OptimizationResult.aggregate(aggregated_logger, results)
+    aggregated_logger = aggregated_result.logger
 
     plotter = Plotter(
         logger=aggregated_logger,
         plot_description=plot_description,
         bounds=parameters.bounds,
         func=cost_function,
+        batch_func=batch_cost_function,
     )
 
     for plot_type in plot_types:
@@ -167,7 +502,20 @@ def run_benchmark_and_plot_aggregated(
     return aggregated_result
 
 
+def _flatten_results(
+    results: Iterable[OptimizationResult | list[OptimizationResult]],
+) -> Iterable[OptimizationResult]:
+    """Yield the results of single runs and of batches of runs one by one."""
+    for result in results:
+        if isinstance(result, list):
+            yield from result
+        else:
+            yield result
+
+
 def pretty_print_result(result: OptimizationResult) -> None:
+    from tabulate import tabulate
+
     print("-" * 30)
     print(f"Benchmark Result for Function: {result.logger.name}")
     print("-" * 30)
@@ -184,11 +532,45 @@ def pretty_print_result(result: OptimizationResult) -> None:
         ["Cognitive Constant", params.cognitive_constant],
         ["Social Constant", params.social_constant],
         ["Dynamic Inertia", "Enabled" if params.dynamic_inertia else "Disabled"],
+        ["Engine", params.engine.name],
     ]
 
+    if params.topology is not None:
+        param_table.append(["Topology", params.topology])
+
+    if params.screening is not None:
+        param_table.append(["Screening", params.screening])
+
+    if params.cache is not None:
+        param_table.append(["Evaluation Cache", params.cache])
+
+    if params.evaluator is not None:
+        param_table.append(["Evaluator", type(params.evaluator).__name__])
+
     if params.dynamic_inertia:
         param_table.append(["Inertia Decay", params.inertia_decay])
 
+    if params.inertia_strategy is not None:
+        param_table.append(["Inertia Strategy", params.inertia_strategy])
+
+    if type(params.boundary) is not Clamp:
+        param_table.append(["Boundary Strategy", params.boundary])
+
+    if params.v_max is not None:
+        param_table.append(["Maximum Velocity", params.v_max])
+
+    if params.constraints is not None:
+        param_table.append(
+            [
+                "Constraints",
+                f"{len(params.constraints.inequalities)} inequalities, "
+                f"{params.constraints.handling.name}",
+            ]
+        )
+
+    for criterion in params.stopping_criteria:
+        param_table.append(["Stopping Criterion", criterion])
+
     print("\nAlgorithm Parameters:")
     print(tabulate(param_table, headers=["Parameter", "Value"], tablefmt="grid"))
 
@@ -196,6 +578,21 @@ def pretty_print_result(result: OptimizationResult) -> None:
     print("\nOptimization Results:")
     print(f"- Best Position: {[round(pos, 5) for pos in result.best_position]}")
     print(f"- Best Cost: {result.best_cost:.10f}")
+    if result.statistics is not None:
+        cost_statistics = result.statistics.global_best_costs
+        lower_q = min(cost_statistics.quantiles)
+        upper_q = max(cost_statistics.quantiles)
+        lower, upper = cost_statistics.band(lower_q, upper_q)
+        print(f"- Runs: {result.statistics.runs}")
+        print(f"- Best Cost Std: {cost_statistics.std()[-1]:.10f}")
+        print(
+            f"- Best Cost {lower_q:.0%}-{upper_q:.0%} Band: "
+            f"[{lower[-1]:.10f}, {upper[-1]:.10f}]"
+        )
+    if result.logger.elapsed_seconds > 0:
+        print(f"- Throughput: {result.logger.evaluations_per_second:.1f} evaluations/s")
+    if result.logger.cache_lookups > 0:
+        print(f"- Cache Hit Rate: {result.logger.cache_hit_rate:.1%}")
     if result.logger.epsilon != -1:
         print(f"- Epsilon: {result.logger.epsilon}")
         if result.logger.epsilon_reached:
@@ -204,4 +601,19 @@ def pretty_print_result(result: OptimizationResult) -> None:
             )
         else:
             print("- Epsilon not reached.")
+    if result.logger.stop_reason is not None:
+        print(
+            f"- Stopped early after {result.logger.iterations} iterations: "
+            f"{result.logger.stop_reason}"
+        )
+    if result.profile is not None:
+        print(f"\nProfile ({result.profile.evaluations} evaluations):")
+        print(
+            tabulate(
+                result.profile.summary(),
+                headers=["Phase", "Total [s]", "Per Iteration [ms]", "Share"],
+                tablefmt="grid",
+                floatfmt=".4f",
+            )
+        )
     print("\n" + "=|=" * 30 + "\n")
@@ -1,7 +1,12 @@
 from dataclasses import dataclass, field
 import math
 from typing import Callable
-from src.projekt_pop_24z.benchmark_functions.base import BenchmarkFunction
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    BenchmarkFunction,
+)
+
+import numpy as np
 
 
 def ackley_function(position: list[float]) -> float:
@@ -19,8 +24,24 @@ def ackley_function(position: list[float]) -> float:
     return term1 + term2 + a + math.e
 
 
+def ackley_batch_function(positions: np.ndarray) -> np.ndarray:
+    a = 20
+    b = 0.2
+    c = 2 * np.pi
+    n = positions.shape[1]
+
+    sum1 = np.sum(positions**2, axis=1)
+    sum2 = np.sum(np.cos(c * positions), axis=1)
+
+    term1 = -a * np.exp(-b * np.sqrt(sum1 / n))
+    term2 = -np.exp(sum2 / n)
+
+    return term1 + term2 + a + np.e
+
+
 @dataclass
 class Ackley(BenchmarkFunction):
     name: str = field(init=False, default="Ackley")
     optimum_value: float = field(init=False, default=0)
     function: Callable[[list[float]], float] = field(default=ackley_function)
+    batch_function: BatchFunction = field(default=ackley_batch_function)
@@ -1,9 +1,31 @@
 from dataclasses import dataclass
 from typing import List, Callable
 
+import numpy as np
+
+
+BatchFunction = Callable[[np.ndarray], np.ndarray]
+
 
 @dataclass
 class BenchmarkFunction:
     name: str
     function: Callable[[List[float]], float]
     optimum_value: float = 0
+    batch_function: BatchFunction | None = None
+
+
+@dataclass
+class ScalarBatchAdapter:
+    """Batch function that evaluates a scalar function row by row.
+
+    Lets scalar-only cost functions be used wherever a batch function is expected.
+    """
+
+    function: Callable[[List[float]], float]
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        return np.array(
+            [self.function(position) for position in positions.tolist()],
+            dtype=np.float64,
+        )
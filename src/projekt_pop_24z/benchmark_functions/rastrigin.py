@@ -1,8 +1,13 @@
 from dataclasses import field, dataclass
-from src.projekt_pop_24z.benchmark_functions.base import BenchmarkFunction
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    BenchmarkFunction,
+)
 from typing import Callable, List
 import math
 
+import numpy as np
+
 
 def rastrigin_function(position: List[float]) -> float:
     A = 10  # Constant that defines the function's amplitude
@@ -11,8 +16,16 @@ def rastrigin_function(position: List[float]) -> float:
     )
 
 
+def rastrigin_batch_function(positions: np.ndarray) -> np.ndarray:
+    A = 10  # Constant that defines the function's amplitude
+    return A * positions.shape[1] + np.sum(
+        positions**2 - A * np.cos(2 * np.pi * positions), axis=1
+    )
+
+
 @dataclass
 class Rastrigin(BenchmarkFunction):
     name: str = field(init=False, default="Rastrigin")
     optimum_value: float = field(init=False, default=0)  # Minimum value of the function
     function: Callable[[List[float]], float] = field(default=rastrigin_function)
+    batch_function: BatchFunction = field(default=rastrigin_batch_function)
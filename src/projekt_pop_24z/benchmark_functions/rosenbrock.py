@@ -1,7 +1,12 @@
 from dataclasses import field, dataclass
-from src.projekt_pop_24z.benchmark_functions.base import BenchmarkFunction
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    BenchmarkFunction,
+)
 from typing import Callable, List
 
+import numpy as np
+
 
 def rosenbrock_function(position: List[float]) -> float:
     return sum(
@@ -12,8 +17,14 @@ def rosenbrock_function(position: List[float]) -> float:
     )
 
 
+def rosenbrock_batch_function(positions: np.ndarray) -> np.ndarray:
+    head, tail = positions[:, :-1], positions[:, 1:]
+    return np.sum(100 * (tail - head**2) ** 2 + (1 - head) ** 2, axis=1)
+
+
 @dataclass
 class Rosenbrock(BenchmarkFunction):
     name: str = field(init=False, default="Rosenbrock")
     optimum_value: float = field(init=False, default=0)
     function: Callable[[List[float]], float] = field(default=rosenbrock_function)
+    batch_function: BatchFunction = field(default=rosenbrock_batch_function)
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Callable, List
+import asyncio
+import time
+
+
+@dataclass
+class SlowFunction:
+    """Mock of an expensive objective: sleeps for `delay` seconds, then calls `function`.
+
+    Sleeping releases the GIL like I/O or a subprocess call would, which makes
+    it a local stand-in for benchmarking the evaluators.
+    """
+
+    function: Callable[[List[float]], float]
+    delay: float = 0.1
+
+    def __call__(self, position: List[float]) -> float:
+        time.sleep(self.delay)
+        return self.function(position)
+
+
+@dataclass
+class AsyncSlowFunction:
+    """Coroutine version of `SlowFunction`, for the asyncio evaluator."""
+
+    function: Callable[[List[float]], float]
+    delay: float = 0.1
+
+    async def __call__(self, position: List[float]) -> float:
+        await asyncio.sleep(self.delay)
+        return self.function(position)
@@ -1,14 +1,24 @@
 from dataclasses import field, dataclass
-from src.projekt_pop_24z.benchmark_functions.base import BenchmarkFunction
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    BenchmarkFunction,
+)
 from typing import Callable, List
 
+import numpy as np
+
 
 def sphere_function(position: List[float]) -> float:
     return sum([x**2 for x in position])
 
 
+def sphere_batch_function(positions: np.ndarray) -> np.ndarray:
+    return np.sum(positions**2, axis=1)
+
+
 @dataclass
 class Sphere(BenchmarkFunction):
     name: str = field(init=False, default="Sphere")
     optimum_value: float = field(init=False, default=0)
     function: Callable[[List[float]], float] = field(default=sphere_function)
+    batch_function: BatchFunction = field(default=sphere_batch_function)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Sequence
+import argparse
+import json
+import os
+import sys
+
+from src.projekt_pop_24z.benchmark import (
+    AlgorithmParameters,
+    Engine,
+    OptimizationResult,
+    pretty_print_result,
+    run_benchmark_aggregated,
+    run_benchmark_and_plot_aggregated,
+)
+from src.projekt_pop_24z.swarm.inertia import (
+    Chaotic,
+    DiversityFeedback,
+    InertiaStrategy,
+    LinearDecreasing,
+    SuccessRate,
+)
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.sweep import FUNCTIONS_BY_NAME
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters
+from src.projekt_pop_24z.utils.plotter import PlotDescription, PlotType
+
+
+# "constant" and "geometric" are handled by the swarm itself, see `Swarm.update_inertia`
+INERTIA_STRATEGIES: dict[str, Callable[[], InertiaStrategy] | None] = {
+    "constant": None,
+    "geometric": None,
+    "linear": LinearDecreasing,
+    "chaotic": Chaotic,
+    "success-rate": SuccessRate,
+    "diversity": DiversityFeedback,
+}
+
+
+def make_parameters(args: argparse.Namespace) -> AlgorithmParameters:
+    """Algorithm parameters described by the parsed arguments."""
+    strategy = INERTIA_STRATEGIES[args.inertia]
+    geometric = args.inertia == "geometric"
+    return AlgorithmParameters(
+        swarm_size=args.swarm_size,
+        bounds=[list(args.bounds)] * args.dimensions,
+        dimensions=args.dimensions,
+        task=Task.MINIMIZE,
+        iterations=args.iterations,
+        initial_inertia=args.initial_inertia,
+        cognitive_constant=args.cognitive_constant,
+        social_constant=args.social_constant,
+        dynamic_inertia=geometric,
+        inertia_decay=args.inertia_decay if geometric else 0,
+        engine=Engine[args.engine],
+        inertia_strategy=strategy() if strategy is not None else None,
+    )
+
+
+def result_to_json(result: OptimizationResult) -> dict:
+    """JSON-serialisable summary of an aggregated result."""
+    logger = result.logger
+    summary = {
+        "function": logger.name,
+        "best_cost": result.best_cost,
+        "best_position": result.best_position,
+        "evaluations": result.evaluations,
+        "evaluations_per_second": logger.evaluations_per_second,
+        "iterations_until_epsilon": logger.iterations_until_epsilon,
+        "global_best_costs": list(logger.global_best_costs),
+    }
+    if result.statistics is not None:
+        summary["runs"] = result.statistics.runs
+        summary["epsilon_reached_runs"] = result.statistics.epsilon_reached_runs
+        summary["best_cost_std"] = float(result.statistics.global_best_costs.std()[-1])
+    return summary
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run a PSO benchmark several times and report the mean result."
+    )
+    parser.add_argument("--function", default="Rastrigin", choices=FUNCTIONS_BY_NAME)
+    parser.add_argument("--dimensions", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--format", default="table", choices=["table", "json"])
+    parser.add_argument("--swarm-size", type=int, default=20)
+    parser.add_argument(
+        "--bounds",
+        nargs=2,
+        type=float,
+        default=[-2.048, 2.048],
+        metavar=("LOW", "HIGH"),
+    )
+    parser.add_argument("--initial-inertia", type=float, default=0.8)
+    parser.add_argument("--cognitive-constant", type=float, default=2.0)
+    parser.add_argument("--social-constant", type=float, default=2.0)
+    parser.add_argument("--inertia", default="geometric", choices=INERTIA_STRATEGIES)
+    parser.add_argument(
+        "--inertia-decay",
+        type=float,
+        default=1.0001,
+        help="Strength of the geometric decay.",
+    )
+    parser.add_argument(
+        "--engine", default=Engine.PYTHON.name, choices=[e.name for e in Engine]
+    )
+    parser.add_argument("--epsilon", type=float, default=10e-5)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument(
+        "--plot",
+        action="store_true",
+        help="Save the plots of the aggregated result in plots/.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Returns:
+        int: Exit code.
+    """
+    args = parse_args(argv)
+    function = FUNCTIONS_BY_NAME[args.function]
+    parameters = make_parameters(args)
+    # The starting and ending positions are only plotted in 2D
+    plot_positions = args.plot and args.dimensions == 2
+    log_params = LogParameters(
+        name=function.name,
+        optimum_value=function.optimum_value,
+        epsilon=args.epsilon,
+        history_mode=HistoryMode.FIRST_LAST if plot_positions else HistoryMode.NONE,
+    )
+
+    if args.plot:
+        Path("plots").mkdir(exist_ok=True)
+        result = run_benchmark_and_plot_aggregated(
+            cost_function=function.function,
+            parameters=parameters,
+            log_params=log_params,
+            plot_description=PlotDescription(
+                problem_name=function.name, save_path=f"{function.name}.png"
+            ),
+            plot_types=[PlotType.GLOBAL_BEST_COSTS]
+            + ([PlotType.STARTING_AND_ENDING_POSITIONS] if plot_positions else []),
+            n_times=args.runs,
+            batch_cost_function=function.batch_function,
+            workers=args.workers,
+            seed=args.seed,
+        )
+    else:
+        result = run_benchmark_aggregated(
+            cost_function=function.function,
+            parameters=parameters,
+            log_params=log_params,
+            n_times=args.runs,
+            batch_cost_function=function.batch_function,
+            workers=args.workers,
+            seed=args.seed,
+        )
+
+    if args.format == "json":
+        print(json.dumps(result_to_json(result), indent=2))
+    else:
+        pretty_print_result(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
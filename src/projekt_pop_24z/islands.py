@@ -0,0 +1,406 @@
+from __future__ import annotations
+from copy import deepcopy
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Callable
+import enum
+import multiprocessing
+import multiprocessing.connection
+import threading
+import time
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark import (
+    AlgorithmParameters,
+    OptimizationResult,
+    derive_run_seeds,
+    make_swarm,
+)
+from src.projekt_pop_24z.benchmark_functions.base import BatchFunction
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters, SwarmLogger
+
+
+Coordinates = list[float]
+Migrants = tuple[np.ndarray, np.ndarray]
+
+
+class MigrationTopology(enum.Enum):
+    RING = enum.auto()
+    FULLY_CONNECTED = enum.auto()
+
+    def sources(self, island: int, n_islands: int) -> list[int]:
+        """Islands that send their migrants to `island`."""
+        if n_islands == 1:
+            return []
+        match self:
+            case MigrationTopology.RING:
+                return [(island - 1) % n_islands]
+            case MigrationTopology.FULLY_CONNECTED:
+                return [i for i in range(n_islands) if i != island]
+
+    def targets(self, island: int, n_islands: int) -> list[int]:
+        """Islands `island` sends its migrants to."""
+        return [i for i in range(n_islands) if island in self.sources(i, n_islands)]
+
+
+@dataclass
+class IslandParameters:
+    """Configuration of the island model.
+
+    Args:
+        n_islands (int): Number of swarms, each of `AlgorithmParameters.swarm_size`.
+        migration_interval (int): Iterations between two migrations.
+        topology (MigrationTopology): Which islands exchange migrants.
+        migrants (int): Number of best particles every island sends.
+    """
+
+    n_islands: int
+    migration_interval: int
+    topology: MigrationTopology = MigrationTopology.RING
+    migrants: int = 1
+
+    def __post_init__(self):
+        if self.n_islands < 1:
+            raise ValueError("There should be at least one island.")
+        if self.migration_interval < 1:
+            raise ValueError("Migration interval should be a positive integer.")
+
+
+def run_islands(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    island_parameters: IslandParameters,
+    batch_cost_function: BatchFunction | None = None,
+    seed: int | None = None,
+    processes: bool = True,
+) -> OptimizationResult:
+    """Run the island model: independent swarms that periodically exchange migrants.
+
+    Every `migration_interval` iterations each island sends the personal bests
+    of its `migrants` best particles to its targets in the topology and lets
+    the ones it receives replace its worst particles. In between the islands
+    run without any synchronisation.
+
+    Args:
+        cost_function (Callable[[Coordinates], float]): Cost function.
+        parameters (AlgorithmParameters): Parameters of every island.
+        log_params (LogParameters): Logging parameters.
+        island_parameters (IslandParameters): Configuration of the island model.
+        batch_cost_function (BatchFunction | None): Vectorised cost function.
+        seed (int | None): Master seed, every island gets a seed derived from it.
+        processes (bool): Run each island in its own process connected by pipes;
+            if False, the islands run in turn in the calling process. Both give
+            the same result for the same seed.
+
+    Returns:
+        OptimizationResult: The islands merged into one result, see `merge_islands`.
+    """
+    seeds = derive_run_seeds(seed, island_parameters.n_islands)
+    chunks = _chunks(parameters.iterations, island_parameters.migration_interval)
+    started_at = time.perf_counter()
+
+    if processes and island_parameters.n_islands > 1:
+        results = _run_in_processes(
+            cost_function,
+            parameters,
+            log_params,
+            island_parameters,
+            batch_cost_function,
+            seeds,
+            chunks,
+        )
+    else:
+        results = _run_in_turn(
+            cost_function,
+            parameters,
+            log_params,
+            island_parameters,
+            batch_cost_function,
+            seeds,
+            chunks,
+        )
+
+    return merge_islands(results, time.perf_counter() - started_at)
+
+
+def merge_islands(
+    results: list[OptimizationResult], elapsed_seconds: float
+) -> OptimizationResult:
+    """Merge the results of the islands into the result of one big population.
+
+    The best position and cost are those of the best island, the logged cost
+    curve is the best cost over all islands at every iteration and the particle
+    positions history holds the particles of all islands.
+
+    Args:
+        results (list[OptimizationResult]): Results of the islands.
+        elapsed_seconds (float): Wall-clock time of the whole model.
+
+    Returns:
+        OptimizationResult: The merged result.
+    """
+    parameters = results[0].algorithm_parameters
+    pick = max if parameters.task is Task.MAXIMIZE else min
+    best = pick(results, key=lambda result: result.best_cost)
+    loggers = [result.logger for result in results]
+    template = loggers[0]
+
+    # The islands already picked the epochs to keep, the merged logger keeps them all
+    logger = SwarmLogger(
+        name=template.name,
+        epsilon=template.epsilon,
+        optimum_position=template.optimum_position,
+        history_mode=HistoryMode.FULL,
+        history_interval=template.history_interval,
+    )
+
+    length = max(len(island.global_best_costs) for island in loggers)
+    curves = np.array([_pad(island.global_best_costs, length) for island in loggers])
+    best_curve = curves.max(axis=0) if pick is max else curves.min(axis=0)
+    logger.inertia_history = _pad(template.inertia_history, length).tolist()
+
+    for iteration, cost in enumerate(best_curve.tolist()):
+        logger.log_global_best_cost(cost)
+        if iteration:
+            logger.increment_iterations()
+            logger.check_epsilon()
+
+    histories = [island.particle_positions_history for island in loggers]
+    if len({history.shape[0] for history in histories}) == 1:
+        for epoch in np.concatenate(histories, axis=1):
+            logger.add_particle_epoch(epoch)
+        logger.particle_positions_epochs = template.particle_positions_epochs[:]
+    logger.history_mode = template.history_mode
+
+    stop_reasons = {island.stop_reason for island in loggers}
+    if None not in stop_reasons:
+        logger.log_stop_reason(", ".join(sorted(stop_reasons)))
+
+    evaluations = sum(result.evaluations for result in results)
+    logger.log_throughput(evaluations, elapsed_seconds)
+
+    return OptimizationResult(
+        logger=logger,
+        algorithm_parameters=parameters,
+        best_position=best.best_position,
+        best_cost=best.best_cost,
+        evaluations=evaluations,
+    )
+
+
+def _run_in_turn(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    island_parameters: IslandParameters,
+    batch_cost_function: BatchFunction | None,
+    seeds: list[int],
+    chunks: list[int],
+) -> list[OptimizationResult]:
+    n_islands = island_parameters.n_islands
+    topology = island_parameters.topology
+    # Every island needs its own stateful stopping criteria
+    swarms = [
+        make_swarm(
+            cost_function,
+            deepcopy(parameters),
+            log_params,
+            batch_cost_function,
+            island_seed,
+        )
+        for island_seed in seeds
+    ]
+
+    for epoch, chunk in enumerate(chunks):
+        if epoch:
+            migrants = [swarm.emigrants(island_parameters.migrants) for swarm in swarms]
+            for island, swarm in enumerate(swarms):
+                sources = topology.sources(island, n_islands)
+                _immigrate(swarm, [migrants[source] for source in sources])
+
+        for swarm in swarms:
+            _advance(swarm, parameters, chunk)
+
+    return [_island_result(swarm, parameters) for swarm in swarms]
+
+
+def _run_in_processes(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    island_parameters: IslandParameters,
+    batch_cost_function: BatchFunction | None,
+    seeds: list[int],
+    chunks: list[int],
+) -> list[OptimizationResult]:
+    n_islands = island_parameters.n_islands
+    topology = island_parameters.topology
+
+    # One one-way pipe per directed edge of the topology
+    pipes = {
+        (source, target): multiprocessing.Pipe(duplex=False)
+        for target in range(n_islands)
+        for source in topology.sources(target, n_islands)
+    }
+    result_pipes = [multiprocessing.Pipe(duplex=False) for _ in range(n_islands)]
+
+    workers = []
+    for island in range(n_islands):
+        senders = [
+            pipes[(island, target)][1] for target in topology.targets(island, n_islands)
+        ]
+        receivers = [
+            pipes[(source, island)][0] for source in topology.sources(island, n_islands)
+        ]
+        worker = multiprocessing.Process(
+            target=_island_process,
+            args=(
+                cost_function,
+                parameters,
+                log_params,
+                island_parameters,
+                batch_cost_function,
+                seeds[island],
+                chunks,
+                senders,
+                receivers,
+                result_pipes[island][1],
+            ),
+            daemon=True,
+        )
+        worker.start()
+        workers.append(worker)
+
+    results: list[OptimizationResult | None] = [None] * n_islands
+    pending = {result_pipes[island][0]: island for island in range(n_islands)}
+    sentinels = {worker.sentinel: island for island, worker in enumerate(workers)}
+    try:
+        while pending:
+            ready = multiprocessing.connection.wait([*pending, *sentinels])
+            for connection in [c for c in ready if c in pending]:
+                island = pending.pop(connection)
+                result = connection.recv()
+                if isinstance(result, BaseException):
+                    raise result
+                results[island] = result
+
+            for sentinel in [s for s in ready if s in sentinels]:
+                island = sentinels.pop(sentinel)
+                connection = result_pipes[island][0]
+                if connection in pending and not connection.poll():
+                    raise RuntimeError(
+                        f"Island {island} exited with code {workers[island].exitcode}."
+                    )
+    finally:
+        for worker in workers:
+            if worker.is_alive() and pending:
+                worker.terminate()
+            worker.join()
+
+    return results
+
+
+def _island_process(
+    cost_function: Callable[[Coordinates], float],
+    parameters: AlgorithmParameters,
+    log_params: LogParameters,
+    island_parameters: IslandParameters,
+    batch_cost_function: BatchFunction | None,
+    seed: int,
+    chunks: list[int],
+    senders: list[Connection],
+    receivers: list[Connection],
+    result_connection: Connection,
+) -> None:
+    try:
+        swarm = make_swarm(
+            cost_function, parameters, log_params, batch_cost_function, seed
+        )
+
+        for epoch, chunk in enumerate(chunks):
+            if epoch:
+                migrants = swarm.emigrants(island_parameters.migrants)
+                _immigrate(swarm, _exchange(migrants, senders, receivers))
+
+            _advance(swarm, parameters, chunk)
+
+        result_connection.send(_island_result(swarm, parameters))
+    except BaseException as error:
+        result_connection.send(error)
+
+
+def _exchange(
+    migrants: Migrants, senders: list[Connection], receivers: list[Connection]
+) -> list[Migrants]:
+    """Send `migrants` to the targets and receive the migrants of the sources.
+
+    A send blocks once the pipe buffer is full until the target receives, and
+    every island sends before it receives, so the sends run in a thread while
+    the island drains its receivers.
+    """
+    errors: list[BaseException] = []
+
+    def send() -> None:
+        try:
+            for sender in senders:
+                sender.send(migrants)
+        except BaseException as error:
+            errors.append(error)
+
+    sending = threading.Thread(target=send, daemon=True)
+    sending.start()
+    received = [receiver.recv() for receiver in receivers]
+    sending.join()
+    if errors:
+        raise errors[0]
+    return received
+
+
+def _advance(swarm: Swarm, parameters: AlgorithmParameters, iterations: int) -> None:
+    """Run the next `iterations` of the island, unless it has stopped early."""
+    if swarm.run_state is None:
+        swarm.run_optimization(
+            iterations=iterations,
+            initial_inertia=parameters.initial_inertia,
+            cognitive_constant=parameters.cognitive_constant,
+            social_constant=parameters.social_constant,
+        )
+    elif swarm.logger.stop_reason is None:
+        swarm.continue_optimization(iterations)
+
+
+def _immigrate(swarm: Swarm, migrants: list[Migrants]) -> None:
+    if not migrants:
+        return
+    positions = np.concatenate([positions for positions, _ in migrants])
+    costs = np.concatenate([costs for _, costs in migrants])
+    swarm.immigrate(positions, costs)
+
+
+def _island_result(swarm: Swarm, parameters: AlgorithmParameters) -> OptimizationResult:
+    swarm.logger.close()
+    return OptimizationResult(
+        logger=swarm.logger,
+        algorithm_parameters=parameters,
+        best_position=swarm.global_best_position,
+        best_cost=swarm.global_best_cost,
+        evaluations=swarm.evaluations,
+    )
+
+
+def _chunks(iterations: int, interval: int) -> list[int]:
+    """Split the iterations into epochs of `interval` iterations, the last one shorter."""
+    chunks = [interval] * (iterations // interval)
+    if iterations % interval:
+        chunks.append(iterations % interval)
+    return chunks or [0]
+
+
+def _pad(values: list[float], length: int) -> np.ndarray:
+    padded = np.empty(length)
+    padded[: len(values)] = values
+    padded[len(values) :] = values[-1]
+    return padded
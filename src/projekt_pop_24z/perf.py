@@ -0,0 +1,572 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark import (
+    SWARM_ENGINES,
+    AlgorithmParameters,
+    Engine,
+    derive_run_seeds,
+    run_batched_benchmark,
+    run_single_benchmark,
+)
+from src.projekt_pop_24z.benchmark_functions.slow import (
+    AsyncSlowFunction,
+    SlowFunction,
+)
+from src.projekt_pop_24z.swarm.evaluators import (
+    AsyncioEvaluator,
+    Evaluator,
+    ProcessPoolEvaluator,
+    SerialEvaluator,
+    ThreadPoolEvaluator,
+)
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.sweep import FUNCTIONS_BY_NAME
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters
+
+
+# "batch" evaluates through the batch cost function, without an evaluator
+EVALUATORS: dict[str, Callable[[], Evaluator | None]] = {
+    "batch": lambda: None,
+    "serial": SerialEvaluator,
+    "threads": ThreadPoolEvaluator,
+    "processes": ProcessPoolEvaluator,
+    "asyncio": AsyncioEvaluator,
+}
+
+DEFAULT_THRESHOLD = 0.1
+
+# Seconds every evaluation of the slow-objective cases sleeps, long enough
+# that the evaluators are measured by how well they overlap evaluations
+# rather than by the overhead of their pools
+DEFAULT_DELAY = 0.002
+
+# Seconds a fresh interpreter may take to import each module, numpy included
+IMPORT_BUDGETS: dict[str, float] = {
+    "src.projekt_pop_24z.swarm.pso": 0.5,
+    "src.projekt_pop_24z.cli": 1.0,
+}
+
+# Modules only the plotting and reporting code needs, never imported by a run
+DEFERRED_IMPORTS = ("matplotlib", "tabulate", "asyncio", "concurrent.futures.process")
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class PerfCase:
+    """One configuration of the performance benchmark.
+
+    `runs` independent runs are timed together: the `BATCHED` engine advances
+    them at once, the other engines one after another. With a `delay` the
+    objective is wrapped in a `SlowFunction` sleeping that many seconds per
+    evaluation, and evaluated through the scalar function only.
+    """
+
+    function_name: str
+    engine: str
+    evaluator: str
+    swarm_size: int
+    dimensions: int
+    iterations: int
+    runs: int = 1
+    delay: float = 0.0
+
+    def key(self) -> str:
+        """Identifier used to match the case against a baseline."""
+        values = [str(value) for value in asdict(self).values()][:6]
+        # Left out at their defaults, so the keys of older baselines still match
+        if self.runs != 1:
+            values.append(f"runs={self.runs}")
+        if self.delay:
+            values.append(f"delay={self.delay}")
+        return "/".join(values)
+
+
+@dataclass
+class PerfMeasurement:
+    """Timing of a case, the fastest of `repeats` runs."""
+
+    case: PerfCase
+    repeats: int
+    seconds: float
+    evaluations: int
+    particle_updates: int
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.seconds
+
+    @property
+    def particle_updates_per_second(self) -> float:
+        return self.particle_updates / self.seconds
+
+    def to_json(self) -> dict:
+        return {
+            "key": self.case.key(),
+            **asdict(self),
+            "evaluations_per_second": self.evaluations_per_second,
+            "particle_updates_per_second": self.particle_updates_per_second,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> PerfMeasurement:
+        return cls(
+            case=PerfCase(**data["case"]),
+            repeats=data["repeats"],
+            seconds=data["seconds"],
+            evaluations=data["evaluations"],
+            particle_updates=data["particle_updates"],
+        )
+
+
+@dataclass
+class Comparison:
+    """Throughput of a case relative to its baseline."""
+
+    key: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    @property
+    def regression(self) -> bool:
+        return self.ratio < 1 - self.threshold
+
+
+def make_cases(
+    function_names: Iterable[str],
+    engines: Iterable[Engine],
+    evaluators: Iterable[str],
+    swarm_sizes: Iterable[int],
+    dimensions: Iterable[int],
+    iterations: Iterable[int],
+    runs: Iterable[int] = (1,),
+) -> list[PerfCase]:
+    """Cartesian product of the configurations.
+
+    Engines that do not take an evaluator (`BATCHED`) only run with "batch".
+    """
+    return [
+        PerfCase(function_name, engine.name, evaluator, *sizes)
+        for function_name, engine, evaluator, *sizes in itertools.product(
+            function_names,
+            engines,
+            evaluators,
+            swarm_sizes,
+            dimensions,
+            iterations,
+            runs,
+        )
+        if engine in SWARM_ENGINES or evaluator == "batch"
+    ]
+
+
+def make_slow_cases(
+    function_name: str,
+    engines: Iterable[Engine],
+    evaluators: Iterable[str],
+    swarm_size: int,
+    dimensions: int,
+    iterations: int,
+    delay: float = DEFAULT_DELAY,
+) -> list[PerfCase]:
+    """Cases with a slow objective, one per engine taking an evaluator and evaluator.
+
+    On these the evaluators are compared by their throughput, see `PerfCase`.
+    """
+    return [
+        PerfCase(
+            function_name,
+            engine.name,
+            evaluator,
+            swarm_size,
+            dimensions,
+            iterations,
+            delay=delay,
+        )
+        for engine, evaluator in itertools.product(engines, evaluators)
+        if engine in SWARM_ENGINES
+    ]
+
+
+def measure(case: PerfCase, repeats: int = 3, seed: int = 0) -> PerfMeasurement:
+    """Time the runs of a case, `run_batched_benchmark` for the BATCHED engine.
+
+    Every repeat runs with the same seeds, so it does the same work. The
+    fastest repeat is kept, which also leaves out the start-up of worker pools.
+
+    Args:
+        case (PerfCase): The configuration.
+        repeats (int): Number of timed runs.
+        seed (int): Seed of the runs.
+
+    Returns:
+        PerfMeasurement: The measurement.
+    """
+    function = FUNCTIONS_BY_NAME[case.function_name]
+    cost_function, batch_cost_function = function.function, function.batch_function
+    if case.delay:
+        slow = AsyncSlowFunction if case.evaluator == "asyncio" else SlowFunction
+        cost_function, batch_cost_function = slow(function.function, case.delay), None
+    evaluator = EVALUATORS[case.evaluator]()
+    parameters = AlgorithmParameters(
+        swarm_size=case.swarm_size,
+        bounds=[[-5.0, 5.0]] * case.dimensions,
+        dimensions=case.dimensions,
+        task=Task.MINIMIZE,
+        iterations=case.iterations,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+        engine=Engine[case.engine],
+        evaluator=evaluator,
+    )
+    log_params = LogParameters(name=function.name, history_mode=HistoryMode.NONE)
+    seeds = derive_run_seeds(seed, case.runs)
+
+    timings = []
+    try:
+        for _ in range(repeats):
+            started_at = time.perf_counter()
+            if parameters.engine is Engine.BATCHED:
+                results = run_batched_benchmark(
+                    cost_function, parameters, log_params, batch_cost_function, seeds
+                )
+            else:
+                results = [
+                    run_single_benchmark(
+                        cost_function,
+                        parameters,
+                        log_params,
+                        batch_cost_function,
+                        run_seed,
+                    )[0]
+                    for run_seed in seeds
+                ]
+            timings.append(time.perf_counter() - started_at)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+
+    return PerfMeasurement(
+        case=case,
+        repeats=repeats,
+        seconds=min(timings),
+        evaluations=sum(result.evaluations for result in results),
+        particle_updates=case.swarm_size * case.iterations * case.runs,
+    )
+
+
+def run_suite(
+    cases: Sequence[PerfCase], repeats: int = 3, seed: int = 0
+) -> list[PerfMeasurement]:
+    """Measure the cases one after another, so they do not compete for cores."""
+    return [measure(case, repeats, seed) for case in cases]
+
+
+def measure_import(module: str, repeats: int = 3) -> tuple[float, list[str]]:
+    """Time importing `module` in fresh interpreters.
+
+    Args:
+        module (str): Dotted name of the module.
+        repeats (int): Number of interpreters started, the fastest counts.
+
+    Returns:
+        tuple[float, list[str]]: Seconds the import took and the
+            `DEFERRED_IMPORTS` it loaded.
+    """
+    script = (
+        "import json, sys, time\n"
+        "started_at = time.perf_counter()\n"
+        f"import {module}\n"
+        "seconds = time.perf_counter() - started_at\n"
+        f"loaded = [m for m in {DEFERRED_IMPORTS!r} if m in sys.modules]\n"
+        "print(json.dumps([seconds, loaded]))\n"
+    )
+    timings = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPOSITORY_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        seconds, loaded = json.loads(output)
+        timings.append(seconds)
+    return min(timings), loaded
+
+
+def write_results(path: Path, measurements: Iterable[PerfMeasurement]) -> None:
+    """Write the measurements with a description of the machine as JSON."""
+    payload = {
+        "metadata": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "results": [measurement.to_json() for measurement in measurements],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2))
+
+
+def load_results(path: Path) -> dict[str, PerfMeasurement]:
+    """Read measurements written by `write_results`, keyed by case."""
+    payload = json.loads(path.read_text())
+    measurements = map(PerfMeasurement.from_json, payload["results"])
+    return {measurement.case.key(): measurement for measurement in measurements}
+
+
+def compare(
+    baseline: dict[str, PerfMeasurement],
+    current: dict[str, PerfMeasurement],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare the evaluation throughput of the cases present in both runs.
+
+    Args:
+        baseline (dict[str, PerfMeasurement]): Stored measurements.
+        current (dict[str, PerfMeasurement]): New measurements.
+        threshold (float): Relative slowdown that counts as a regression.
+
+    Returns:
+        list[Comparison]: One comparison per common case.
+    """
+    return [
+        Comparison(
+            key=key,
+            baseline=baseline[key].evaluations_per_second,
+            current=current[key].evaluations_per_second,
+            threshold=threshold,
+        )
+        for key in current
+        if key in baseline
+    ]
+
+
+def print_measurements(measurements: Iterable[PerfMeasurement]) -> None:
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            [
+                [
+                    m.case.function_name,
+                    m.case.engine,
+                    m.case.evaluator,
+                    m.case.swarm_size,
+                    m.case.dimensions,
+                    m.case.iterations,
+                    m.case.runs,
+                    m.case.delay,
+                    m.seconds,
+                    m.evaluations_per_second,
+                    m.particle_updates_per_second,
+                ]
+                for m in measurements
+            ],
+            headers=[
+                "Function",
+                "Engine",
+                "Evaluator",
+                "Swarm Size",
+                "Dimensions",
+                "Iterations",
+                "Runs",
+                "Delay",
+                "Seconds",
+                "Evaluations/s",
+                "Particle Updates/s",
+            ],
+            tablefmt="grid",
+            floatfmt=".4g",
+        )
+    )
+
+
+def print_comparisons(comparisons: Iterable[Comparison]) -> None:
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            [
+                [
+                    c.key,
+                    c.baseline,
+                    c.current,
+                    f"{c.ratio:.2f}x",
+                    "REGRESSION" if c.regression else "",
+                ]
+                for c in comparisons
+            ],
+            headers=["Case", "Baseline Evals/s", "Current Evals/s", "Ratio", ""],
+            tablefmt="grid",
+            floatfmt=".4g",
+        )
+    )
+
+
+def check_imports(repeats: int = 3) -> int:
+    """Print the import time of the `IMPORT_BUDGETS` modules.
+
+    Returns:
+        int: Exit code, 1 when a module exceeded its budget or loaded one of
+            the `DEFERRED_IMPORTS`.
+    """
+    from tabulate import tabulate
+
+    rows, failed = [], 0
+    for module, budget in IMPORT_BUDGETS.items():
+        seconds, loaded = measure_import(module, repeats)
+        over_budget = seconds > budget or loaded
+        failed += bool(over_budget)
+        rows.append(
+            [module, seconds, budget, ", ".join(loaded), "OVER" if over_budget else ""]
+        )
+
+    print(
+        tabulate(
+            rows,
+            headers=["Module", "Seconds", "Budget", "Deferred Imports Loaded", ""],
+            tablefmt="grid",
+            floatfmt=".3f",
+        )
+    )
+    return 1 if failed else 0
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the PSO engines and evaluators."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmark suite.")
+    run.add_argument(
+        "--functions",
+        nargs="+",
+        default=list(FUNCTIONS_BY_NAME),
+        choices=FUNCTIONS_BY_NAME,
+    )
+    run.add_argument(
+        "--engines",
+        nargs="+",
+        default=[e.name for e in Engine],
+        choices=[e.name for e in Engine],
+    )
+    run.add_argument(
+        "--evaluators", nargs="+", default=list(EVALUATORS), choices=EVALUATORS
+    )
+    run.add_argument("--swarm-size", nargs="+", type=int, default=[10, 50])
+    run.add_argument("--dimensions", nargs="+", type=int, default=[2, 10])
+    run.add_argument("--iterations", nargs="+", type=int, default=[25, 100])
+    run.add_argument(
+        "--runs",
+        nargs="+",
+        type=int,
+        default=[1, 16],
+        help="Independent runs timed together, the BATCHED engine advances them at once.",
+    )
+    run.add_argument(
+        "--delay",
+        type=float,
+        default=DEFAULT_DELAY,
+        help="Seconds every evaluation of the slow-objective cases sleeps, "
+        "0 to leave them out. They run the first function and the smallest sizes.",
+    )
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--seed", type=int, default=2024)
+    run.add_argument("--output", type=Path, help="Write the results as JSON.")
+    run.add_argument(
+        "--baseline", type=Path, help="Compare the results against a stored run."
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="Compare two stored runs.")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    imports = commands.add_parser(
+        "imports", help="Check the import time of the modules against their budgets."
+    )
+    imports.add_argument("--repeats", type=int, default=3)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Returns:
+        int: Exit code, 1 when a regression was found.
+    """
+    args = parse_args(argv)
+
+    if args.command == "imports":
+        return check_imports(args.repeats)
+
+    if args.command == "run":
+        cases = make_cases(
+            args.functions,
+            [Engine[name] for name in args.engines],
+            args.evaluators,
+            args.swarm_size,
+            args.dimensions,
+            args.iterations,
+            args.runs,
+        )
+        if args.delay > 0:
+            cases += make_slow_cases(
+                args.functions[0],
+                [Engine[name] for name in args.engines],
+                args.evaluators,
+                min(args.swarm_size),
+                min(args.dimensions),
+                min(args.iterations),
+                args.delay,
+            )
+        measurements = run_suite(cases, repeats=args.repeats, seed=args.seed)
+        print_measurements(measurements)
+        if args.output is not None:
+            write_results(args.output, measurements)
+        if args.baseline is None:
+            return 0
+        baseline = load_results(args.baseline)
+        current = {m.case.key(): m for m in measurements}
+    else:
+        baseline = load_results(args.baseline)
+        current = load_results(args.current)
+
+    comparisons = compare(baseline, current, args.threshold)
+    print_comparisons(comparisons)
+
+    regressions = [c for c in comparisons if c.regression]
+    if regressions:
+        print(f"{len(regressions)} of {len(comparisons)} cases regressed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from src.projekt_pop_24z.swarm.evaluators import Evaluator, SerialEvaluator
+from src.projekt_pop_24z.swarm.pso import Coordinates, Swarm
+from src.projekt_pop_24z.utils.profiling import Phase
+
+
+@dataclass
+class AsynchronousSwarm(Swarm):
+    """Steady-state PSO that does not wait for the slowest evaluation.
+
+    Every particle is moved and resubmitted to the `evaluator` as soon as its
+    own evaluation returns, using the global best known at that moment, and
+    the global best is updated after every single evaluation. One iteration
+    corresponds to `swarm_size` finished evaluations, so the convergence curves
+    of the logger are comparable with the synchronous `Swarm`.
+
+    With a pool evaluator the workers never sit idle waiting for the rest of
+    the swarm; without an evaluator the particles are evaluated one by one.
+    """
+
+    _in_flight: dict[Future, int] = field(init=False, default_factory=dict, repr=False)
+    # Futures answered from the cache, which do not count as evaluations
+    _cached: set[Future] = field(init=False, default_factory=set, repr=False)
+    # Particles in flight when the checkpoint was saved, in submission order,
+    # with their cost if it came from the cache; resubmitted by `_iterate`
+    _restored: list[tuple[int, float | None]] = field(
+        init=False, default_factory=list, repr=False
+    )
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.screening is not None:
+            raise ValueError(
+                "Particles are evaluated one at a time, there is nothing to screen."
+            )
+
+    def _continue_optimization(self) -> Coordinates:
+        try:
+            return super()._continue_optimization()
+        finally:
+            # Only left over when the run failed, see `_end_run`
+            for future in self._in_flight:
+                future.cancel()
+            self._in_flight.clear()
+            self._cached.clear()
+
+    def _end_run(self) -> None:
+        """Settle the evaluations submitted for an iteration that will not run.
+
+        They are left over when a stopping criterion ends the run early.
+        Evaluations that have not started are cancelled; the others have used
+        the cost function, serial ones already in the submit call, so they are
+        waited for and counted in `evaluations`, keeping an `EvaluationBudget`
+        exact. Their costs are cached but not recorded, the run has ended.
+        """
+        in_flight = [
+            future
+            for future in self._in_flight
+            if future in self._cached or not future.cancel()
+        ]
+        with self.timer.phase(Phase.EVALUATION):
+            wait(in_flight)
+        for future in in_flight:
+            if future in self._cached or future.exception() is not None:
+                continue
+            self.evaluations += 1
+            self.timer.add_evaluations(1)
+            if self.cache is not None:
+                position = self.particles[self._in_flight[future]].position
+                self.cache.put(position, float(future.result()))
+        self._in_flight.clear()
+        self._cached.clear()
+
+    def save_checkpoint(self, path: Path | str) -> None:
+        # Futures cannot be saved, particles in flight are resubmitted on resume
+        # from the positions they were submitted with, without moving them again
+        in_flight, cached, restored = self._in_flight, self._cached, self._restored
+        self._in_flight, self._cached = {}, set()
+        self._restored = restored + [
+            (index, future.result() if future in cached else None)
+            for future, index in in_flight.items()
+        ]
+        try:
+            super().save_checkpoint(path)
+        finally:
+            self._in_flight = in_flight
+            self._cached = cached
+            self._restored = restored
+
+    def _iterate(
+        self, inertia: float, cognitive_constant: float, social_constant: float
+    ) -> None:
+        """Process `swarm_size` finished evaluations, resubmitting each particle."""
+        evaluator = self.evaluator or SerialEvaluator()
+        last_iteration = self.current_iteration + 1 >= self.run_state.final_iteration
+
+        # Counts the particles improved by this iteration's evaluations
+        self.statistics.improved = 0
+        for index, cost in self._restored:
+            self._submit(evaluator, index, cost)
+        self._restored = []
+        busy = set(self._in_flight.values())
+        for index in range(self.swarm_size):
+            if index not in busy:
+                self._move_and_submit(
+                    evaluator, index, inertia, cognitive_constant, social_constant
+                )
+
+        finished = 0
+        while finished < self.swarm_size:
+            with self.timer.phase(Phase.EVALUATION):
+                done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            # In submission order, so runs with a serial evaluator are reproducible
+            for future in [f for f in self._in_flight if f in done]:
+                if finished == self.swarm_size:
+                    # The rest counts towards the next iteration
+                    break
+                index = self._in_flight.pop(future)
+                cost = float(future.result())
+                if future in self._cached:
+                    self._cached.discard(future)
+                else:
+                    self.evaluations += 1
+                    self.timer.add_evaluations(1)
+                    if self.cache is not None:
+                        # The particle does not move until its cost is recorded
+                        self.cache.put(self.particles[index].position, cost)
+                if self.constraints is not None:
+                    position = self.particles[index].position[None]
+                    cost = float(self._apply_constraints(position, np.array([cost]))[0])
+                finished += 1
+                with self.timer.phase(Phase.BEST_UPDATE):
+                    self._record_cost(index, cost)
+
+                if not last_iteration:
+                    self._move_and_submit(
+                        evaluator, index, inertia, cognitive_constant, social_constant
+                    )
+
+    def _move_and_submit(
+        self,
+        evaluator: Evaluator,
+        index: int,
+        inertia: float,
+        cognitive_constant: float,
+        social_constant: float,
+    ) -> None:
+        """Move one particle towards the current (neighbourhood) best and submit its evaluation."""
+        particle = self.particles[index]
+        cognitive_random, social_random = self.rng.random((2, self.dimensions))
+
+        with self.timer.phase(Phase.VELOCITY):
+            particle.update_velocity(
+                global_best_position=self._social_attractor(index),
+                inertia_coefficient=inertia,
+                cognitive_constant=cognitive_constant,
+                social_constant=social_constant,
+                cognitive_random=cognitive_random,
+                social_random=social_random,
+            )
+        with self.timer.phase(Phase.POSITION):
+            if self._tracks_diversity:
+                old_position = particle.position.copy()
+                self._update_particle_position(particle)
+                self.statistics.move(old_position, particle.position)
+            else:
+                self._update_particle_position(particle)
+
+        cost = self.cache.get(particle.position) if self.cache is not None else None
+        self._submit(evaluator, index, cost)
+
+    def _submit(self, evaluator: Evaluator, index: int, cost: float | None) -> None:
+        """Submit the evaluation of a particle's position, unless its `cost` is known."""
+        if cost is not None:
+            future = Future()
+            future.set_result(cost)
+            self._cached.add(future)
+        else:
+            # Evaluators without a pool evaluate right away, in the submit call
+            with self.timer.phase(Phase.EVALUATION):
+                future = evaluator.submit(
+                    self.cost_function, self.particles[index].position.tolist()
+                )
+        self._in_flight[future] = index
+
+    def _record_cost(self, index: int, cost: float) -> None:
+        """Update the personal and the global best with a finished evaluation."""
+        particle = self.particles[index]
+        if not self.is_better(cost, particle.personal_best_cost):
+            return
+
+        self.statistics.improved += 1
+        particle.personal_best_position = particle.position
+        particle.personal_best_cost = cost
+        if self._neighbourhoods is not None:
+            self._neighbourhoods.improve(index, cost)
+
+        if self.is_better(cost, self.global_best_cost):
+            self.global_best_position = particle.position.tolist()
+            self.global_best_cost = cost
@@ -0,0 +1,213 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
+import math
+import time
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    ScalarBatchAdapter,
+)
+from src.projekt_pop_24z.swarm.pso import Bounds, Coordinates, RandomState, Task
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+
+
+@dataclass
+class BatchedSwarms:
+    """Many independent swarms advanced in lockstep as `(runs, swarm_size, dimensions)` arrays.
+
+    Meant for repeating a small problem many times, where the per-call
+    overhead of running the swarms one by one dominates: every iteration
+    moves all swarms at once and evaluates all their particles with a single
+    batch cost function call.
+
+    Every swarm draws from its own generator in the same order as
+    `VectorizedSwarm`, so swarm `r` ends exactly where a `VectorizedSwarm`
+    seeded with `seeds[r]` would, and logs into its own logger.
+
+    Args:
+        swarm_size (int): Number of particles of every swarm.
+        bounds (Bounds): Bounds of every dimension.
+        dimensions (int): Number of dimensions.
+        task (Task): Whether to minimize or maximize.
+        cost_function (Callable[[Coordinates], float]): Scalar cost function.
+        loggers (list[SwarmLogger]): One logger per swarm, their number sets
+            the number of swarms.
+        dynamic_inertia (bool): Whether the inertia decays over the iterations.
+        inertia_decay (float): Strength of the decay, see `Swarm.update_inertia`.
+        batch_cost_function (BatchFunction | None): Vectorised cost function.
+        seeds (Sequence[RandomState] | None): One seed per swarm, fresh entropy if None.
+    """
+
+    swarm_size: int
+    bounds: Bounds
+    dimensions: int
+    task: Task
+    cost_function: Callable[[Coordinates], float]
+    loggers: list[SwarmLogger]
+    dynamic_inertia: bool = False
+    inertia_decay: float = 0
+    batch_cost_function: BatchFunction | None = None
+    seeds: Sequence[RandomState] | None = None
+    positions: np.ndarray = field(init=False, repr=False)
+    velocities: np.ndarray = field(init=False, repr=False)
+    personal_best_positions: np.ndarray = field(init=False, repr=False)
+    personal_best_costs: np.ndarray = field(init=False, repr=False)
+    global_best_positions: np.ndarray = field(init=False, repr=False)
+    global_best_costs: np.ndarray = field(init=False, repr=False)
+    current_iteration: int = field(init=False, default=0)
+    evaluations: int = field(init=False, default=0)
+
+    def __post_init__(self):
+
+        if not (1.0001 <= self.inertia_decay <= 1.005) and self.dynamic_inertia:
+            raise ValueError("Inertia decay should be in the range [1.0001, 1.005].")
+
+        seeds = self.seeds if self.seeds is not None else [None] * self.runs
+        if len(seeds) != self.runs:
+            raise ValueError(f"Expected {self.runs} seeds, got {len(seeds)}.")
+
+        self._batch_cost_function = self.batch_cost_function or ScalarBatchAdapter(
+            self.cost_function
+        )
+        self._generators = [np.random.default_rng(seed) for seed in seeds]
+
+        bounds = np.asarray(self.bounds, dtype=np.float64)
+        self._lower_bounds = bounds[:, 0]
+        self._upper_bounds = bounds[:, 1]
+        self._initialized = False
+
+    @property
+    def runs(self) -> int:
+        return len(self.loggers)
+
+    def init_swarms(self) -> None:
+        shape = (self.swarm_size, self.dimensions)
+        half_span = np.abs(self._upper_bounds - self._lower_bounds) / 2
+
+        self.positions = np.stack(
+            [
+                rng.uniform(self._lower_bounds, self._upper_bounds, size=shape)
+                for rng in self._generators
+            ]
+        )
+        self.velocities = np.stack(
+            [rng.uniform(-half_span, half_span, size=shape) for rng in self._generators]
+        )
+        self.personal_best_positions = self.positions.copy()
+        self.personal_best_costs = self._evaluate(self.positions)
+        self._update_global_bests()
+        self._initialized = True
+
+    def run_optimization(
+        self,
+        iterations: int,
+        initial_inertia: float,
+        cognitive_constant: float,
+        social_constant: float,
+    ) -> np.ndarray:
+        """Run all swarms for a specified number of iterations.
+
+        Args:
+            iterations (int): Number of iterations to run.
+            initial_inertia (float): Starting inertia value (w).
+            cognitive_constant (float): c1 (cognitive acceleration).
+            social_constant (float): c2 (social acceleration).
+
+        Returns:
+            np.ndarray: The best solution of every swarm, shaped `(runs, dimensions)`.
+        """
+        started_at = time.perf_counter()
+        evaluations_before = self.evaluations
+
+        w = initial_inertia
+        for logger in self.loggers:
+            logger.add_inertia(w)
+
+        if not self._initialized:
+            self.init_swarms()
+
+        for run, logger in enumerate(self.loggers):
+            logger.add_particle_epoch(self.positions[run])
+            logger.log_global_best_cost(float(self.global_best_costs[run]))
+
+        final_iteration = self.current_iteration + iterations
+        while self.current_iteration < final_iteration:
+
+            if self.dynamic_inertia:
+                w = w * math.pow(self.inertia_decay, -self.current_iteration)
+
+            self._iterate(w, cognitive_constant, social_constant)
+
+            for run, logger in enumerate(self.loggers):
+                logger.log_global_best_cost(float(self.global_best_costs[run]))
+                logger.add_inertia(w)
+                logger.add_particle_epoch(self.positions[run])
+                logger.increment_iterations()
+                logger.check_epsilon()
+
+            self.current_iteration += 1
+
+        # Every swarm is credited with an equal share of the wall-clock time
+        seconds = (time.perf_counter() - started_at) / self.runs
+        for logger in self.loggers:
+            logger.log_throughput(
+                (self.evaluations - evaluations_before) // self.runs, seconds
+            )
+
+        return self.global_best_positions
+
+    def _iterate(
+        self, inertia: float, cognitive_constant: float, social_constant: float
+    ) -> None:
+        shape = (self.swarm_size, self.dimensions)
+        r1 = np.empty_like(self.positions)
+        r2 = np.empty_like(self.positions)
+        for run, rng in enumerate(self._generators):
+            r1[run] = rng.random(shape)
+            r2[run] = rng.random(shape)
+
+        self.velocities = (
+            inertia * self.velocities
+            + cognitive_constant * r1 * (self.personal_best_positions - self.positions)
+            + social_constant
+            * r2
+            * (self.global_best_positions[:, None, :] - self.positions)
+        )
+
+        self.positions += self.velocities
+        np.clip(
+            self.positions,
+            self._lower_bounds,
+            self._upper_bounds,
+            out=self.positions,
+        )
+
+        current_costs = self._evaluate(self.positions)
+
+        improved = (
+            current_costs > self.personal_best_costs
+            if self.task is Task.MAXIMIZE
+            else current_costs < self.personal_best_costs
+        )
+        self.personal_best_positions[improved] = self.positions[improved]
+        self.personal_best_costs[improved] = current_costs[improved]
+
+        self._update_global_bests()
+
+    def _evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate the particles of all swarms with one batch cost function call."""
+        flat = positions.reshape(-1, self.dimensions)
+        self.evaluations += len(flat)
+        costs = np.asarray(self._batch_cost_function(flat), dtype=np.float64)
+        return costs.reshape(positions.shape[:2])
+
+    def _update_global_bests(self) -> None:
+        pick = np.argmax if self.task is Task.MAXIMIZE else np.argmin
+        best = pick(self.personal_best_costs, axis=1)
+        runs = np.arange(self.runs)
+
+        self.global_best_positions = self.personal_best_positions[runs, best]
+        self.global_best_costs = self.personal_best_costs[runs, best]
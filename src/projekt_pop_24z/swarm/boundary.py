@@ -0,0 +1,130 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class BoundaryStrategy(ABC):
+    """Rule bringing particles that left the search space back into `bounds`.
+
+    Strategies work on the whole swarm at once, on `(swarm_size, dimensions)`
+    arrays, or on a single particle's `(dimensions,)` rows. Coordinates
+    within the bounds are never changed.
+    """
+
+    @abstractmethod
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        """Move the coordinates outside `[lower, upper]` back inside, in place.
+
+        Args:
+            positions (np.ndarray): Positions after the move.
+            velocities (np.ndarray): Velocities of the move, shaped like `positions`.
+            lower (np.ndarray): Lower bound of every dimension.
+            upper (np.ndarray): Upper bound of every dimension.
+            rng (np.random.Generator): Source of randomness for random strategies.
+        """
+
+
+@dataclass
+class Clamp(BoundaryStrategy):
+    """Put the coordinates outside the bounds on the nearest wall."""
+
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        np.clip(positions, lower, upper, out=positions)
+
+
+@dataclass
+class Absorb(BoundaryStrategy):
+    """Clamp onto the wall and stop the particle in the dimensions it left."""
+
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        outside = (positions < lower) | (positions > upper)
+        np.clip(positions, lower, upper, out=positions)
+        velocities[outside] = 0
+
+
+@dataclass
+class Reflect(BoundaryStrategy):
+    """Mirror the coordinates at the wall they crossed and reverse their velocity.
+
+    A step longer than the width of the search space is mirrored back and
+    forth between the walls until it lands inside.
+    """
+
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        outside = (positions < lower) | (positions > upper)
+        span = upper - lower
+        folded = np.mod(positions - lower, 2 * span)
+        reflected = lower + np.where(folded > span, 2 * span - folded, folded)
+        # Rounding can land a hair outside the walls
+        np.clip(reflected, lower, upper, out=reflected)
+        np.copyto(positions, reflected, where=outside)
+        np.negative(velocities, out=velocities, where=outside)
+
+
+@dataclass
+class RandomReinit(BoundaryStrategy):
+    """Draw the coordinates outside the bounds uniformly anew."""
+
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        outside = (positions < lower) | (positions > upper)
+        if outside.any():
+            positions[outside] = rng.uniform(
+                np.broadcast_to(lower, positions.shape)[outside],
+                np.broadcast_to(upper, positions.shape)[outside],
+            )
+
+
+@dataclass
+class Periodic(BoundaryStrategy):
+    """Wrap the search space into a torus, a particle leaving on one side
+    enters on the opposite one."""
+
+    def apply(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        rng: np.random.Generator,
+    ) -> None:
+        outside = (positions < lower) | (positions > upper)
+        wrapped = lower + np.mod(positions - lower, upper - lower)
+        np.clip(wrapped, lower, upper, out=wrapped)
+        np.copyto(positions, wrapped, where=outside)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+
+
+@dataclass
+class EvaluationCache:
+    """Bounded LRU cache of costs, keyed by quantised coordinates.
+
+    Positions that round to the same multiple of `tolerance` in every
+    dimension share an entry, so near-duplicates, e.g. particles clamped onto
+    the same bound or collapsed onto the same point, are evaluated once. The
+    cached cost is the cost of the first of them that was evaluated. With a
+    `tolerance` of 0 only exactly equal positions share an entry.
+
+    Args:
+        tolerance (float): Grid spacing of the quantisation.
+        max_size (int): Number of entries kept, the least recently used are
+            evicted first.
+    """
+
+    tolerance: float = 1e-9
+    max_size: int = 100_000
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    _entries: OrderedDict[bytes, float] = field(
+        init=False, default_factory=OrderedDict, repr=False
+    )
+
+    def __post_init__(self):
+        if self.tolerance < 0:
+            raise ValueError("Tolerance should not be negative.")
+        if self.max_size < 1:
+            raise ValueError("Cache size should be a positive integer.")
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self, positions: np.ndarray) -> list[bytes]:
+        """Cache keys of the rows of `positions`."""
+        positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+        if self.tolerance:
+            positions = np.round(positions / self.tolerance).astype(np.int64)
+        return [row.tobytes() for row in positions]
+
+    def get(self, position: np.ndarray) -> float | None:
+        """Cached cost of a single position, None (and a miss) if not cached."""
+        [key] = self.keys(position)
+        cost = self._entries.get(key)
+        if cost is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return cost
+
+    def put(self, position: np.ndarray, cost: float) -> None:
+        [key] = self.keys(position)
+        self._store(key, cost)
+
+    def evaluate(
+        self,
+        positions: np.ndarray,
+        evaluate: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """Costs of `positions`, calling `evaluate` only for the ones not cached.
+
+        Near-duplicates within `positions` are evaluated once as well.
+
+        Args:
+            positions (np.ndarray): Positions shaped `(n, dimensions)`.
+            evaluate (Callable[[np.ndarray], np.ndarray]): Evaluates a batch of
+                positions with the real cost function.
+
+        Returns:
+            np.ndarray: The costs, shaped `(n,)`.
+        """
+        costs = np.empty(len(positions))
+        missing: dict[bytes, list[int]] = {}
+
+        for index, key in enumerate(self.keys(positions)):
+            cost = self._entries.get(key)
+            if cost is not None:
+                self._entries.move_to_end(key)
+                costs[index] = cost
+            else:
+                missing.setdefault(key, []).append(index)
+
+        self.misses += len(missing)
+        self.hits += len(positions) - len(missing)
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            new_costs = np.asarray(evaluate(positions[first]), dtype=np.float64)
+            for (key, indices), cost in zip(missing.items(), new_costs.tolist()):
+                costs[indices] = cost
+                self._store(key, cost)
+        return costs
+
+    def _store(self, key: bytes, cost: float) -> None:
+        self._entries[key] = cost
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
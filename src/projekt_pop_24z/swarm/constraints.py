@@ -0,0 +1,82 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import enum
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark_functions.base import BatchFunction
+
+
+class ConstraintHandling(enum.Enum):
+    PENALTY = enum.auto()
+    FEASIBILITY_RULES = enum.auto()
+
+
+@dataclass
+class Constraints:
+    """Inequality constraints `g(x) <= 0` of the problem and how they are handled.
+
+    With `PENALTY` the total violation, scaled by `penalty`, is added to the
+    cost. With `FEASIBILITY_RULES` (Deb, 2000) a feasible position beats
+    every infeasible one, two feasible positions compare by cost and two
+    infeasible ones by their violation. The swarms compare plain costs, so
+    an infeasible position gets the cost `F + violation`, where `F` is the
+    worst feasible cost found so far; `rank` returns these costs.
+
+    Args:
+        inequalities (list[BatchFunction]): Constraint functions, each mapping
+            positions shaped `(n, dimensions)` to `n` values that should not
+            be positive.
+        handling (ConstraintHandling): How violations are folded into the cost.
+        penalty (float): Cost of a unit of violation, used by `PENALTY`.
+        tolerance (float): Violations up to `tolerance` count as feasible.
+    """
+
+    inequalities: list[BatchFunction]
+    handling: ConstraintHandling = ConstraintHandling.FEASIBILITY_RULES
+    penalty: float = 1e6
+    tolerance: float = 0.0
+
+    def __post_init__(self):
+        if self.penalty < 0:
+            raise ValueError("Penalty should not be negative.")
+        if self.tolerance < 0:
+            raise ValueError("Tolerance should not be negative.")
+
+    def violations(self, positions: np.ndarray) -> np.ndarray:
+        """Total violation of every row of `positions`, 0 for the feasible ones."""
+        total = np.zeros(len(positions))
+        for inequality in self.inequalities:
+            values = np.asarray(inequality(positions), dtype=np.float64)
+            total += np.maximum(values - self.tolerance, 0)
+        return total
+
+    def penalize(self, costs: np.ndarray, violations: np.ndarray) -> np.ndarray:
+        """Costs of minimisation with the scaled violations added."""
+        return costs + self.penalty * violations
+
+    def rank(
+        self,
+        costs: np.ndarray,
+        violations: np.ndarray,
+        worst_feasible: float | None,
+    ) -> tuple[np.ndarray, float | None]:
+        """Costs of minimisation that order the positions by the feasibility rules.
+
+        Args:
+            costs (np.ndarray): Costs of the positions, lower is better.
+            violations (np.ndarray): Their `violations`.
+            worst_feasible (float | None): Worst feasible cost found so far,
+                None if no feasible position was found yet.
+
+        Returns:
+            tuple[np.ndarray, float | None]: The costs, and the worst feasible
+                cost including these positions.
+        """
+        feasible = violations == 0
+        if feasible.any():
+            worst = float(costs[feasible].max())
+            if worst_feasible is None or worst > worst_feasible:
+                worst_feasible = worst
+        offset = worst_feasible if worst_feasible is not None else 0.0
+        return np.where(feasible, costs, offset + violations), worst_feasible
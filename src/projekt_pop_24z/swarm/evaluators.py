@@ -0,0 +1,207 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+import inspect
+import os
+
+import numpy as np
+
+# The executors and asyncio are imported on first use, importing
+# `concurrent.futures.process` alone takes longer than the rest of the swarm
+if TYPE_CHECKING:
+    import asyncio
+
+
+Coordinates = list[float]
+CostFunction = (
+    Callable[[Coordinates], float] | Callable[[Coordinates], Awaitable[float]]
+)
+
+
+class Evaluator(ABC):
+    """Strategy for evaluating a whole iteration's positions.
+
+    Evaluators own their worker pools, which are created on first use and
+    released by `close` (or by using the evaluator as a context manager).
+    """
+
+    @abstractmethod
+    def evaluate(self, function: CostFunction, positions: np.ndarray) -> np.ndarray:
+        """Evaluate `function` for every row of `positions`.
+
+        Args:
+            function (CostFunction): Scalar cost function.
+            positions (np.ndarray): Positions, shaped `(n, dimensions)`.
+
+        Returns:
+            np.ndarray: The `n` costs, in the order of `positions`.
+        """
+
+    def submit(self, function: CostFunction, position: Coordinates) -> Future:
+        """Start evaluating `function` at a single position.
+
+        Evaluators without a worker pool evaluate the position right away and
+        return a finished future.
+
+        Args:
+            function (CostFunction): Scalar cost function.
+            position (Coordinates): Position to evaluate.
+
+        Returns:
+            Future: Future of the cost.
+        """
+        future = Future()
+        try:
+            cost = self.evaluate(function, np.array([position], dtype=np.float64))
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            future.set_result(float(cost[0]))
+        return future
+
+    def close(self) -> None:
+        """Release the resources of the evaluator."""
+
+    def __enter__(self) -> Evaluator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@dataclass
+class SerialEvaluator(Evaluator):
+    """Evaluate the positions one after another in the calling thread."""
+
+    def evaluate(self, function: CostFunction, positions: np.ndarray) -> np.ndarray:
+        return np.array([function(p) for p in positions.tolist()], dtype=np.float64)
+
+
+@dataclass
+class _PoolEvaluator(Evaluator):
+    max_workers: int | None = None
+    _executor: Executor | None = field(init=False, default=None, repr=False)
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        """Worker pool of the evaluator, created on first use."""
+
+    def _map_kwargs(self, n_positions: int) -> dict[str, Any]:
+        return {}
+
+    def evaluate(self, function: CostFunction, positions: np.ndarray) -> np.ndarray:
+        costs = self._get_executor().map(
+            function, positions.tolist(), **self._map_kwargs(len(positions))
+        )
+        return np.fromiter(costs, dtype=np.float64, count=len(positions))
+
+    def submit(self, function: CostFunction, position: Coordinates) -> Future:
+        return self._get_executor().submit(function, position)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pools cannot be pickled (e.g. into a checkpoint), they are recreated on use
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+
+@dataclass
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """Evaluate the positions concurrently in a thread pool.
+
+    Suited to I/O-bound objectives such as remote calls or subprocesses.
+    """
+
+    def _create_executor(self) -> Executor:
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+@dataclass
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """Evaluate the positions in parallel in a process pool.
+
+    Suited to CPU-bound objectives; the cost function has to be picklable.
+    Positions are sent in chunks to amortise the inter-process overhead.
+    """
+
+    chunksize: int | None = None
+
+    def _create_executor(self) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _map_kwargs(self, n_positions: int) -> dict[str, Any]:
+        workers = self.max_workers or os.cpu_count() or 1
+        return {"chunksize": self.chunksize or max(1, n_positions // (4 * workers))}
+
+
+@dataclass
+class AsyncioEvaluator(Evaluator):
+    """Evaluate the positions concurrently on an asyncio event loop.
+
+    Coroutine cost functions are awaited directly, plain ones run in threads.
+    At most `max_concurrency` evaluations are in flight at once.
+    """
+
+    max_concurrency: int | None = None
+    _loop: asyncio.AbstractEventLoop | None = field(
+        init=False, default=None, repr=False
+    )
+
+    def evaluate(self, function: CostFunction, positions: np.ndarray) -> np.ndarray:
+        import asyncio
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        costs = self._loop.run_until_complete(
+            self._evaluate_all(function, positions.tolist())
+        )
+        return np.array(costs, dtype=np.float64)
+
+    async def _evaluate_all(
+        self, function: CostFunction, positions: list[Coordinates]
+    ) -> list[float]:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(positions) or 1)
+        is_coroutine = is_coroutine_function(function)
+
+        async def evaluate_one(position: Coordinates) -> float:
+            async with semaphore:
+                if is_coroutine:
+                    return await function(position)
+                return await asyncio.to_thread(function, position)
+
+        return await asyncio.gather(*(evaluate_one(p) for p in positions))
+
+    def close(self) -> None:
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_loop"] = None
+        return state
+
+
+def is_coroutine_function(function: Callable[..., Any]) -> bool:
+    """Check whether `function`, or the `__call__` of a callable object, is async."""
+    return inspect.iscoroutinefunction(function) or inspect.iscoroutinefunction(
+        getattr(function, "__call__", None)
+    )
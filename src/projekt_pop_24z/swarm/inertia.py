@@ -0,0 +1,199 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+
+@dataclass
+class SwarmStatistics:
+    """State of the swarm the feedback strategies adapt the inertia to.
+
+    The swarm keeps the statistics up to date while it moves: the improved
+    particles are counted in the best update, and the positions are summarised
+    by their sum and the sum of their squared norms, from which the distance
+    to the centroid follows without another pass over the swarm. The
+    synchronous swarm moves every particle, so its position update summarises
+    the rows it has just written; the asynchronous swarm updates the sums one
+    moved particle at a time.
+
+    Args:
+        swarm_size (int): Number of particles.
+        dimensions (int): Number of dimensions of the positions.
+    """
+
+    swarm_size: int
+    dimensions: int
+    iteration: int = 0
+    start_iteration: int = 0
+    final_iteration: int = 0
+    improved: int = 0
+    position_sum: np.ndarray = field(default=None, repr=False)
+    squared_norm_sum: float = 0.0
+    _ones: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.position_sum is None:
+            self.position_sum = np.zeros(self.dimensions)
+        self._ones = np.ones(self.swarm_size)
+
+    @property
+    def progress(self) -> float:
+        """Share of the iterations of the current run done once the current
+        iteration is, in [0, 1], so the last iteration runs at 1."""
+        length = self.final_iteration - self.start_iteration
+        if length <= 0:
+            return 0.0
+        done = self.iteration - self.start_iteration + 1
+        return min(max(done / length, 0.0), 1.0)
+
+    @property
+    def improved_fraction(self) -> float:
+        """Share of the particles that improved their personal best in the last iteration."""
+        return self.improved / self.swarm_size
+
+    @property
+    def diversity(self) -> float:
+        """Root mean square distance of the particles to their centroid."""
+        centroid = self.position_sum / self.swarm_size
+        # E|x - c|^2 = E|x|^2 - |c|^2, clipped against rounding errors
+        spread = self.squared_norm_sum / self.swarm_size - float(centroid @ centroid)
+        return math.sqrt(max(spread, 0.0))
+
+    def set_positions(self, positions: np.ndarray) -> None:
+        """Summarise all positions, shaped `(swarm_size, dimensions)`."""
+        # Both reductions go through BLAS, about twice as fast as sum and einsum
+        self.position_sum = self._ones @ positions
+        self.squared_norm_sum = float(np.vdot(positions, positions))
+
+    def move(self, old_position: np.ndarray, new_position: np.ndarray) -> None:
+        """Update the summary after a single particle moved."""
+        self.position_sum += new_position - old_position
+        self.squared_norm_sum += float(
+            new_position @ new_position - old_position @ old_position
+        )
+
+
+class InertiaStrategy(ABC):
+    """Rule choosing the inertia coefficient of every iteration."""
+
+    # Whether the strategy reads `SwarmStatistics.diversity`, which the swarm
+    # then has to track
+    uses_diversity: bool = False
+
+    def start(self, inertia: float, statistics: SwarmStatistics) -> None:
+        """Reset the strategy's state at the start of a run.
+
+        Args:
+            inertia (float): Initial inertia coefficient of the run.
+            statistics (SwarmStatistics): Statistics of the initialised swarm.
+        """
+
+    @abstractmethod
+    def update(self, inertia: float, statistics: SwarmStatistics) -> float:
+        """Inertia coefficient of the next iteration.
+
+        Args:
+            inertia (float): Inertia coefficient of the last iteration.
+            statistics (SwarmStatistics): Statistics after the last iteration.
+
+        Returns:
+            float: The new inertia coefficient.
+        """
+
+
+@dataclass
+class LinearDecreasing(InertiaStrategy):
+    """Decrease the inertia linearly from its initial value to `final` over the run."""
+
+    final: float = 0.4
+    _initial: float = field(init=False, default=0.0, repr=False)
+
+    def start(self, inertia: float, statistics: SwarmStatistics) -> None:
+        self._initial = inertia
+
+    def update(self, inertia: float, statistics: SwarmStatistics) -> float:
+        return self._initial - (self._initial - self.final) * statistics.progress
+
+
+@dataclass
+class Chaotic(InertiaStrategy):
+    """Linearly decreasing inertia with a chaotic term, after Feng et al. (2007).
+
+    w = (w_0 - w_final) * (1 - progress) + w_final * z, where z follows the
+    logistic map z' = 4z(1 - z), which wanders over (0, 1) without settling.
+
+    Args:
+        final (float): Inertia reached at the end of the run, before the
+            chaotic term.
+        seed (float): Starting point of the logistic map, in (0, 1) and not a
+            fixed point or a pre-image of one.
+    """
+
+    final: float = 0.4
+    seed: float = 0.7
+    _initial: float = field(init=False, default=0.0, repr=False)
+    _z: float = field(init=False, default=0.0, repr=False)
+
+    def __post_init__(self):
+        if not 0 < self.seed < 1 or self.seed in (0.25, 0.5, 0.75):
+            raise ValueError(
+                "The chaotic seed should be in (0, 1), other than 0.25, 0.5 and 0.75."
+            )
+
+    def start(self, inertia: float, statistics: SwarmStatistics) -> None:
+        self._initial = inertia
+        self._z = self.seed
+
+    def update(self, inertia: float, statistics: SwarmStatistics) -> float:
+        self._z = 4 * self._z * (1 - self._z)
+        linear = (self._initial - self.final) * (1 - statistics.progress)
+        return linear + self.final * self._z
+
+
+@dataclass
+class SuccessRate(InertiaStrategy):
+    """Inertia proportional to the share of particles that improved, after
+    Nickabadi et al. (2011).
+
+    A swarm that keeps improving explores with a large inertia, a swarm
+    that stalls slows down to refine what it found.
+    """
+
+    minimum: float = 0.0
+    maximum: float = 1.0
+
+    def __post_init__(self):
+        if self.minimum > self.maximum:
+            raise ValueError("The minimum inertia should not exceed the maximum.")
+
+    def update(self, inertia: float, statistics: SwarmStatistics) -> float:
+        return (
+            self.minimum + (self.maximum - self.minimum) * statistics.improved_fraction
+        )
+
+
+@dataclass
+class DiversityFeedback(InertiaStrategy):
+    """Inertia shrinking with the swarm, from its initial value down to `minimum`.
+
+    w = w_min + (w_0 - w_min) * min(1, D / D_0), where D is the diversity of
+    the swarm and D_0 its diversity at the start of the run, so the swarm
+    only slows down once it actually converges.
+    """
+
+    minimum: float = 0.4
+    uses_diversity = True
+    _initial: float = field(init=False, default=0.0, repr=False)
+    _initial_diversity: float = field(init=False, default=0.0, repr=False)
+
+    def start(self, inertia: float, statistics: SwarmStatistics) -> None:
+        self._initial = inertia
+        self._initial_diversity = statistics.diversity
+
+    def update(self, inertia: float, statistics: SwarmStatistics) -> float:
+        if self._initial_diversity == 0:
+            return self.minimum
+        ratio = min(statistics.diversity / self._initial_diversity, 1.0)
+        return self.minimum + (self._initial - self.minimum) * ratio
@@ -1,43 +1,194 @@
+from __future__ import annotations
 from dataclasses import dataclass, field
-import math
+from pathlib import Path
 from typing import Callable
-import random
 import enum
-
-
+import math
+import os
+import pickle
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    ScalarBatchAdapter,
+)
+from src.projekt_pop_24z.swarm.boundary import BoundaryStrategy, Clamp
+from src.projekt_pop_24z.swarm.cache import EvaluationCache
+from src.projekt_pop_24z.swarm.constraints import ConstraintHandling, Constraints
+from src.projekt_pop_24z.swarm.evaluators import Evaluator
+from src.projekt_pop_24z.swarm.inertia import InertiaStrategy, SwarmStatistics
+from src.projekt_pop_24z.swarm.stopping import StoppingCriterion
+from src.projekt_pop_24z.swarm.surrogate import Archive, Screening
+from src.projekt_pop_24z.swarm.topology import Neighbourhoods, Topology
 from src.projekt_pop_24z.utils.logger import SwarmLogger
-
+from src.projekt_pop_24z.utils.profiling import NullPhaseTimer, Phase, PhaseTimer
 
 Coordinates = list[float]
 Bounds = list[Coordinates]
+RandomState = np.random.Generator | np.random.SeedSequence | int | None
+
+
+def spawn_generators(seed: RandomState, n_streams: int) -> list[np.random.Generator]:
+    """Create independent random generators, e.g. one per run.
+
+    Args:
+        seed (RandomState): Master seed, None for fresh entropy.
+        n_streams (int): Number of generators.
+
+    Returns:
+        list[np.random.Generator]: Generators with statistically independent streams.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n_streams)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(n_streams)]
 
 
 @dataclass
+class ParticleStorage:
+    """State of a population of particles as a structure of arrays.
+
+    Every array has one row per particle; a personal best cost of NaN marks a
+    particle whose personal best was not evaluated yet.
+    """
+
+    positions: np.ndarray
+    velocities: np.ndarray
+    personal_best_positions: np.ndarray
+    personal_best_costs: np.ndarray
+
+    @classmethod
+    def empty(cls, swarm_size: int, dimensions: int) -> ParticleStorage:
+        """Storage of `swarm_size` particles at the origin, none of them evaluated."""
+        shape = (swarm_size, dimensions)
+        return cls(
+            positions=np.zeros(shape),
+            velocities=np.zeros(shape),
+            personal_best_positions=np.zeros(shape),
+            personal_best_costs=np.full(swarm_size, np.nan),
+        )
+
+
 class Particle:
-    dimensions: int
-    position: Coordinates = field(default_factory=list)
-    personal_best_position: Coordinates = field(default_factory=list)
-    velocity: Coordinates = field(default_factory=list)
+    """A particle of the swarm, a view of one row of a `ParticleStorage`.
+
+    The coordinates are 1-D views into the storage, assigning to them copies
+    the values into it. A particle created on its own gets a storage of a
+    single row, `Swarm` moves the particles it is given into its own storage.
+    """
+
+    __slots__ = ("dimensions", "_storage", "_index")
+
+    def __init__(
+        self,
+        dimensions: int,
+        position: Coordinates | None = None,
+        personal_best_position: Coordinates | None = None,
+        velocity: Coordinates | None = None,
+        personal_best_cost: float | None = None,
+        storage: ParticleStorage | None = None,
+        index: int = 0,
+    ):
+        self.dimensions = dimensions
+        self._storage = (
+            storage if storage is not None else ParticleStorage.empty(1, dimensions)
+        )
+        self._index = index
+
+        for name, value in (
+            ("position", position),
+            ("personal_best_position", personal_best_position),
+            ("velocity", velocity),
+        ):
+            if value is not None and len(value):
+                setattr(self, name, value)
+        if personal_best_cost is not None:
+            self.personal_best_cost = personal_best_cost
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._storage.positions[self._index]
+
+    @position.setter
+    def position(self, value: Coordinates | np.ndarray) -> None:
+        self._storage.positions[self._index] = value
+
+    @property
+    def personal_best_position(self) -> np.ndarray:
+        return self._storage.personal_best_positions[self._index]
+
+    @personal_best_position.setter
+    def personal_best_position(self, value: Coordinates | np.ndarray) -> None:
+        self._storage.personal_best_positions[self._index] = value
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self._storage.velocities[self._index]
+
+    @velocity.setter
+    def velocity(self, value: Coordinates | np.ndarray) -> None:
+        self._storage.velocities[self._index] = value
+
+    @property
+    def personal_best_cost(self) -> float | None:
+        cost = self._storage.personal_best_costs[self._index]
+        return None if math.isnan(cost) else float(cost)
+
+    @personal_best_cost.setter
+    def personal_best_cost(self, value: float | None) -> None:
+        self._storage.personal_best_costs[self._index] = (
+            np.nan if value is None else value
+        )
 
-    def initialize_particle(self, bounds: list[Coordinates]) -> None:
+    def move_to(self, storage: ParticleStorage, index: int) -> None:
+        """Copy the particle into row `index` of `storage` and view that row from now on."""
+        storage.positions[index] = self.position
+        storage.velocities[index] = self.velocity
+        storage.personal_best_positions[index] = self.personal_best_position
+        storage.personal_best_costs[index] = self._storage.personal_best_costs[
+            self._index
+        ]
+        self._storage, self._index = storage, index
+
+    def __repr__(self) -> str:
+        return (
+            f"Particle(dimensions={self.dimensions}, "
+            f"position={self.position.tolist()}, "
+            f"personal_best_position={self.personal_best_position.tolist()}, "
+            f"velocity={self.velocity.tolist()}, "
+            f"personal_best_cost={self.personal_best_cost})"
+        )
+
+    def initialize_particle(
+        self, bounds: list[Coordinates], rng: np.random.Generator | None = None
+    ) -> None:
         """Initialize the particle's position and velocity based on the bounds.
 
         Args:
             bounds (list[Coordinates]): Bounds for each dimension of the particle's position.
+            rng (np.random.Generator | None): Source of randomness, a fresh generator if None.
         """
-        self.position = [random.uniform(*bound) for bound in bounds]
+        rng = rng if rng is not None else np.random.default_rng()
+        lower_bounds, upper_bounds = np.asarray(bounds, dtype=np.float64).T
+        half_span = np.abs(upper_bounds - lower_bounds) / 2
+
+        self.position = rng.uniform(lower_bounds, upper_bounds)
         self.personal_best_position = self.position
-        self.velocity = [
-            random.uniform(-abs(bound[1] - bound[0]) / 2, abs(bound[1] - bound[0]) / 2)
-            for bound in bounds
-        ]
+        self.velocity = rng.uniform(-half_span, half_span)
 
     def update_velocity(
         self,
-        global_best_position: Coordinates,
+        global_best_position: Coordinates | np.ndarray,
         inertia_coefficient: float,
         cognitive_constant: float,
         social_constant: float,
+        cognitive_random: Coordinates | np.ndarray | None = None,
+        social_random: Coordinates | np.ndarray | None = None,
     ) -> None:
         """Update the velocity of the particle based on the standard PSO velocity equation.
 
@@ -46,29 +197,49 @@ class Particle:
                 + c2 * r2 * (g_best - x(t))
 
         Args:
-            global_best_position (Coordinates): The overall best position found by the swarm.
+            global_best_position (Coordinates | np.ndarray): The overall best position found by the swarm,
+                or the best position of the particle's neighbourhood in a local-best swarm.
             inertia_coefficient (float): Inertia weight (may be adjusted dynamically).
             cognitive_constant (float): Acceleration constant for the cognitive component.
             social_constant (float): Acceleration constant for the social component.
+            cognitive_random (Coordinates | np.ndarray | None): r1 for each dimension, drawn if None.
+            social_random (Coordinates | np.ndarray | None): r2 for each dimension, drawn if None.
         """
-        for d in range(self.dimensions):
-            r1 = random.random()
-            r2 = random.random()
-
-            cognitive_velocity = (
-                cognitive_constant
-                * r1
-                * (self.personal_best_position[d] - self.position[d])
-            )
-            social_velocity = (
-                social_constant * r2 * (global_best_position[d] - self.position[d])
+        if cognitive_random is None or social_random is None:
+            cognitive_random, social_random = np.random.default_rng().random(
+                (2, self.dimensions)
             )
 
-            self.velocity[d] = (
-                inertia_coefficient * self.velocity[d]
-                + cognitive_velocity
-                + social_velocity
-            )
+        self.velocity = _velocity(
+            self.velocity,
+            self.position,
+            self.personal_best_position,
+            np.asarray(global_best_position),
+            inertia_coefficient,
+            cognitive_constant,
+            social_constant,
+            np.asarray(cognitive_random),
+            np.asarray(social_random),
+        )
+
+
+def _velocity(
+    velocity: np.ndarray,
+    position: np.ndarray,
+    personal_best_position: np.ndarray,
+    social_best_position: np.ndarray,
+    inertia_coefficient: float,
+    cognitive_constant: float,
+    social_constant: float,
+    cognitive_random: np.ndarray,
+    social_random: np.ndarray,
+) -> np.ndarray:
+    """The PSO velocity equation, for one particle or for rows of particles alike."""
+    return (
+        inertia_coefficient * velocity
+        + cognitive_constant * cognitive_random * (personal_best_position - position)
+        + social_constant * social_random * (social_best_position - position)
+    )
 
 
 class Task(enum.Enum):
@@ -76,6 +247,16 @@ class Task(enum.Enum):
     MAXIMIZE = enum.auto()
 
 
+@dataclass
+class RunState:
+    """State of an ongoing `run_optimization` call, kept so the run can be resumed."""
+
+    final_iteration: int
+    inertia: float
+    cognitive_constant: float
+    social_constant: float
+
+
 @dataclass
 class Swarm:
     swarm_size: int
@@ -88,34 +269,240 @@ class Swarm:
     global_best_position: Coordinates = field(default_factory=list)
     dynamic_inertia: bool = False
     inertia_decay: float = 0
+    batch_cost_function: BatchFunction | None = None
+    stopping_criteria: list[StoppingCriterion] = field(default_factory=list)
+    rng: RandomState = None
+    evaluator: Evaluator | None = None
+    topology: Topology | None = None
+    checkpoint_path: Path | str | None = None
+    checkpoint_interval: float = 5.0
+    profile: bool = False
+    screening: Screening | None = None
+    cache: EvaluationCache | None = None
+    inertia_strategy: InertiaStrategy | None = None
+    boundary: BoundaryStrategy = field(default_factory=Clamp)
+    v_max: float | Coordinates | None = None
+    constraints: Constraints | None = None
+    run_state: RunState | None = field(init=False, default=None)
     current_iteration: int = field(init=False, default=0)
+    global_best_cost: float | None = field(init=False, default=None)
+    evaluations: int = field(init=False, default=0)
+    timer: PhaseTimer = field(init=False, repr=False)
+    statistics: SwarmStatistics = field(init=False, repr=False)
 
     def __post_init__(self):
 
         if not (1.0001 <= self.inertia_decay <= 1.005) and self.dynamic_inertia:
             raise ValueError("Inertia decay should be in the range [1.0001, 1.005].")
+        if self.dynamic_inertia and self.inertia_strategy is not None:
+            raise ValueError("Use either dynamic inertia or an inertia strategy.")
+
+        self._batch_cost_function = self.batch_cost_function or ScalarBatchAdapter(
+            self.cost_function
+        )
+
+        # Accepts a seed as well, the swarm then owns its own stream
+        self.rng = np.random.default_rng(self.rng)
+        self._neighbourhoods: Neighbourhoods | None = None
+        self.timer = PhaseTimer() if self.profile else NullPhaseTimer()
+        self.statistics = SwarmStatistics(self.swarm_size, self.dimensions)
+        self._tracks_diversity = (
+            self.inertia_strategy is not None and self.inertia_strategy.uses_diversity
+        )
+        self._archive = (
+            Archive(self.dimensions, self.screening.archive_capacity)
+            if self.screening is not None
+            else None
+        )
+
+        bounds = np.asarray(self.bounds, dtype=np.float64)
+        self._lower_bounds = bounds[:, 0]
+        self._upper_bounds = bounds[:, 1]
+
+        self._v_max = None
+        if self.v_max is not None:
+            self._v_max = np.broadcast_to(
+                np.asarray(self.v_max, dtype=np.float64), (self.dimensions,)
+            )
+            if np.any(self._v_max <= 0):
+                raise ValueError("Maximum velocity should be positive.")
+        # Worst feasible cost found so far, see `Constraints.rank`
+        self._worst_feasible: float | None = None
+
+        # The particles the swarm is given are moved into its own storage
+        self._storage = ParticleStorage.empty(len(self.particles), self.dimensions)
+        for index, particle in enumerate(self.particles):
+            particle.move_to(self._storage, index)
 
     def init_swarm(self) -> None:
-        for _ in range(self.swarm_size):
-            particle = Particle(dimensions=self.dimensions)
-            particle.initialize_particle(self.bounds)
+        self._storage = ParticleStorage.empty(self.swarm_size, self.dimensions)
+        for index in range(self.swarm_size):
+            particle = Particle(self.dimensions, storage=self._storage, index=index)
+            particle.initialize_particle(self.bounds, self.rng)
             self.particles.append(particle)
-        self.global_best_position = self.particles[0].position
+
+        self._storage.personal_best_costs[:] = self._evaluate_positions(
+            self._storage.positions
+        )
+
+        self.global_best_position = self.particles[0].position.tolist()
+        self.global_best_cost = self.particles[0].personal_best_cost
+        self._init_neighbourhoods()
+
+    def evaluate(self, position: Coordinates) -> float:
+        """Evaluate the cost function and count the evaluation.
+
+        Args:
+            position (Coordinates): Position to evaluate.
+
+        Returns:
+            float: Cost of the position.
+        """
+        self.evaluations += 1
+        return self.cost_function(position)
+
+    def evaluate_population(self, positions: list[Coordinates]) -> list[float]:
+        """Evaluate all positions of an iteration at once.
+
+        See `_evaluate_positions` for how the positions are evaluated.
+
+        Args:
+            positions (list[Coordinates]): Positions to evaluate.
+
+        Returns:
+            list[float]: Cost of each position.
+        """
+        return self._evaluate_positions(
+            np.asarray(positions, dtype=np.float64)
+        ).tolist()
+
+    def _evaluate_positions(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate every row of `positions` and count the evaluations.
+
+        With a `cache` only the positions that are not cached are evaluated,
+        see `_evaluate_uncached` for how. With `constraints` the returned
+        costs include the handling of the violations.
+        """
+        if self.cache is not None:
+            costs = self.cache.evaluate(positions, self._evaluate_uncached)
+        else:
+            costs = self._evaluate_uncached(positions)
+
+        if self.constraints is not None:
+            costs = self._apply_constraints(positions, costs)
+        return costs
+
+    def _evaluate_uncached(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate every row of `positions` with the cost function.
+
+        With an `evaluator` the scalar cost function is evaluated through it,
+        e.g. concurrently. Otherwise the batch cost function is called once,
+        which falls back to evaluating `cost_function` row by row.
+        """
+        self.evaluations += len(positions)
+        self.timer.add_evaluations(len(positions))
+        with self.timer.phase(Phase.EVALUATION):
+            if self.evaluator is not None:
+                costs = self.evaluator.evaluate(self.cost_function, positions)
+            else:
+                costs = np.asarray(
+                    self._batch_cost_function(positions), dtype=np.float64
+                )
+
+        if self._archive is not None:
+            self._archive.add(positions, costs)
+        return costs
+
+    def _apply_constraints(
+        self, positions: np.ndarray, costs: np.ndarray
+    ) -> np.ndarray:
+        """Fold the constraint violations of `positions` into their costs."""
+        # The constraints compare costs of minimisation
+        sign = -1.0 if self.task is Task.MAXIMIZE else 1.0
+        violations = self.constraints.violations(positions)
+        if self.constraints.handling is ConstraintHandling.PENALTY:
+            return sign * self.constraints.penalize(sign * costs, violations)
+
+        worst_before = self._worst_feasible
+        ranked, self._worst_feasible = self.constraints.rank(
+            sign * costs, violations, worst_before
+        )
+        if self._worst_feasible != worst_before:
+            self._shift_infeasible_bests(
+                worst_before or 0.0, (self._worst_feasible or 0.0), sign
+            )
+        return sign * ranked
+
+    def _shift_infeasible_bests(
+        self, offset_before: float, offset: float, sign: float
+    ) -> None:
+        """Move the infeasible personal and global bests onto the new `offset`.
+
+        Infeasible costs are `offset + violation`, above every feasible cost,
+        so the bests above the old offset are the infeasible ones. All of them
+        move by the same amount, so their order, and with it the best of
+        every neighbourhood, stays the same.
+        """
+        shift = sign * (offset - offset_before)
+        if self.is_initialized():
+            costs = self._personal_best_costs()
+            costs[sign * costs > offset_before] += shift
+            if self._neighbourhoods is not None:
+                self._neighbourhoods.refresh(costs)
+        if self.global_best_cost is not None and (
+            sign * self.global_best_cost > offset_before
+        ):
+            self.global_best_cost += shift
+
+    def _evaluate_moved(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate the positions of an iteration, pre-screened by the surrogate.
+
+        Without `screening` every position is evaluated. Otherwise positions
+        the surrogate does not select get the worst possible cost, so they
+        cannot improve any best.
+        """
+        if self.screening is None:
+            return self._evaluate_positions(positions)
+
+        maximize = self.task is Task.MAXIMIZE
+        with self.timer.phase(Phase.SCREENING):
+            selected = self.screening.select(self._archive, positions, maximize)
+        if selected is None:
+            return self._evaluate_positions(positions)
+
+        costs = np.full(len(positions), -np.inf if maximize else np.inf)
+        costs[selected] = self._evaluate_positions(positions[selected])
+        return costs
+
+    def is_better(self, cost: float, reference_cost: float | None) -> bool:
+        """Check whether `cost` improves on `reference_cost` for the defined task."""
+        if reference_cost is None:
+            return True
+        if self.task is Task.MAXIMIZE:
+            return cost > reference_cost
+        return cost < reference_cost
 
     def update_global_best(self) -> Coordinates:
         """Find the global best position based on the particles' personal bests and the defined task.
 
+        Uses the cached personal best costs, evaluating only the particles that
+        do not have one yet. Also updates `global_best_cost`.
+
         Returns:
             Coordinates: The global best position.
         """
 
-        comparison_fn = max if self.task is Task.MAXIMIZE else min
+        for particle in self.particles:
+            if particle.personal_best_cost is None:
+                particle.personal_best_cost = self.evaluate(
+                    particle.personal_best_position.tolist()
+                )
 
-        best_particle = comparison_fn(
-            self.particles, key=lambda p: self.cost_function(p.personal_best_position)
-        )
+        costs = self._storage.personal_best_costs
+        best = np.argmax(costs) if self.task is Task.MAXIMIZE else np.argmin(costs)
 
-        return best_particle.personal_best_position[:]
+        self.global_best_cost = float(costs[best])
+        return self._storage.personal_best_positions[best].tolist()
 
     def update_inertia(self, initial_inertia: float) -> float:
         """Update the inertia coefficient based on the current iteration.
@@ -158,65 +545,448 @@ class Swarm:
         w = initial_inertia
         self.logger.add_inertia(w)
 
-        if not self.particles:
+        if not self.is_initialized():
             self.init_swarm()
 
-        self.logger.add_particle_epoch([p.position for p in self.particles])
+        with self.timer.phase(Phase.LOGGING):
+            self.logger.add_particle_epoch(self.positions_array())
 
-        self.global_best_position = self.update_global_best()
+        with self.timer.phase(Phase.BEST_UPDATE):
+            self.global_best_position = self.update_global_best()
 
-        initial_cost = self.cost_function(self.global_best_position)
-        self.logger.log_global_best_cost(initial_cost)
+        self.logger.log_global_best_cost(self.global_best_cost)
+        self.timer.end_iteration()
 
-        for _ in range(iterations):
+        for criterion in self.stopping_criteria:
+            criterion.start(self)
 
-            w = self.update_inertia(w) if self.dynamic_inertia else w
+        self.run_state = RunState(
+            final_iteration=self.current_iteration + iterations,
+            inertia=w,
+            cognitive_constant=cognitive_constant,
+            social_constant=social_constant,
+        )
 
-            for particle in self.particles:
+        if self.inertia_strategy is not None:
+            statistics = self.statistics
+            statistics.start_iteration = statistics.iteration = self.current_iteration
+            statistics.final_iteration = self.run_state.final_iteration
+            # Every particle has just found its first personal best
+            statistics.improved = self.swarm_size
+            if self._tracks_diversity:
+                statistics.set_positions(self.positions_array())
+            self.inertia_strategy.start(w, statistics)
 
-                particle.update_velocity(
-                    global_best_position=self.global_best_position,
-                    inertia_coefficient=w,
-                    cognitive_constant=cognitive_constant,
-                    social_constant=social_constant,
-                )
+        return self._continue_optimization()
 
-                self._update_particle_position(particle)
+    def continue_optimization(self, iterations: int) -> Coordinates:
+        """Run `iterations` more iterations of the run started by `run_optimization`.
 
-                current_cost = self.cost_function(particle.position)
-                personal_best_cost = self.cost_function(particle.personal_best_position)
+        Unlike calling `run_optimization` again, the logged curves continue
+        without repeating the current state.
 
-                better_condition = (
-                    current_cost > personal_best_cost
-                    if self.task is Task.MAXIMIZE
-                    else current_cost < personal_best_cost
-                )
+        Args:
+            iterations (int): Number of iterations to run.
 
-                if better_condition:
-                    particle.personal_best_position = particle.position[:]
+        Returns:
+            Coordinates: The best solution found by the swarm.
+        """
+        if self.run_state is None:
+            raise ValueError("No run was started, call run_optimization first.")
+
+        self.run_state.final_iteration = self.current_iteration + iterations
+        return self._continue_optimization()
+
+    def _continue_optimization(self) -> Coordinates:
+        """Run the remaining iterations of `run_state`, checkpointing periodically."""
+        state = self.run_state
+        started_at = last_checkpoint = time.perf_counter()
+        evaluations_before = self.evaluations
+        if self.cache is not None:
+            hits_before, lookups_before = self.cache.hits, self.cache.lookups
+
+        while self.current_iteration < state.final_iteration:
+
+            if self.inertia_strategy is not None:
+                self.statistics.iteration = self.current_iteration
+                self.statistics.final_iteration = state.final_iteration
+                state.inertia = self.inertia_strategy.update(
+                    state.inertia, self.statistics
+                )
+            elif self.dynamic_inertia:
+                state.inertia = self.update_inertia(state.inertia)
+            w = state.inertia
 
-            self.global_best_position = self.update_global_best()
+            self._iterate(w, state.cognitive_constant, state.social_constant)
 
-            self.logger.log_global_best_cost(
-                self.cost_function(self.global_best_position)
-            )
+            with self.timer.phase(Phase.LOGGING):
+                self.logger.log_global_best_cost(self.global_best_cost)
 
-            self.logger.add_inertia(w)
-            self.logger.add_particle_epoch([p.position for p in self.particles])
+                self.logger.add_inertia(w)
+                self.logger.add_particle_epoch(self.positions_array())
 
-            self.logger.increment_iterations()
-            self.logger.check_epsilon()
+                self.logger.increment_iterations()
+                self.logger.check_epsilon()
 
             self.current_iteration += 1
 
+            with self.timer.phase(Phase.STOPPING):
+                if self._check_stopping_criteria():
+                    state.final_iteration = self.current_iteration
+
+            if (
+                self.checkpoint_path is not None
+                and time.perf_counter() - last_checkpoint >= self.checkpoint_interval
+            ):
+                with self.timer.phase(Phase.CHECKPOINT):
+                    self._checkpoint()
+                last_checkpoint = time.perf_counter()
+
+            self.timer.end_iteration()
+
+        self._end_run()
+        self.logger.log_throughput(
+            self.evaluations - evaluations_before, time.perf_counter() - started_at
+        )
+        if self.cache is not None:
+            self.logger.log_cache_hits(
+                self.cache.hits - hits_before, self.cache.lookups - lookups_before
+            )
+
+        if self.checkpoint_path is not None:
+            self._checkpoint()
+
         return self.global_best_position
 
+    def _end_run(self) -> None:
+        """Settle work left over by the last iteration, before the run is summarised."""
+
+    def _checkpoint(self) -> None:
+        """Save the checkpoint of the run, warning instead of ending the run if it fails."""
+        try:
+            self.save_checkpoint(self.checkpoint_path)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            warnings.warn(
+                f"The swarm could not be checkpointed to {self.checkpoint_path}: {error}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    def save_checkpoint(self, path: Path | str) -> None:
+        """Write the full state of the swarm, including the RNG and the logger, to `path`.
+
+        The file is a pickle, replaced atomically so a crash during the write
+        keeps the previous checkpoint. Cost functions that cannot be pickled
+        (e.g. lambdas) are left out and have to be passed to `resume`; any
+        other part of the swarm that cannot be pickled (e.g. a lambda
+        constraint) raises, leaving the previous checkpoint in place.
+
+        Args:
+            path (Path | str): Path of the checkpoint file.
+        """
+        state = self.__dict__.copy()
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            try:
+                try:
+                    pickle.dump(
+                        (type(self), state), file, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    # Only now find out which cost functions cannot be pickled
+                    for name in (
+                        "cost_function",
+                        "batch_cost_function",
+                        "_batch_cost_function",
+                    ):
+                        state[name] = _picklable_or_none(state[name])
+                    file.seek(0)
+                    file.truncate()
+                    pickle.dump(
+                        (type(self), state), file, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+        os.replace(file.name, path)
+
+    @classmethod
+    def load_checkpoint(
+        cls,
+        path: Path | str,
+        cost_function: Callable[[Coordinates], float] | None = None,
+        batch_cost_function: BatchFunction | None = None,
+    ) -> Swarm:
+        """Restore a swarm written by `save_checkpoint`.
+
+        Args:
+            path (Path | str): Path of the checkpoint file.
+            cost_function (Callable[[Coordinates], float] | None): Replaces the saved cost function.
+            batch_cost_function (BatchFunction | None): Replaces the saved batch cost function.
+
+        Returns:
+            Swarm: The restored swarm, of the class that was saved.
+        """
+        with open(path, "rb") as file:
+            swarm_class, state = pickle.load(file)
+
+        if not issubclass(swarm_class, cls):
+            raise TypeError(
+                f"Checkpoint holds a {swarm_class.__name__}, not a {cls.__name__}."
+            )
+
+        if cost_function is not None:
+            state["cost_function"] = cost_function
+            state["_batch_cost_function"] = None
+        if batch_cost_function is not None:
+            state["batch_cost_function"] = batch_cost_function
+            state["_batch_cost_function"] = batch_cost_function
+        if state["cost_function"] is None:
+            raise ValueError(
+                "The cost function was not saved in the checkpoint, pass it explicitly."
+            )
+        if state["_batch_cost_function"] is None:
+            state["_batch_cost_function"] = state[
+                "batch_cost_function"
+            ] or ScalarBatchAdapter(state["cost_function"])
+
+        swarm = swarm_class.__new__(swarm_class)
+        swarm.__dict__.update(state)
+        return swarm
+
+    @classmethod
+    def resume(
+        cls,
+        path: Path | str,
+        cost_function: Callable[[Coordinates], float] | None = None,
+        batch_cost_function: BatchFunction | None = None,
+    ) -> Swarm:
+        """Restore a swarm from a checkpoint and finish its interrupted run.
+
+        The remaining iterations continue bit-identically to an uninterrupted run.
+        The run log is rewound to the checkpoint and closed once the run ends.
+
+        Args:
+            path (Path | str): Path of the checkpoint file.
+            cost_function (Callable[[Coordinates], float] | None): Replaces the saved cost function.
+            batch_cost_function (BatchFunction | None): Replaces the saved batch cost function.
+
+        Returns:
+            Swarm: The swarm after the run has finished.
+        """
+        swarm = cls.load_checkpoint(path, cost_function, batch_cost_function)
+        if swarm.run_state is None:
+            raise ValueError("The checkpoint was not taken during a run.")
+
+        swarm.logger.rewind()
+        for criterion in swarm.stopping_criteria:
+            criterion.resume(swarm)
+        swarm._continue_optimization()
+        swarm.logger.close()
+        return swarm
+
+    def emigrants(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Personal bests of the `count` best particles, e.g. to migrate to another swarm.
+
+        Args:
+            count (int): Number of particles.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Their positions and costs, best first.
+        """
+        costs = self._personal_best_costs()
+        best = self._rank(costs)[:count]
+        return self._personal_best_positions()[best], costs[best]
+
+    def immigrate(self, positions: np.ndarray, costs: np.ndarray) -> None:
+        """Replace the worst particles with immigrants that improve on them.
+
+        The best immigrant replaces the worst particle, the second best the
+        second worst and so on. A replaced particle keeps its velocity.
+
+        Args:
+            positions (np.ndarray): Positions of the immigrants.
+            costs (np.ndarray): Their costs.
+        """
+        order = self._rank(costs)
+        own_costs = self._personal_best_costs()
+        worst = self._rank(own_costs)[::-1]
+
+        for index, immigrant in zip(worst, order):
+            if self.is_better(costs[immigrant], own_costs[index]):
+                self._replace_particle(index, positions[immigrant], costs[immigrant])
+
+        self.global_best_position = self.update_global_best()
+        if self._neighbourhoods is not None:
+            self._neighbourhoods.refresh(self._personal_best_costs())
+
+    def is_initialized(self) -> bool:
+        return len(self._storage.positions) > 0
+
+    def positions_array(self) -> np.ndarray:
+        """Current positions of all particles as a `(swarm_size, dimensions)` array."""
+        return self._storage.positions
+
+    def diameter(self) -> float:
+        """Diameter of the swarm, measured as the diagonal of the particles' bounding box.
+
+        This is an upper bound of the largest distance between two particles,
+        computed in linear time.
+        """
+        positions = self.positions_array()
+        return float(np.linalg.norm(np.ptp(positions, axis=0)))
+
+    def _init_neighbourhoods(self) -> None:
+        """Precompute the neighbourhoods of a local-best swarm, once its costs are known."""
+        if self.topology is None:
+            return
+        self._neighbourhoods = Neighbourhoods(
+            indices=self.topology.neighbours(self.swarm_size, self.rng),
+            costs=self._personal_best_costs(),
+            maximize=self.task is Task.MAXIMIZE,
+        )
+
+    def _social_attractor(self, index: int) -> Coordinates:
+        """Position particle `index` is socially attracted to: the best of its
+        neighbourhood, or the global best without a topology."""
+        if self._neighbourhoods is None:
+            return self.global_best_position
+        best = self._neighbourhoods.best[index]
+        return self._storage.personal_best_positions[best]
+
+    def _personal_best_costs(self) -> np.ndarray:
+        return self._storage.personal_best_costs
+
+    def _personal_best_positions(self) -> np.ndarray:
+        return self._storage.personal_best_positions
+
+    def _replace_particle(self, index: int, position: np.ndarray, cost: float) -> None:
+        storage = self._storage
+        if self._tracks_diversity:
+            self.statistics.move(storage.positions[index], np.asarray(position))
+        storage.positions[index] = position
+        storage.personal_best_positions[index] = position
+        storage.personal_best_costs[index] = cost
+
+    def _rank(self, costs: np.ndarray) -> np.ndarray:
+        """Indices that sort `costs` from the best to the worst for the task."""
+        return np.argsort(
+            -costs if self.task is Task.MAXIMIZE else costs, kind="stable"
+        )
+
+    def _check_stopping_criteria(self) -> bool:
+        """Check the stopping criteria and log the first one that fired."""
+        for criterion in self.stopping_criteria:
+            if criterion.should_stop(self):
+                self.logger.log_stop_reason(criterion.name)
+                return True
+        return False
+
+    def _iterate(
+        self, inertia: float, cognitive_constant: float, social_constant: float
+    ) -> None:
+        """Move the whole swarm once and update the personal and global bests."""
+        # Draw the random coefficients of the whole iteration in one block
+        shape = (self.swarm_size, self.dimensions)
+        cognitive_random = self.rng.random(shape)
+        social_random = self.rng.random(shape)
+
+        storage = self._storage
+        if self._neighbourhoods is None:
+            attractors = np.asarray(self.global_best_position)
+        else:
+            attractors = storage.personal_best_positions[self._neighbourhoods.best]
+
+        # The particles are views of the storage, so the whole swarm moves at
+        # once; the bests do not change while moving, so this is equivalent to
+        # moving the particles one by one
+        with self.timer.phase(Phase.VELOCITY):
+            storage.velocities[:] = _velocity(
+                storage.velocities,
+                storage.positions,
+                storage.personal_best_positions,
+                attractors,
+                inertia,
+                cognitive_constant,
+                social_constant,
+                cognitive_random,
+                social_random,
+            )
+            if self._v_max is not None:
+                np.clip(
+                    storage.velocities,
+                    -self._v_max,
+                    self._v_max,
+                    out=storage.velocities,
+                )
+
+        with self.timer.phase(Phase.POSITION):
+            storage.positions += storage.velocities
+            self.boundary.apply(
+                storage.positions,
+                storage.velocities,
+                self._lower_bounds,
+                self._upper_bounds,
+                self.rng,
+            )
+            if self._tracks_diversity:
+                # Every particle moved, a per-particle update would cost as much
+                self.statistics.set_positions(storage.positions)
+
+        current_costs = self._evaluate_moved(storage.positions)
+
+        with self.timer.phase(Phase.BEST_UPDATE):
+            self._update_bests(current_costs)
+
+    def _update_bests(self, current_costs: np.ndarray) -> None:
+        """Update the personal, neighbourhood and global bests with the new costs."""
+        # The global best is only updated after the whole swarm has moved
+        iteration_best: Particle | None = None
+        improved = 0
+
+        for index, (particle, current_cost) in enumerate(
+            zip(self.particles, current_costs.tolist())
+        ):
+
+            if self.is_better(current_cost, particle.personal_best_cost):
+                improved += 1
+                # Copies the row in place, the storage is never reallocated
+                particle.personal_best_position = particle.position
+                particle.personal_best_cost = current_cost
+                if self._neighbourhoods is not None:
+                    self._neighbourhoods.improve(index, current_cost)
+
+                if iteration_best is None or self.is_better(
+                    current_cost, iteration_best.personal_best_cost
+                ):
+                    iteration_best = particle
+
+        self.statistics.improved = improved
+        if iteration_best is not None and self.is_better(
+            iteration_best.personal_best_cost, self.global_best_cost
+        ):
+            self.global_best_position = iteration_best.personal_best_position.tolist()
+            self.global_best_cost = iteration_best.personal_best_cost
+
     def _update_particle_position(self, particle: Particle) -> None:
         """Update particle's position based on its velocity, respecting bounds."""
-        for d in range(self.dimensions):
+        position, velocity = particle.position, particle.velocity
+        if self._v_max is not None:
+            np.clip(velocity, -self._v_max, self._v_max, out=velocity)
+        position += velocity
+        self.boundary.apply(
+            position, velocity, self._lower_bounds, self._upper_bounds, self.rng
+        )
 
-            particle.position[d] += particle.velocity[d]
 
-            lower_bound, upper_bound = self.bounds[d]
-            particle.position[d] = max(lower_bound, particle.position[d])
-            particle.position[d] = min(upper_bound, particle.position[d])
+def _picklable_or_none(value: object) -> object:
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+    return value
@@ -0,0 +1,123 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+import time
+
+if TYPE_CHECKING:
+    from src.projekt_pop_24z.swarm.pso import Swarm
+
+
+class StoppingCriterion(ABC):
+    """Condition checked after every iteration that can end the run early."""
+
+    name: str = "stopping criterion"
+
+    def start(self, swarm: Swarm) -> None:
+        """Reset the criterion's state at the start of a run."""
+
+    def resume(self, swarm: Swarm) -> None:
+        """Adapt the criterion's state to a run resumed from a checkpoint,
+        possibly in another process."""
+
+    @abstractmethod
+    def should_stop(self, swarm: Swarm) -> bool:
+        """Check whether the run should stop after the current iteration."""
+
+
+@dataclass
+class TargetCost(StoppingCriterion):
+    """Stop once the global best cost reaches `target` (or beats it)."""
+
+    target: float
+    name: str = field(init=False, default="target cost reached")
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        return not swarm.is_better(self.target, swarm.global_best_cost)
+
+
+@dataclass
+class NoImprovement(StoppingCriterion):
+    """Stop when the global best cost has not improved by more than `tolerance`
+    for `patience` iterations."""
+
+    patience: int
+    tolerance: float = 0
+    name: str = field(init=False, default="no improvement")
+    _best_cost: float | None = field(init=False, default=None, repr=False)
+    _stale_iterations: int = field(init=False, default=0, repr=False)
+
+    def start(self, swarm: Swarm) -> None:
+        self._best_cost = swarm.global_best_cost
+        self._stale_iterations = 0
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        cost = swarm.global_best_cost
+        improved = self._best_cost is None or (
+            swarm.is_better(cost, self._best_cost)
+            and abs(cost - self._best_cost) > self.tolerance
+        )
+
+        if improved:
+            self._best_cost = cost
+            self._stale_iterations = 0
+        else:
+            self._stale_iterations += 1
+
+        return self._stale_iterations >= self.patience
+
+
+@dataclass
+class SwarmDiameter(StoppingCriterion):
+    """Stop when the swarm has collapsed to a diameter below `threshold`.
+
+    See `Swarm.diameter` for how the diameter is measured.
+    """
+
+    threshold: float
+    name: str = field(init=False, default="swarm diameter below threshold")
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        return swarm.diameter() < self.threshold
+
+
+@dataclass
+class WallClockBudget(StoppingCriterion):
+    """Stop once the run has taken more than `seconds` of wall-clock time.
+
+    A resumed run keeps the time spent before its last checkpoint; the time
+    between the checkpoint and the interruption is not counted.
+    """
+
+    seconds: float
+    name: str = field(init=False, default="wall-clock budget exhausted")
+    _started_at: float = field(init=False, default=0, repr=False)
+    _elapsed: float = field(init=False, default=0, repr=False)
+
+    def start(self, swarm: Swarm) -> None:
+        self._started_at = time.perf_counter()
+        self._elapsed = 0
+
+    def resume(self, swarm: Swarm) -> None:
+        # The reference point of `perf_counter` is undefined across processes
+        self._started_at = time.perf_counter() - self._elapsed
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        self._elapsed = time.perf_counter() - self._started_at
+        return self._elapsed >= self.seconds
+
+
+@dataclass
+class EvaluationBudget(StoppingCriterion):
+    """Stop once the swarm has used `max_evaluations` cost function evaluations.
+
+    The budget is checked after every iteration, so the last iteration may
+    overshoot it by less than `swarm_size` evaluations. The asynchronous
+    swarm also counts the evaluations it already started for the next one.
+    """
+
+    max_evaluations: int
+    name: str = field(init=False, default="evaluation budget exhausted")
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        return swarm.evaluations >= self.max_evaluations
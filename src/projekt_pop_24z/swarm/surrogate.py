@@ -0,0 +1,144 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+
+class Surrogate(ABC):
+    """Cheap model of the cost function, fitted on an `Archive` of evaluations."""
+
+    @abstractmethod
+    def predict(self, archive: Archive, positions: np.ndarray) -> np.ndarray:
+        """Predict the costs of `positions`.
+
+        Args:
+            archive (Archive): Positions evaluated so far and their costs.
+            positions (np.ndarray): Positions shaped `(n, dimensions)`.
+
+        Returns:
+            np.ndarray: The predicted costs, shaped `(n,)`.
+        """
+
+
+@dataclass
+class KNNSurrogate(Surrogate):
+    """Inverse distance weighted mean of the costs of the `k` nearest archived positions.
+
+    A lazy learner: there is nothing to refit, every new evaluation added to
+    the archive is used by the next prediction.
+    """
+
+    k: int = 5
+
+    def __post_init__(self):
+        if self.k < 1:
+            raise ValueError("k should be a positive integer.")
+
+    def predict(self, archive: Archive, positions: np.ndarray) -> np.ndarray:
+        points, costs = archive.positions, archive.costs
+        k = min(self.k, len(points))
+
+        # |x - p|^2 = |x|^2 - 2 x.p + |p|^2, one matrix product for all pairs
+        distances = (
+            np.einsum("ij,ij->i", positions, positions)[:, None]
+            - 2 * positions @ points.T
+            + archive.squared_norms
+        )
+        np.maximum(distances, 0, out=distances)
+
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        nearest_distances = np.sqrt(np.take_along_axis(distances, nearest, axis=1))
+        weights = 1 / (nearest_distances + 1e-12)
+        return (weights * costs[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+@dataclass
+class Archive:
+    """Most recent true evaluations of a swarm, kept in a ring buffer.
+
+    Args:
+        dimensions (int): Number of dimensions of the positions.
+        capacity (int): Number of evaluations kept, the oldest are overwritten.
+    """
+
+    dimensions: int
+    capacity: int = 5000
+    size: int = field(init=False, default=0)
+    _positions: np.ndarray = field(init=False, repr=False)
+    _costs: np.ndarray = field(init=False, repr=False)
+    _squared_norms: np.ndarray = field(init=False, repr=False)
+    _next: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self):
+        if self.capacity < 1:
+            raise ValueError("Archive capacity should be a positive integer.")
+        self._positions = np.empty((self.capacity, self.dimensions))
+        self._costs = np.empty(self.capacity)
+        self._squared_norms = np.empty(self.capacity)
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions[: self.size]
+
+    @property
+    def costs(self) -> np.ndarray:
+        return self._costs[: self.size]
+
+    @property
+    def squared_norms(self) -> np.ndarray:
+        """Squared norms of `positions`, cached for the distance computations."""
+        return self._squared_norms[: self.size]
+
+    def add(self, positions: np.ndarray, costs: np.ndarray) -> None:
+        """Add evaluated positions, overwriting the oldest ones when full."""
+        for start in range(0, len(positions), self.capacity):
+            chunk = slice(start, start + self.capacity)
+            slots = (self._next + np.arange(len(positions[chunk]))) % self.capacity
+            self._positions[slots] = positions[chunk]
+            self._costs[slots] = costs[chunk]
+            self._squared_norms[slots] = np.einsum(
+                "ij,ij->i", positions[chunk], positions[chunk]
+            )
+            self._next = (self._next + len(slots)) % self.capacity
+            self.size = min(self.size + len(slots), self.capacity)
+
+
+@dataclass
+class Screening:
+    """Surrogate pre-screening of the positions of every iteration.
+
+    The surrogate ranks the moved particles and only the most promising
+    `fraction` of them is evaluated with the cost function. The others get
+    the worst possible cost, so they keep their personal best and move on.
+    Every true evaluation is added to the swarm's archive, which refits the
+    surrogate incrementally.
+
+    Args:
+        surrogate (Surrogate): Model predicting the costs.
+        fraction (float): Share of the particles evaluated in every iteration.
+        min_archive (int): Evaluate every particle until the archive holds
+            this many evaluations.
+        archive_capacity (int): Number of most recent evaluations kept.
+    """
+
+    surrogate: Surrogate = field(default_factory=KNNSurrogate)
+    fraction: float = 0.5
+    min_archive: int = 100
+    archive_capacity: int = 5000
+
+    def __post_init__(self):
+        if not 0 < self.fraction <= 1:
+            raise ValueError("Screening fraction should be in the range (0, 1].")
+
+    def select(
+        self, archive: Archive, positions: np.ndarray, maximize: bool
+    ) -> np.ndarray | None:
+        """Indices of the positions worth a true evaluation, None for all of them."""
+        if archive.size < self.min_archive or self.fraction == 1:
+            return None
+
+        predicted = self.surrogate.predict(archive, positions)
+        count = math.ceil(self.fraction * len(positions))
+        return np.sort(np.argsort(-predicted if maximize else predicted)[:count])
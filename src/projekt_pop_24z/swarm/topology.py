@@ -0,0 +1,144 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import InitVar, dataclass, field
+import math
+
+import numpy as np
+
+
+class Topology(ABC):
+    """Neighbourhood structure of a local-best (lbest) swarm.
+
+    Each particle is attracted to the best personal best of its neighbourhood
+    instead of the global best, which slows down the spread of information and
+    keeps the swarm from converging prematurely on multimodal functions.
+    """
+
+    @abstractmethod
+    def neighbours(self, swarm_size: int, rng: np.random.Generator) -> np.ndarray:
+        """Neighbourhoods of all particles, computed once per swarm.
+
+        Args:
+            swarm_size (int): Number of particles.
+            rng (np.random.Generator): Source of randomness for random topologies.
+
+        Returns:
+            np.ndarray: Index array shaped `(swarm_size, k)`; row `i` holds the
+                neighbourhood of particle `i`, including `i` itself.
+        """
+
+
+@dataclass
+class Ring(Topology):
+    """Every particle sees the `radius` particles on each side of it in a ring."""
+
+    radius: int = 1
+
+    def neighbours(self, swarm_size: int, rng: np.random.Generator) -> np.ndarray:
+        offsets = np.arange(-self.radius, self.radius + 1)
+        return (np.arange(swarm_size)[:, None] + offsets) % swarm_size
+
+
+@dataclass
+class VonNeumann(Topology):
+    """Particles on a toroidal grid, each seeing its four grid neighbours.
+
+    The grid has as many rows as the largest divisor of the swarm size not
+    above its square root, so a prime swarm size degenerates to a ring.
+    """
+
+    def neighbours(self, swarm_size: int, rng: np.random.Generator) -> np.ndarray:
+        rows = max(
+            d for d in range(1, math.isqrt(swarm_size) + 1) if swarm_size % d == 0
+        )
+        columns = swarm_size // rows
+        row, column = np.divmod(np.arange(swarm_size), columns)
+
+        return np.stack(
+            [
+                row * columns + column,
+                (row - 1) % rows * columns + column,
+                (row + 1) % rows * columns + column,
+                row * columns + (column - 1) % columns,
+                row * columns + (column + 1) % columns,
+            ],
+            axis=1,
+        )
+
+
+@dataclass
+class RandomK(Topology):
+    """Every particle sees `k` other particles drawn at random."""
+
+    k: int = 3
+
+    def neighbours(self, swarm_size: int, rng: np.random.Generator) -> np.ndarray:
+        if not 0 <= self.k < swarm_size:
+            raise ValueError(f"k should be in the range [0, {swarm_size - 1}].")
+
+        # Drawing from the other particles only, then shifting past `i`
+        others = rng.random((swarm_size, swarm_size - 1)).argsort(axis=1)[:, : self.k]
+        own = np.arange(swarm_size)[:, None]
+        others += others >= own
+        return np.concatenate([own, others], axis=1)
+
+
+@dataclass
+class Neighbourhoods:
+    """Precomputed neighbourhoods and the index of each one's best particle.
+
+    Personal bests only ever improve, so an improvement of particle `j` can
+    only make `j` the new best of the neighbourhoods that contain it. A reverse
+    index of those neighbourhoods makes the update O(k) per improved particle.
+
+    Args:
+        indices (np.ndarray): Neighbourhoods from `Topology.neighbours`.
+        costs (np.ndarray): Current personal best costs.
+        maximize (bool): Whether higher costs are better.
+    """
+
+    indices: np.ndarray
+    costs: InitVar[np.ndarray]
+    maximize: bool = False
+    best: np.ndarray = field(init=False)
+    _best_costs: list[float] = field(init=False, repr=False)
+    _containing: list[list[int]] = field(init=False, repr=False)
+
+    def __post_init__(self, costs: np.ndarray):
+        self._containing = [[] for _ in range(len(self.indices))]
+        for neighbourhood, members in enumerate(self.indices.tolist()):
+            for member in set(members):
+                self._containing[member].append(neighbourhood)
+
+        self.refresh(costs)
+
+    def refresh(self, costs: np.ndarray) -> None:
+        """Recompute the best particle of every neighbourhood from scratch.
+
+        Args:
+            costs (np.ndarray): Current personal best costs.
+        """
+        member_costs = np.asarray(costs)[self.indices]
+        pick = np.argmax if self.maximize else np.argmin
+        best_member = pick(member_costs, axis=1)
+        rows = np.arange(len(self.indices))
+
+        self.best = self.indices[rows, best_member]
+        self._best_costs = member_costs[rows, best_member].tolist()
+
+    def improve(self, particle: int, cost: float) -> None:
+        """Let the improved personal best of `particle` update its neighbourhoods.
+
+        Args:
+            particle (int): Index of the particle.
+            cost (float): Its new personal best cost.
+        """
+        best, best_costs = self.best, self._best_costs
+        for neighbourhood in self._containing[particle]:
+            if (
+                cost > best_costs[neighbourhood]
+                if self.maximize
+                else cost < best_costs[neighbourhood]
+            ):
+                best[neighbourhood] = particle
+                best_costs[neighbourhood] = cost
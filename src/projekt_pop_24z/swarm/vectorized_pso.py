@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.projekt_pop_24z.swarm.pso import ParticleStorage, Swarm, Task
+
+
+@dataclass
+class VectorizedSwarm(Swarm):
+    """Swarm that keeps the whole population in `(swarm_size, dimensions)` arrays.
+
+    Drop-in replacement for `Swarm`: it accepts the same arguments, produces the
+    same `SwarmLogger` output and returns the best position as a list. The
+    `particles` list stays empty, the state lives in the `ParticleStorage`
+    alone, exposed as `positions`, `velocities` and `personal_best_positions`.
+    The swarm moves like `Swarm`, only the bests are updated for the whole
+    swarm at once.
+    """
+
+    def init_swarm(self) -> None:
+        shape = (self.swarm_size, self.dimensions)
+        half_span = np.abs(self._upper_bounds - self._lower_bounds) / 2
+
+        positions = self.rng.uniform(self._lower_bounds, self._upper_bounds, size=shape)
+        self._storage = ParticleStorage(
+            positions=positions,
+            velocities=self.rng.uniform(-half_span, half_span, size=shape),
+            personal_best_positions=positions.copy(),
+            personal_best_costs=self._evaluate_positions(positions),
+        )
+        self.global_best_position = positions[0].tolist()
+        self.global_best_cost = float(self._storage.personal_best_costs[0])
+        self._init_neighbourhoods()
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._storage.positions
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._storage.velocities
+
+    @property
+    def personal_best_positions(self) -> np.ndarray:
+        return self._storage.personal_best_positions
+
+    @property
+    def personal_best_costs(self) -> np.ndarray:
+        return self._storage.personal_best_costs
+
+    def _update_bests(self, current_costs: np.ndarray) -> None:
+        storage = self._storage
+        improved = (
+            current_costs > storage.personal_best_costs
+            if self.task is Task.MAXIMIZE
+            else current_costs < storage.personal_best_costs
+        )
+        storage.personal_best_positions[improved] = storage.positions[improved]
+        storage.personal_best_costs[improved] = current_costs[improved]
+        self.statistics.improved = int(np.count_nonzero(improved))
+        if self._neighbourhoods is not None:
+            self._neighbourhoods.refresh(storage.personal_best_costs)
+
+        self.global_best_position = self.update_global_best()
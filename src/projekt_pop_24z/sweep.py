@@ -0,0 +1,510 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass, fields, is_dataclass, replace
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+import argparse
+import enum
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from src.projekt_pop_24z.benchmark import (
+    AlgorithmParameters,
+    Engine,
+    derive_run_seeds,
+    run_single_benchmark,
+)
+from src.projekt_pop_24z.benchmark_functions.base import BenchmarkFunction
+from src.projekt_pop_24z.benchmark_functions.repository import ALL_FUNCS
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.swarm.surrogate import Screening
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters
+
+
+FUNCTIONS_BY_NAME: dict[str, type[BenchmarkFunction]] = {
+    function.name: function for function in ALL_FUNCS
+}
+
+DEFAULT_CACHE_DIR = Path(".sweep_cache")
+
+
+@dataclass(frozen=True)
+class SweepCell:
+    """One run of a sweep: a parameter set, a benchmark function and a seed."""
+
+    parameters: AlgorithmParameters
+    function_name: str
+    seed: int
+
+    def key(self) -> str:
+        """Content address of the cell, stable across processes and sessions."""
+        payload = json.dumps(
+            [_canonical(self.parameters), self.function_name, self.seed],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class SweepResult:
+    """Compact result of a single sweep cell."""
+
+    key: str
+    function_name: str
+    seed: int
+    parameters: dict[str, Any]
+    best_cost: float
+    best_position: list[float]
+    iterations: int
+    evaluations: int
+    iterations_until_epsilon: int
+    global_best_costs: list[float]
+
+
+@dataclass
+class ResultCache:
+    """Content-addressed cache of sweep results, one JSON file per cell.
+
+    Args:
+        directory (Path): Directory of the cache, created when needed.
+    """
+
+    directory: Path = DEFAULT_CACHE_DIR
+    hits: int = 0
+    misses: int = 0
+
+    def get(self, cell: SweepCell) -> SweepResult | None:
+        path = self._path(cell.key())
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return SweepResult(**json.loads(path.read_text()))
+
+    def put(self, result: SweepResult) -> None:
+        """Store the result, atomically so an interrupted sweep never leaves a broken entry."""
+        path = self._path(result.key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            json.dump(asdict(result), file)
+        os.replace(file.name, path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+
+def grid(base: AlgorithmParameters, **axes: Sequence[Any]) -> list[AlgorithmParameters]:
+    """Cartesian product of parameter values.
+
+    Args:
+        base (AlgorithmParameters): Parameters that are not swept.
+        **axes (Sequence[Any]): Values of each swept `AlgorithmParameters` field.
+
+    Returns:
+        list[AlgorithmParameters]: One parameter set per combination.
+    """
+    names = list(axes)
+    return [
+        _with_values(base, dict(zip(names, values)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def random_sample(
+    base: AlgorithmParameters,
+    n_samples: int,
+    seed: int | None = None,
+    **axes: Sequence[Any] | tuple[float, float],
+) -> list[AlgorithmParameters]:
+    """Random sample of parameter sets.
+
+    Args:
+        base (AlgorithmParameters): Parameters that are not swept.
+        n_samples (int): Number of parameter sets.
+        seed (int | None): Seed of the sampling.
+        **axes: For each swept field either a list of choices, or a
+            `(low, high)` tuple sampled uniformly.
+
+    Returns:
+        list[AlgorithmParameters]: The sampled parameter sets.
+    """
+    rng = np.random.default_rng(seed)
+    samples = []
+    for _ in range(n_samples):
+        values = {}
+        for name, axis in axes.items():
+            if isinstance(axis, tuple):
+                values[name] = float(rng.uniform(*axis))
+            else:
+                values[name] = axis[rng.integers(len(axis))]
+        samples.append(_with_values(base, values))
+    return samples
+
+
+def make_cells(
+    parameter_sets: Iterable[AlgorithmParameters],
+    function_names: Iterable[str],
+    seeds: Iterable[int],
+) -> list[SweepCell]:
+    return [
+        SweepCell(parameters=parameters, function_name=function_name, seed=seed)
+        for parameters, function_name, seed in itertools.product(
+            parameter_sets, function_names, seeds
+        )
+    ]
+
+
+def run_cell(cell: SweepCell) -> SweepResult:
+    """Run the benchmark of a single cell."""
+    function = FUNCTIONS_BY_NAME[cell.function_name]
+    result, logger = run_single_benchmark(
+        cost_function=function.function,
+        parameters=cell.parameters,
+        log_params=LogParameters(
+            name=function.name,
+            optimum_value=function.optimum_value,
+            history_mode=HistoryMode.NONE,
+        ),
+        batch_cost_function=function.batch_function,
+        seed=cell.seed,
+    )
+    return SweepResult(
+        key=cell.key(),
+        function_name=cell.function_name,
+        seed=cell.seed,
+        parameters=_canonical(cell.parameters),
+        best_cost=result.best_cost,
+        best_position=list(result.best_position),
+        iterations=logger.iterations,
+        evaluations=result.evaluations,
+        iterations_until_epsilon=logger.iterations_until_epsilon,
+        global_best_costs=logger.global_best_costs,
+    )
+
+
+def run_sweep(
+    cells: Sequence[SweepCell],
+    cache: ResultCache | None = None,
+    workers: int = 1,
+) -> list[SweepResult]:
+    """Run the cells missing from the cache, in parallel when `workers` > 1.
+
+    Every finished cell is stored in the cache right away, so an interrupted
+    or extended sweep only computes the missing cells.
+
+    Args:
+        cells (Sequence[SweepCell]): Cells of the sweep.
+        cache (ResultCache | None): Cache of results, None disables caching.
+        workers (int): Number of worker processes.
+
+    Returns:
+        list[SweepResult]: Results in the order of `cells`.
+    """
+    results: dict[int, SweepResult] = {}
+    missing: list[int] = []
+
+    for index, cell in enumerate(cells):
+        cached = cache.get(cell) if cache is not None else None
+        if cached is None:
+            missing.append(index)
+        else:
+            results[index] = cached
+
+    def store(index: int, result: SweepResult) -> None:
+        results[index] = result
+        if cache is not None:
+            cache.put(result)
+
+    if workers > 1 and len(missing) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_cell, cells[i]): i for i in missing}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+    else:
+        for index in missing:
+            store(index, run_cell(cells[index]))
+
+    return [results[index] for index in range(len(cells))]
+
+
+def summarize(results: Iterable[SweepResult]) -> list[list[object]]:
+    """Mean and std of the best cost over seeds, per parameter set and function."""
+    groups: dict[str, list[SweepResult]] = {}
+    for result in results:
+        group_key = json.dumps(
+            [result.parameters, result.function_name], sort_keys=True
+        )
+        groups.setdefault(group_key, []).append(result)
+
+    rows = []
+    for group in groups.values():
+        parameters = group[0].parameters
+        costs = np.array([result.best_cost for result in group])
+        rows.append(
+            [
+                group[0].function_name,
+                parameters["swarm_size"],
+                parameters["dimensions"],
+                parameters["initial_inertia"],
+                parameters["inertia_decay"] if parameters["dynamic_inertia"] else "-",
+                len(group),
+                costs.mean(),
+                costs.std(),
+            ]
+        )
+    return rows
+
+
+def screening_report(results: Iterable[SweepResult]) -> list[list[object]]:
+    """True evaluations saved and quality lost by surrogate screening.
+
+    Every screened result is paired with the unscreened result of the same
+    parameters, function and seed.
+
+    Returns:
+        list[list[object]]: Per function and screening fraction: the number of
+            paired seeds, the mean evaluations without and with screening, the
+            share of evaluations saved and the mean best costs without and
+            with screening.
+    """
+    results = list(results)
+    baselines = {
+        _pairing_key(result): result
+        for result in results
+        if result.parameters["screening"] is None
+    }
+
+    groups: dict[str, list[tuple[SweepResult, SweepResult]]] = {}
+    for result in results:
+        baseline = baselines.get(_pairing_key(result))
+        if result.parameters["screening"] is None or baseline is None:
+            continue
+        group_key = json.dumps(
+            [result.function_name, result.parameters], sort_keys=True
+        )
+        groups.setdefault(group_key, []).append((baseline, result))
+
+    rows = []
+    for pairs in groups.values():
+        baseline_evaluations = np.mean([b.evaluations for b, _ in pairs])
+        evaluations = np.mean([s.evaluations for _, s in pairs])
+        rows.append(
+            [
+                pairs[0][1].function_name,
+                pairs[0][1].parameters["screening"]["fraction"],
+                len(pairs),
+                baseline_evaluations,
+                evaluations,
+                f"{1 - evaluations / baseline_evaluations:.1%}",
+                np.mean([b.best_cost for b, _ in pairs]),
+                np.mean([s.best_cost for _, s in pairs]),
+            ]
+        )
+    return rows
+
+
+def _pairing_key(result: SweepResult) -> str:
+    parameters = {**result.parameters, "screening": None}
+    return json.dumps([parameters, result.function_name, result.seed], sort_keys=True)
+
+
+def _with_values(
+    base: AlgorithmParameters, values: dict[str, Any]
+) -> AlgorithmParameters:
+    parameters = replace(base, **values)
+    if len(parameters.bounds) != parameters.dimensions:
+        parameters = replace(
+            parameters, bounds=[parameters.bounds[0]] * parameters.dimensions
+        )
+    return parameters
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-compatible representation used for content addressing."""
+    if isinstance(value, enum.Enum):
+        return value.name
+    if is_dataclass(value):
+        return {
+            "type": type(value).__name__,
+            **{
+                f.name: _canonical(getattr(value, f.name))
+                for f in fields(value)
+                if f.init
+            },
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if callable(value):
+        # Functions are addressed by name, which has to be unique
+        qualname = getattr(value, "__qualname__", "<instance>")
+        if "<" in qualname:
+            raise ValueError(
+                f"{value!r} cannot be addressed by name, pass a function defined "
+                "at the top level of a module instead."
+            )
+        return f"{value.__module__}.{qualname}"
+    return value
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Sweep PSO parameters over benchmark functions and seeds."
+    )
+    parser.add_argument(
+        "--functions",
+        nargs="+",
+        default=list(FUNCTIONS_BY_NAME),
+        choices=FUNCTIONS_BY_NAME,
+    )
+    parser.add_argument("--swarm-size", nargs="+", type=int, default=[20])
+    parser.add_argument("--dimensions", nargs="+", type=int, default=[10])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--bounds", nargs=2, type=float, default=[-2.048, 2.048])
+    parser.add_argument("--initial-inertia", nargs="+", type=float, default=[0.8])
+    parser.add_argument("--cognitive-constant", nargs="+", type=float, default=[2.0])
+    parser.add_argument("--social-constant", nargs="+", type=float, default=[2.0])
+    parser.add_argument(
+        "--inertia-decay",
+        nargs="+",
+        type=float,
+        default=[],
+        help="Decay values of the dynamic inertia variant, none runs static inertia only.",
+    )
+    parser.add_argument(
+        "--static-inertia",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Also run the static inertia variant.",
+    )
+    parser.add_argument(
+        "--random",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Sample N parameter sets instead of the full grid.",
+    )
+    parser.add_argument(
+        "--screening-fraction",
+        nargs="+",
+        type=float,
+        default=[],
+        help="Also run every parameter set with surrogate screening of these fractions.",
+    )
+    parser.add_argument("--seeds", type=int, default=5, help="Seeds per cell.")
+    parser.add_argument("--master-seed", type=int, default=2024)
+    parser.add_argument("--engine", choices=[e.name for e in Engine], default="NUMPY")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--output", type=Path, help="Write all results as JSON lines.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    from tabulate import tabulate
+
+    args = parse_args(argv)
+
+    base = AlgorithmParameters(
+        swarm_size=args.swarm_size[0],
+        bounds=[list(args.bounds)],
+        dimensions=args.dimensions[0],
+        task=Task.MINIMIZE,
+        iterations=args.iterations,
+        initial_inertia=args.initial_inertia[0],
+        cognitive_constant=args.cognitive_constant[0],
+        social_constant=args.social_constant[0],
+        engine=Engine[args.engine],
+    )
+    axes = {
+        "swarm_size": args.swarm_size,
+        "dimensions": args.dimensions,
+        "initial_inertia": args.initial_inertia,
+        "cognitive_constant": args.cognitive_constant,
+        "social_constant": args.social_constant,
+    }
+
+    inertia_variants = [(False, 0.0)] if args.static_inertia else []
+    inertia_variants += [(True, decay) for decay in args.inertia_decay]
+    if not inertia_variants:
+        raise SystemExit(
+            "Nothing to sweep: enable static inertia or give --inertia-decay."
+        )
+
+    parameter_sets = []
+    for dynamic_inertia, inertia_decay in inertia_variants:
+        variant = replace(
+            base, dynamic_inertia=dynamic_inertia, inertia_decay=inertia_decay
+        )
+        if args.random:
+            parameter_sets += random_sample(
+                variant, args.random, seed=args.master_seed, **axes
+            )
+        else:
+            parameter_sets += grid(variant, **axes)
+
+    parameter_sets += [
+        replace(parameters, screening=Screening(fraction=fraction))
+        for parameters in parameter_sets
+        for fraction in args.screening_fraction
+    ]
+
+    cells = make_cells(
+        parameter_sets, args.functions, derive_run_seeds(args.master_seed, args.seeds)
+    )
+    cache = ResultCache(args.cache_dir)
+    results = run_sweep(cells, cache=cache, workers=args.workers)
+
+    print(f"{len(cells)} cells, {cache.hits} from cache, {cache.misses} computed.")
+    print(
+        tabulate(
+            summarize(results),
+            headers=[
+                "Function",
+                "Swarm Size",
+                "Dimensions",
+                "Initial Inertia",
+                "Inertia Decay",
+                "Seeds",
+                "Mean Best Cost",
+                "Std Best Cost",
+            ],
+            tablefmt="grid",
+        )
+    )
+
+    if args.screening_fraction:
+        print(
+            tabulate(
+                screening_report(results),
+                headers=[
+                    "Function",
+                    "Screening Fraction",
+                    "Seeds",
+                    "Evaluations",
+                    "Screened Evaluations",
+                    "Saved",
+                    "Mean Best Cost",
+                    "Screened Mean Best Cost",
+                ],
+                tablefmt="grid",
+            )
+        )
+
+    if args.output is not None:
+        with args.output.open("w") as file:
+            for result in results:
+                file.write(json.dumps(asdict(result)) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,24 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from copy import deepcopy
+from copy import copy
+from typing import TYPE_CHECKING
+import enum
+
+import numpy as np
+
+from src.projekt_pop_24z.utils.statistics import RunningStatistics
+
+if TYPE_CHECKING:
+    from src.projekt_pop_24z.utils.run_log import RunLogWriter
+
+
+class HistoryMode(enum.Enum):
+    """Which particle positions epochs the logger keeps."""
+
+    NONE = enum.auto()
+    FIRST_LAST = enum.auto()
+    EVERY_K = enum.auto()
+    FULL = enum.auto()
 
 
 @dataclass
@@ -8,6 +26,10 @@ class LogParameters:
     name: str
     optimum_value: float = 0
     epsilon: float = -1
+    history_mode: HistoryMode = HistoryMode.FIRST_LAST
+    history_interval: int = 10
+    log_dir: str | None = None
+    log_positions_interval: int | None = 1
 
 
 @dataclass
@@ -19,8 +41,33 @@ class SwarmLogger:
     global_best_costs: list[float] = field(default_factory=list)
     iterations: int = field(init=False, default=0)
     iterations_until_epsilon: int = field(init=False, default=-1)
-    particle_positions_history: list[list[list[float]]] = field(default_factory=list)
+    stop_reason: str | None = field(init=False, default=None)
+    evaluations: int = field(init=False, default=0)
+    elapsed_seconds: float = field(init=False, default=0.0)
+    cache_hits: int = field(init=False, default=0)
+    cache_lookups: int = field(init=False, default=0)
     inertia_history: list[float] = field(default_factory=list)
+    history_mode: HistoryMode = HistoryMode.FIRST_LAST
+    history_interval: int = 10
+    sink: RunLogWriter | None = field(default=None, repr=False)
+    particle_positions_epochs: list[int] = field(init=False, default_factory=list)
+    _positions_buffer: np.ndarray | None = field(init=False, default=None, repr=False)
+    _epochs_seen: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self):
+        if self.history_interval < 1:
+            raise ValueError("History interval should be a positive integer.")
+
+    @property
+    def particle_positions_history(self) -> np.ndarray:
+        """Recorded particle positions, shaped `(epochs, swarm_size, dimensions)`.
+
+        Which epochs are recorded depends on `history_mode`; their indices are
+        kept in `particle_positions_epochs`.
+        """
+        if self._positions_buffer is None:
+            return np.empty((0, 0, 0))
+        return self._positions_buffer[: len(self.particle_positions_epochs)]
 
     @classmethod
     def aggregate(cls, loggers: list[SwarmLogger]) -> SwarmLogger:
@@ -35,67 +82,31 @@ class SwarmLogger:
         if not loggers:
             raise ValueError("The loggers list should not be empty.")
 
-        num_loggers = len(loggers)
-        new_logger = deepcopy(loggers[0])
-
-        # Average global best costs
-        max_length = max(len(logger.global_best_costs) for logger in loggers)
-        new_logger.global_best_costs = [
-            sum(
-                logger.global_best_costs[i]
-                for logger in loggers
-                if i < len(logger.global_best_costs)
-            )
-            / num_loggers
-            for i in range(max_length)
-        ]
-
-        # Iterations remain the same
-        new_logger.iterations = loggers[0].iterations
-
-        # Average iterations until epsilon
-        valid_iterations = [
-            logger.iterations_until_epsilon
-            for logger in loggers
-            if logger.iterations_until_epsilon != -1
-        ]
-        new_logger.iterations_until_epsilon = int(
-            sum(valid_iterations) / len(valid_iterations) if valid_iterations else -1
+        aggregator = LoggerAggregator(
+            length=max(len(logger.global_best_costs) for logger in loggers)
         )
+        for logger in loggers:
+            aggregator.add(logger)
 
-        # Average particle positions history
-        max_length = max(len(logger.particle_positions_history) for logger in loggers)
-        new_logger.particle_positions_history = [
-            [
-                [
-                    sum(
-                        logger.particle_positions_history[i][j][k]
-                        for logger in loggers
-                        if i < len(logger.particle_positions_history)
-                        and j < len(logger.particle_positions_history[i])
-                        and k < len(logger.particle_positions_history[i][j])
-                    )
-                    / num_loggers
-                    for k in range(len(loggers[0].particle_positions_history[0][0]))
-                ]
-                for j in range(len(loggers[0].particle_positions_history[0]))
-            ]
-            for i in range(max_length)
-        ]
-
-        # Average inertia history
-        max_length = max(len(logger.inertia_history) for logger in loggers)
-        new_logger.inertia_history = [
-            sum(
-                logger.inertia_history[i]
-                for logger in loggers
-                if i < len(logger.inertia_history)
-            )
-            / num_loggers
-            for i in range(max_length)
-        ]
+        return aggregator.result()
+
+    def compact(self) -> SwarmLogger:
+        """Return a copy that keeps only the first and last particle positions epochs.
 
-        return new_logger
+        Returns:
+            SwarmLogger: The compacted logger.
+        """
+        compacted = copy(self)
+        compacted.sink = None
+        keep = [0, -1] if len(self.particle_positions_epochs) > 1 else slice(None)
+        compacted.history_mode = HistoryMode.FIRST_LAST
+        compacted.particle_positions_epochs = np.array(
+            self.particle_positions_epochs, dtype=int
+        )[keep].tolist()
+        compacted._positions_buffer = self.particle_positions_history[keep].copy()
+        compacted.global_best_costs = self.global_best_costs[:]
+        compacted.inertia_history = self.inertia_history[:]
+        return compacted
 
     def log_global_best_cost(self, best_cost: float) -> None:
         """Log the global best cost found by the swarm.
@@ -104,6 +115,50 @@ class SwarmLogger:
             best_cost (float): The best cost found by the swarm.
         """
         self.global_best_costs.append(best_cost)
+        if self.sink is not None:
+            self.sink.log_cost(best_cost)
+
+    def log_stop_reason(self, reason: str) -> None:
+        """Log which stopping criterion ended the run early.
+
+        Args:
+            reason (str): Name of the stopping criterion.
+        """
+        self.stop_reason = reason
+
+    def log_throughput(self, evaluations: int, seconds: float) -> None:
+        """Log cost function evaluations done over a stretch of wall-clock time.
+
+        Args:
+            evaluations (int): Number of evaluations.
+            seconds (float): Time they took.
+        """
+        self.evaluations += evaluations
+        self.elapsed_seconds += seconds
+
+    @property
+    def evaluations_per_second(self) -> float:
+        """Throughput of the logged evaluations, 0 if no time was logged."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.evaluations / self.elapsed_seconds
+
+    def log_cache_hits(self, hits: int, lookups: int) -> None:
+        """Log how many cost lookups an evaluation cache answered.
+
+        Args:
+            hits (int): Lookups answered from the cache.
+            lookups (int): All lookups.
+        """
+        self.cache_hits += hits
+        self.cache_lookups += lookups
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of the logged cache lookups that were hits, 0 without lookups."""
+        if self.cache_lookups == 0:
+            return 0.0
+        return self.cache_hits / self.cache_lookups
 
     def increment_iterations(self) -> None:
         """Increment the number of iterations."""
@@ -116,13 +171,59 @@ class SwarmLogger:
                 self.epsilon_reached = True
                 self.iterations_until_epsilon = self.iterations
 
-    def add_particle_epoch(self, particle_positions: list[list[float]]) -> None:
-        """Add the particle positions to the history.
+    def add_particle_epoch(
+        self, particle_positions: list[list[float]] | np.ndarray
+    ) -> None:
+        """Add the particle positions to the history, depending on `history_mode`.
+
+        The positions are copied into a preallocated float64 buffer, which grows
+        geometrically in the `EVERY_K` and `FULL` modes. Both `FIRST_LAST` and
+        `EVERY_K` keep the latest epoch, so the last recorded positions are
+        always those the run ended with.
 
         Args:
-            particle_positions (list[float]): List of particles positions.
+            particle_positions (list[list[float]] | np.ndarray): Positions of all particles.
         """
-        self.particle_positions_history.append(deepcopy(particle_positions))
+        epoch = self._epochs_seen
+        self._epochs_seen += 1
+        if self.sink is not None:
+            self.sink.log_positions(particle_positions)
+
+        match self.history_mode:
+            case HistoryMode.NONE:
+                return
+            case HistoryMode.FIRST_LAST:
+                slot = min(epoch, 1)
+            case HistoryMode.EVERY_K:
+                # The latest epoch is always kept, in a slot the next one
+                # replaces unless it is a multiple of `history_interval`
+                slot = len(self.particle_positions_epochs)
+                epochs = self.particle_positions_epochs
+                if epochs and epochs[-1] % self.history_interval != 0:
+                    slot -= 1
+            case HistoryMode.FULL:
+                slot = len(self.particle_positions_epochs)
+
+        positions = np.asarray(particle_positions, dtype=np.float64)
+        self._reserve_slot(slot, positions.shape)
+        self._positions_buffer[slot] = positions
+
+        if slot == len(self.particle_positions_epochs):
+            self.particle_positions_epochs.append(epoch)
+        else:
+            self.particle_positions_epochs[slot] = epoch
+
+    def _reserve_slot(self, slot: int, shape: tuple[int, ...]) -> None:
+        """Make sure the positions buffer can hold `slot`."""
+        if self._positions_buffer is None:
+            capacity = 2 if self.history_mode is HistoryMode.FIRST_LAST else 16
+            self._positions_buffer = np.empty((capacity, *shape), dtype=np.float64)
+        elif slot >= len(self._positions_buffer):
+            grown = np.empty(
+                (2 * len(self._positions_buffer), *shape), dtype=np.float64
+            )
+            grown[: len(self._positions_buffer)] = self._positions_buffer
+            self._positions_buffer = grown
 
     def add_inertia(self, inertia: float) -> None:
         """Add the inertia value to the history.
@@ -131,3 +232,123 @@ class SwarmLogger:
             inertia (float): The inertia value.
         """
         self.inertia_history.append(inertia)
+        if self.sink is not None:
+            self.sink.log_inertia(inertia)
+
+    def rewind(self) -> None:
+        """Drop what the sink wrote after this logger was saved, see `RunLogWriter.rewind`."""
+        if self.sink is not None:
+            self.sink.rewind()
+
+    def close(self) -> None:
+        """Write what is left in the sink, with a summary of the run."""
+        if self.sink is None:
+            return
+        self.sink.close(
+            {
+                "name": self.name,
+                "epsilon": self.epsilon,
+                "optimum_position": self.optimum_position,
+                "iterations": self.iterations,
+                "iterations_until_epsilon": self.iterations_until_epsilon,
+                "stop_reason": self.stop_reason,
+                "evaluations": self.evaluations,
+                "elapsed_seconds": self.elapsed_seconds,
+                "cache_hits": self.cache_hits,
+                "cache_lookups": self.cache_lookups,
+            }
+        )
+
+
+@dataclass
+class LoggerAggregator:
+    """Fold loggers of independent runs into running statistics, one run at a time.
+
+    Memory does not depend on the number of runs: the cost and inertia curves
+    are reduced to running sums, sums of squares, minima, maxima and streaming
+    quantile estimates, the particle positions history to a running sum.
+    Runs that stopped early are padded with their last value.
+
+    Args:
+        length (int | None): Length of the curves, i.e. the number of logged
+            iterations plus one. Defaults to the length of the first run.
+        quantiles (tuple[float, ...]): Quantiles tracked for the bands.
+    """
+
+    length: int | None = None
+    quantiles: tuple[float, ...] = (0.1, 0.5, 0.9)
+    runs: int = field(init=False, default=0)
+    global_best_costs: RunningStatistics | None = field(init=False, default=None)
+    inertia_history: RunningStatistics | None = field(init=False, default=None)
+    epsilon_reached_runs: int = field(init=False, default=0)
+    evaluations: int = field(init=False, default=0)
+    elapsed_seconds: float = field(init=False, default=0.0)
+    cache_hits: int = field(init=False, default=0)
+    cache_lookups: int = field(init=False, default=0)
+    _template: SwarmLogger | None = field(init=False, default=None, repr=False)
+    _iterations_until_epsilon_sum: int = field(init=False, default=0, repr=False)
+    _positions_sum: np.ndarray | None = field(init=False, default=None, repr=False)
+    _positions_epochs: list[int] = field(init=False, default_factory=list, repr=False)
+
+    def add(self, logger: SwarmLogger) -> None:
+        """Fold the logger of a finished run into the statistics.
+
+        Args:
+            logger (SwarmLogger): Logger of the run.
+        """
+        if self._template is None:
+            self._template = logger.compact()
+            self.length = self.length or len(logger.global_best_costs)
+            self.global_best_costs = RunningStatistics(self.length, self.quantiles)
+            self.inertia_history = RunningStatistics(self.length, self.quantiles)
+
+        self.runs += 1
+        self.global_best_costs.add(logger.global_best_costs)
+        self.inertia_history.add(logger.inertia_history)
+        self.evaluations += logger.evaluations
+        self.elapsed_seconds += logger.elapsed_seconds
+        self.cache_hits += logger.cache_hits
+        self.cache_lookups += logger.cache_lookups
+
+        if logger.iterations_until_epsilon != -1:
+            self.epsilon_reached_runs += 1
+            self._iterations_until_epsilon_sum += logger.iterations_until_epsilon
+
+        history = logger.particle_positions_history
+        if len(history):
+            if self._positions_sum is None or len(history) > len(self._positions_sum):
+                grown = np.zeros_like(history)
+                if self._positions_sum is not None:
+                    grown[: len(self._positions_sum)] = self._positions_sum
+                self._positions_sum = grown
+                self._positions_epochs = logger.particle_positions_epochs[:]
+            self._positions_sum[: len(history)] += history
+
+    def result(self) -> SwarmLogger:
+        """Build a logger holding the mean curves of the folded runs.
+
+        Returns:
+            SwarmLogger: The aggregated logger.
+        """
+        if self._template is None:
+            raise ValueError("No loggers were added.")
+
+        aggregated = copy(self._template)
+        aggregated.global_best_costs = self.global_best_costs.mean().tolist()
+        aggregated.inertia_history = self.inertia_history.mean().tolist()
+        aggregated.epsilon_reached = self.epsilon_reached_runs > 0
+        aggregated.evaluations = self.evaluations // self.runs
+        aggregated.elapsed_seconds = self.elapsed_seconds / self.runs
+        aggregated.cache_hits = self.cache_hits // self.runs
+        aggregated.cache_lookups = self.cache_lookups // self.runs
+        aggregated.iterations_until_epsilon = (
+            int(self._iterations_until_epsilon_sum / self.epsilon_reached_runs)
+            if self.epsilon_reached_runs
+            else -1
+        )
+
+        if self._positions_sum is not None:
+            aggregated._positions_buffer = self._positions_sum / self.runs
+            aggregated.particle_positions_epochs = self._positions_epochs[:]
+
+        return aggregated
@@ -1,15 +1,22 @@
 # type: ignore
 from pathlib import Path
 from typing import Optional, Callable, List
-import matplotlib.pyplot as plt
-from matplotlib.colors import Normalize
-from dataclasses import dataclass
+import hashlib
+import json
+import marshal
+from dataclasses import dataclass, field
+from src.projekt_pop_24z.benchmark_functions.base import (
+    BatchFunction,
+    ScalarBatchAdapter,
+)
 from src.projekt_pop_24z.utils.logger import SwarmLogger
-from matplotlib import cm
 import numpy as np
 from enum import Enum
 
 
+DEFAULT_CONTOUR_CACHE_DIR = Path("plots") / ".contour_cache"
+
+
 class PlotType(Enum):
     GLOBAL_BEST_COSTS = "Global Best Costs"
     STARTING_AND_ENDING_POSITIONS = "Starting and Ending Positions"
@@ -21,12 +28,74 @@ class PlotDescription:
     save_path: str
 
 
+# matplotlib is only imported by the plotting methods, so runs that never
+# plot, e.g. the workers of a sweep, do not pay for importing it
 @dataclass
 class Plotter:
     logger: SwarmLogger
     plot_description: PlotDescription
     bounds: List[List[float]]
     func: Callable[[List[float]], float]
+    batch_func: Optional[BatchFunction] = None
+    resolution: int = 100
+    cache_dir: Optional[Path] = field(default=DEFAULT_CONTOUR_CACHE_DIR)
+
+    def contour_grid(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the function on a `resolution` x `resolution` grid over the first two bounds.
+
+        The grid is evaluated with a single batch call. The values are cached in
+        `cache_dir`, keyed by the function and its code, the grid extent and the
+        resolution, so identical surfaces are computed only once across plots.
+        Lambdas, closures and other callables without a module-level name of
+        their own are never cached.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The X, Y and Z grids.
+        """
+        # Pad the bounds by 10% of their span so particles on the walls stay visible
+        (x_min, x_max), (y_min, y_max) = (
+            (lower - 0.1 * (upper - lower), upper + 0.1 * (upper - lower))
+            for lower, upper in self.bounds[:2]
+        )
+        x_grid = np.linspace(x_min, x_max, self.resolution)
+        y_grid = np.linspace(y_min, y_max, self.resolution)
+        X, Y = np.meshgrid(x_grid, y_grid)
+
+        cache_path = self._contour_cache_path(x_min, x_max, y_min, y_max)
+        if cache_path is not None and cache_path.exists():
+            return X, Y, np.load(cache_path)
+
+        batch_func = self.batch_func or ScalarBatchAdapter(self.func)
+        Z = np.asarray(batch_func(np.column_stack([X.ravel(), Y.ravel()])))
+        Z = Z.reshape(X.shape)
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, Z)
+
+        return X, Y, Z
+
+    def _contour_cache_path(
+        self, x_min: float, x_max: float, y_min: float, y_max: float
+    ) -> Optional[Path]:
+        function_name = getattr(self.func, "__qualname__", "<unnamed>")
+        code = getattr(self.func, "__code__", None)
+        # Lambdas and closures share their names, so they cannot be told apart
+        if self.cache_dir is None or code is None or "<" in function_name:
+            return None
+
+        key = json.dumps(
+            [
+                f"{self.func.__module__}.{function_name}",
+                # Editing the function invalidates its grids
+                hashlib.sha256(marshal.dumps(code)).hexdigest(),
+                [x_min, x_max, y_min, y_max],
+                self.resolution,
+            ]
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.npy"
 
     def plot_starting_and_ending_positions_two_dimensional(self) -> None:
         """
@@ -40,6 +109,11 @@ class Plotter:
             func (Callable[[float, float], float]): The function to plot as a contour background.
             resolution (int): Resolution of the grid for the contour plot.
         """
+        if len(self.logger.particle_positions_history) == 0:
+            raise ValueError(
+                "Starting and ending positions plot needs a logger that records particle positions."
+            )
+
         # Get the starting particle positions
         particle_positions = self.logger.particle_positions_history[0]
         x = [pos[0] for pos in particle_positions]
@@ -49,20 +123,10 @@ class Plotter:
         x_final = [pos[0] for pos in particle_final_positions]
         y_final = [pos[1] for pos in particle_final_positions]
 
-        # Create a grid for the contour plot
-        x_min, x_max = (
-            min(x) + self.bounds[0][0] * 0.1,
-            max(x) + self.bounds[1][1] * 0.1,
-        )
-        y_min, y_max = (
-            min(y) + self.bounds[1][0] * 0.1,
-            max(y) + self.bounds[0][1] * 0.1,
-        )
-        x_grid, y_grid = np.linspace(x_min, x_max, 100), np.linspace(y_min, y_max, 100)
-        X, Y = np.meshgrid(x_grid, y_grid)
+        import matplotlib.pyplot as plt
 
         # Compute the function values over the grid
-        Z = np.array([[self.func([xi, yi]) for xi in x_grid] for yi in y_grid])
+        X, Y, Z = self.contour_grid()
 
         # Plot the contour
         plt.contourf(X, Y, Z, levels=50, cmap="viridis", alpha=0.7)
@@ -88,13 +152,17 @@ class Plotter:
         plt.clf()
 
     def plot_global_best_costs(self) -> None:
+        import matplotlib
+        import matplotlib.pyplot as plt
+        from matplotlib import cm
+        from matplotlib.colors import Normalize
 
         inertia_history = self.logger.inertia_history
         global_best_costs = self.logger.global_best_costs
         iterations = range(len(global_best_costs))
 
         norm = Normalize(min(inertia_history), max(inertia_history))
-        cmap = cm.get_cmap("viridis")  # Properly get the 'viridis' colormap
+        cmap = matplotlib.colormaps["viridis"]
         colors = [cmap(norm(value)) for value in inertia_history]
 
         # Create a figure and axis
@@ -0,0 +1,152 @@
+from __future__ import annotations
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Iterable
+import enum
+import time
+
+
+class Phase(enum.Enum):
+    """Parts of a PSO iteration timed by `PhaseTimer`."""
+
+    VELOCITY = "velocity update"
+    POSITION = "position update"
+    SCREENING = "surrogate screening"
+    EVALUATION = "cost evaluation"
+    BEST_UPDATE = "best update"
+    LOGGING = "logging"
+    STOPPING = "stopping criteria"
+    CHECKPOINT = "checkpoint"
+
+
+class _PhaseContext(AbstractContextManager):
+    __slots__ = ("_timer", "_phase", "_started_at")
+
+    def __init__(self, timer: PhaseTimer, phase: Phase):
+        self._timer = timer
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._timer._current[self._phase] += time.perf_counter() - self._started_at
+
+
+@dataclass
+class PhaseTimer:
+    """Cumulative and per-iteration wall time of each phase of a run.
+
+    Time spent in a phase is accumulated until `end_iteration`, which closes
+    the iteration; the first closed iteration holds the initialisation.
+    """
+
+    totals: dict[Phase, float] = field(
+        default_factory=lambda: dict.fromkeys(Phase, 0.0)
+    )
+    per_iteration: dict[Phase, list[float]] = field(
+        default_factory=lambda: {phase: [] for phase in Phase}
+    )
+    evaluations: int = 0
+    _current: dict[Phase, float] = field(
+        init=False, repr=False, default_factory=lambda: dict.fromkeys(Phase, 0.0)
+    )
+    _contexts: dict[Phase, _PhaseContext] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._contexts = {phase: _PhaseContext(self, phase) for phase in Phase}
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    @property
+    def iterations(self) -> int:
+        return len(self.per_iteration[Phase.EVALUATION])
+
+    def phase(self, phase: Phase) -> AbstractContextManager:
+        """Context manager timing the code it wraps as part of `phase`."""
+        return self._contexts[phase]
+
+    def add_evaluations(self, evaluations: int) -> None:
+        self.evaluations += evaluations
+
+    def end_iteration(self) -> None:
+        """Close the current iteration, adding its times to the totals."""
+        for phase, seconds in self._current.items():
+            self.totals[phase] += seconds
+            self.per_iteration[phase].append(seconds)
+            self._current[phase] = 0.0
+
+    def total_seconds(self) -> float:
+        return sum(self.totals.values())
+
+    def summary(self) -> list[list[object]]:
+        """Rows of phase, total seconds, mean milliseconds per iteration and share."""
+        total = self.total_seconds() or 1.0
+        iterations = self.iterations or 1
+        return [
+            [
+                phase.value,
+                seconds,
+                1000 * seconds / iterations,
+                f"{seconds / total:.1%}",
+            ]
+            for phase, seconds in self.totals.items()
+            if seconds > 0
+        ]
+
+    @classmethod
+    def mean(cls, timers: Iterable[PhaseTimer]) -> PhaseTimer:
+        """Timer of the average run, e.g. over the repetitions of a benchmark.
+
+        Each per-iteration time is averaged over the runs that reached that
+        iteration, since runs can stop early.
+        """
+        timers = list(timers)
+        if not timers:
+            raise ValueError("The timers should not be empty.")
+
+        mean = cls()
+        mean.evaluations = sum(timer.evaluations for timer in timers) // len(timers)
+        for phase in Phase:
+            mean.totals[phase] = sum(t.totals[phase] for t in timers) / len(timers)
+            length = max(len(t.per_iteration[phase]) for t in timers)
+            sums, counts = [0.0] * length, [0] * length
+            for timer in timers:
+                for index, seconds in enumerate(timer.per_iteration[phase]):
+                    sums[index] += seconds
+                    counts[index] += 1
+            mean.per_iteration[phase] = [
+                total / count for total, count in zip(sums, counts)
+            ]
+        return mean
+
+    def __getstate__(self) -> dict:
+        # The contexts refer back to the timer, they are rebuilt on load
+        state = self.__dict__.copy()
+        del state["_contexts"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
+
+class NullPhaseTimer(PhaseTimer):
+    """Timer used when profiling is disabled, all of its methods are no-ops."""
+
+    _context = nullcontext()
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def phase(self, phase: Phase) -> AbstractContextManager:
+        return self._context
+
+    def add_evaluations(self, evaluations: int) -> None:
+        pass
+
+    def end_iteration(self) -> None:
+        pass
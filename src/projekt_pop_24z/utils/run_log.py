@@ -0,0 +1,311 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+import json
+
+import numpy as np
+
+from src.projekt_pop_24z.utils.logger import HistoryMode, SwarmLogger
+
+
+METADATA_FILE = "meta.json"
+
+COST_COLUMN = "global_best_cost"
+INERTIA_COLUMN = "inertia"
+POSITIONS_COLUMN = "positions"
+EPOCHS_COLUMN = "position_epochs"
+
+
+@dataclass
+class _Column:
+    """Append-only raw array file, written in chunks of `chunk_rows` rows."""
+
+    path: Path
+    dtype: str
+    chunk_rows: int
+    shape: tuple[int, ...] | None = None
+    rows: int = 0
+    _buffer: np.ndarray | None = field(default=None, repr=False)
+    _buffered: int = field(default=0, repr=False)
+
+    def append(self, value: float | np.ndarray) -> bool:
+        """Buffer one row, flushing the buffer when it is full.
+
+        Returns:
+            bool: Whether this was the first row of the column.
+        """
+        first = self._buffer is None
+        if first:
+            value = np.asarray(value, dtype=self.dtype)
+            self.shape = value.shape
+            self._buffer = np.empty((self.chunk_rows, *self.shape), dtype=self.dtype)
+
+        self._buffer[self._buffered] = value
+        self._buffered += 1
+        if self._buffered == self.chunk_rows:
+            self.flush()
+        return first
+
+    def flush(self) -> None:
+        if not self._buffered:
+            return
+        # The file is only open while writing, so the column can be pickled
+        with self.path.open("ab") as file:
+            self._buffer[: self._buffered].tofile(file)
+        self.rows += self._buffered
+        self._buffered = 0
+
+    def truncate(self) -> None:
+        """Drop rows written after the `rows` recorded in this column."""
+        if self.path.exists():
+            row_bytes = np.dtype(self.dtype).itemsize * int(np.prod(self.shape or ()))
+            with self.path.open("r+b") as file:
+                file.truncate(self.rows * row_bytes)
+
+
+@dataclass
+class RunLogWriter:
+    """Sink of a `SwarmLogger` streaming every iteration of a run to disk.
+
+    Each logged quantity is a column: a raw array file in `path` that is only
+    ever appended to. Rows are kept in a buffer of `chunk_rows` rows per
+    column and written when it fills up, so memory does not grow with the
+    length of the run. `meta.json` holds the dtypes and row shapes of the
+    columns and, once the run is closed, its summary; `RunLog` memory-maps
+    the columns back.
+
+    A pickled writer (e.g. in a swarm checkpoint) remembers how many rows it
+    had written; `rewind` truncates the columns back to that point, so a
+    resumed run does not leave the rows of the abandoned one behind.
+
+    Args:
+        path (Path): Directory of the run, created if missing.
+        chunk_rows (int): Rows buffered per column before they are written.
+        positions_interval (int | None): Write the particle positions every
+            `positions_interval` epochs, never if None.
+    """
+
+    path: Path
+    chunk_rows: int = 256
+    positions_interval: int | None = 1
+    summary: dict = field(init=False, default_factory=dict)
+    _columns: dict[str, _Column] = field(init=False, repr=False)
+    _epochs_seen: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self):
+        if self.chunk_rows < 1:
+            raise ValueError("Chunk size should be a positive integer.")
+        if self.positions_interval is not None and self.positions_interval < 1:
+            raise ValueError("Positions interval should be a positive integer.")
+
+        self.path = Path(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._columns = {
+            name: _Column(self.path / f"{name}.bin", dtype, self.chunk_rows)
+            for name, dtype in (
+                (COST_COLUMN, "float64"),
+                (INERTIA_COLUMN, "float64"),
+                (POSITIONS_COLUMN, "float64"),
+                (EPOCHS_COLUMN, "int64"),
+            )
+        }
+
+    @classmethod
+    def create(cls, root: Path | str, name: str, **kwargs) -> RunLogWriter:
+        """Writer in a new `<name>-<number>` directory of `root`.
+
+        Creating the directory is atomic, so concurrent runs, e.g. in a
+        process pool, never share a directory.
+
+        Args:
+            root (Path | str): Directory holding the runs.
+            name (str): Prefix of the run directory.
+            **kwargs: Passed to the writer.
+
+        Returns:
+            RunLogWriter: The writer.
+        """
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        number = sum(1 for _ in root.glob(f"{name}-*"))
+        while True:
+            path = root / f"{name}-{number:05d}"
+            try:
+                path.mkdir()
+            except FileExistsError:
+                number += 1
+            else:
+                return cls(path, **kwargs)
+
+    def log_cost(self, cost: float) -> None:
+        self._append(COST_COLUMN, cost)
+
+    def log_inertia(self, inertia: float) -> None:
+        self._append(INERTIA_COLUMN, inertia)
+
+    def log_positions(self, positions: np.ndarray) -> None:
+        epoch = self._epochs_seen
+        self._epochs_seen += 1
+        if self.positions_interval is None or epoch % self.positions_interval:
+            return
+        self._append(POSITIONS_COLUMN, positions)
+        self._append(EPOCHS_COLUMN, epoch)
+
+    def flush(self) -> None:
+        """Write the buffered rows of all columns."""
+        for column in self._columns.values():
+            column.flush()
+
+    def close(self, summary: dict) -> None:
+        """Flush the columns and store the summary of the finished run.
+
+        Args:
+            summary (dict): JSON-serialisable description of the run.
+        """
+        self.flush()
+        self.summary = summary
+        self._write_metadata()
+
+    def rewind(self) -> None:
+        """Drop the rows written after this writer was pickled, to continue from there."""
+        for column in self._columns.values():
+            column.truncate()
+        self._write_metadata()
+
+    def _append(self, name: str, value: float | np.ndarray) -> None:
+        if self._columns[name].append(value):
+            self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        metadata = {
+            "columns": {
+                name: {"dtype": column.dtype, "shape": list(column.shape)}
+                for name, column in self._columns.items()
+                if column.shape is not None
+            },
+            "summary": self.summary,
+        }
+        (self.path / METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+
+    def __getstate__(self) -> dict:
+        self.flush()
+        state = self.__dict__.copy()
+        # Only the shapes and row counts are needed to continue the columns
+        state["_columns"] = {
+            name: _Column(
+                column.path, column.dtype, column.chunk_rows, column.shape, column.rows
+            )
+            for name, column in self._columns.items()
+        }
+        return state
+
+
+@dataclass
+class RunLog:
+    """Columns of a run written by `RunLogWriter`, memory-mapped read-only.
+
+    Nothing is read until a column is accessed, and then only the pages that
+    are touched, so many runs can be opened and analysed at once.
+
+    Args:
+        path (Path): Directory of the run.
+        metadata (dict): Contents of its `meta.json`.
+    """
+
+    path: Path
+    metadata: dict
+
+    @classmethod
+    def open(cls, path: Path | str) -> RunLog:
+        path = Path(path)
+        return cls(path, json.loads((path / METADATA_FILE).read_text()))
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def summary(self) -> dict:
+        """Summary of the run, empty if it was not closed."""
+        return self.metadata["summary"]
+
+    def column(self, name: str) -> np.ndarray:
+        """Memory-map a column, shaped `(rows, *row_shape)`.
+
+        A trailing partial row, left by a run that crashed mid-write, is ignored.
+        """
+        if name not in self.metadata["columns"]:
+            return np.empty(0)
+
+        description = self.metadata["columns"][name]
+        dtype = np.dtype(description["dtype"])
+        shape = tuple(description["shape"])
+        path = self.path / f"{name}.bin"
+        row_bytes = dtype.itemsize * int(np.prod(shape))
+        rows = path.stat().st_size // row_bytes if path.exists() else 0
+
+        if rows == 0:
+            return np.empty((0, *shape), dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(rows, *shape))
+
+    @property
+    def global_best_costs(self) -> np.ndarray:
+        return self.column(COST_COLUMN)
+
+    @property
+    def inertia_history(self) -> np.ndarray:
+        return self.column(INERTIA_COLUMN)
+
+    @property
+    def particle_positions_history(self) -> np.ndarray:
+        """Written particle positions, shaped `(epochs, swarm_size, dimensions)`."""
+        return self.column(POSITIONS_COLUMN)
+
+    @property
+    def particle_positions_epochs(self) -> np.ndarray:
+        return self.column(EPOCHS_COLUMN)
+
+    def to_logger(self) -> SwarmLogger:
+        """Logger backed by the memory-mapped columns, e.g. for the `Plotter`.
+
+        Returns:
+            SwarmLogger: The logger, its histories are read-only.
+        """
+        summary = self.summary
+        logger = SwarmLogger(
+            name=summary.get("name", self.name),
+            epsilon=summary.get("epsilon", -1),
+            optimum_position=summary.get("optimum_position", 0),
+            global_best_costs=self.global_best_costs,
+            inertia_history=self.inertia_history,
+            history_mode=HistoryMode.FULL,
+        )
+        logger.iterations = summary.get("iterations", len(logger.global_best_costs) - 1)
+        logger.iterations_until_epsilon = summary.get("iterations_until_epsilon", -1)
+        logger.epsilon_reached = logger.iterations_until_epsilon != -1
+        logger.stop_reason = summary.get("stop_reason")
+        logger.evaluations = summary.get("evaluations", 0)
+        logger.elapsed_seconds = summary.get("elapsed_seconds", 0.0)
+        logger.cache_hits = summary.get("cache_hits", 0)
+        logger.cache_lookups = summary.get("cache_lookups", 0)
+
+        history = self.particle_positions_history
+        if len(history):
+            logger._positions_buffer = history
+            logger.particle_positions_epochs = self.particle_positions_epochs.tolist()
+        return logger
+
+
+def open_run_logs(root: Path | str) -> Iterator[RunLog]:
+    """Open every run written under `root`, in the order of their directories.
+
+    Args:
+        root (Path | str): Directory holding the runs.
+
+    Yields:
+        RunLog: The runs, opened one at a time.
+    """
+    for path in sorted(Path(root).iterdir()):
+        if (path / METADATA_FILE).exists():
+            yield RunLog.open(path)
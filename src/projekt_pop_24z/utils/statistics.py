@@ -0,0 +1,171 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+
+@dataclass
+class P2Quantile:
+    """Streaming estimate of a quantile of each column, using the P² algorithm.
+
+    Keeps five markers per column, so memory does not depend on the number of
+    added rows. The first five rows are kept as is and give exact quantiles.
+
+    Args:
+        quantile (float): The quantile to estimate, in [0, 1].
+        length (int): Number of columns.
+    """
+
+    quantile: float
+    length: int
+    count: int = field(init=False, default=0)
+    _heights: np.ndarray = field(init=False, repr=False)
+    _positions: np.ndarray = field(init=False, repr=False)
+    _desired: np.ndarray = field(init=False, repr=False)
+    _increments: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not 0 <= self.quantile <= 1:
+            raise ValueError("Quantile should be in the range [0, 1].")
+
+        p = self.quantile
+        self._heights = np.empty((5, self.length), dtype=np.float64)
+        self._positions = np.tile(np.arange(5.0)[:, None], (1, self.length))
+        self._desired = np.array([0, 2 * p, 4 * p, 2 + 2 * p, 4])
+        self._increments = np.array([0, p / 2, p, (1 + p) / 2, 1])
+
+    def add(self, row: np.ndarray) -> None:
+        """Add one observation for every column."""
+        if self.count < 5:
+            self._heights[self.count] = row
+            self.count += 1
+            if self.count == 5:
+                self._heights.sort(axis=0)
+            return
+
+        self.count += 1
+        q, n = self._heights, self._positions
+
+        np.minimum(q[0], row, out=q[0])
+        np.maximum(q[4], row, out=q[4])
+
+        # k is the cell [q_k, q_k+1) the observation falls into
+        k = np.sum(row >= q[1:4], axis=0)
+        n += np.arange(5)[:, None] > k
+        self._desired += self._increments
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i in (1, 2, 3):
+                d = self._desired[i] - n[i]
+                move = ((d >= 1) & (n[i + 1] - n[i] > 1)) | (
+                    (d <= -1) & (n[i - 1] - n[i] < -1)
+                )
+                if not move.any():
+                    continue
+
+                s = np.sign(d)
+                parabolic = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                neighbour_q = np.where(s > 0, q[i + 1], q[i - 1])
+                neighbour_n = np.where(s > 0, n[i + 1], n[i - 1])
+                linear = q[i] + s * (neighbour_q - q[i]) / (neighbour_n - n[i])
+
+                in_order = (q[i - 1] < parabolic) & (parabolic < q[i + 1])
+                q[i] = np.where(move, np.where(in_order, parabolic, linear), q[i])
+                n[i] = np.where(move, n[i] + s, n[i])
+
+    def value(self) -> np.ndarray:
+        """Current quantile estimate of each column."""
+        if self.count == 0:
+            raise ValueError("No observations were added.")
+        if self.count < 5:
+            return np.quantile(self._heights[: self.count], self.quantile, axis=0)
+        return self._heights[2].copy()
+
+
+@dataclass
+class RunningStatistics:
+    """Per-index statistics of equally long series, folded in one series at a time.
+
+    Memory is constant in the number of added series. Series shorter than
+    `length` are padded with their last value. The mean and variance are kept
+    with Welford's update, which stays accurate for values with a large
+    offset, e.g. costs near a large non-zero optimum.
+
+    Args:
+        length (int): Length of the series.
+        quantiles (Sequence[float]): Quantiles to estimate.
+    """
+
+    length: int
+    quantiles: Sequence[float] = (0.1, 0.5, 0.9)
+    count: int = field(init=False, default=0)
+    _mean: np.ndarray = field(init=False, repr=False)
+    # Sum of squared deviations from the mean
+    _m2: np.ndarray = field(init=False, repr=False)
+    _min: np.ndarray = field(init=False, repr=False)
+    _max: np.ndarray = field(init=False, repr=False)
+    _quantile_estimators: dict[float, P2Quantile] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._mean = np.zeros(self.length)
+        self._m2 = np.zeros(self.length)
+        self._min = np.full(self.length, np.inf)
+        self._max = np.full(self.length, -np.inf)
+        self._quantile_estimators = {
+            q: P2Quantile(quantile=q, length=self.length) for q in self.quantiles
+        }
+
+    def add(self, series: Sequence[float]) -> None:
+        """Fold one series into the statistics.
+
+        Args:
+            series (Sequence[float]): The series, at most `length` long.
+        """
+        if len(series) > self.length:
+            raise ValueError(
+                f"Series of length {len(series)} is longer than {self.length}."
+            )
+        if len(series) == 0:
+            raise ValueError("Series should not be empty.")
+
+        row = np.empty(self.length)
+        row[: len(series)] = series
+        row[len(series) :] = series[-1]
+
+        self.count += 1
+        delta = row - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (row - self._mean)
+        np.minimum(self._min, row, out=self._min)
+        np.maximum(self._max, row, out=self._max)
+        for estimator in self._quantile_estimators.values():
+            estimator.add(row)
+
+    def mean(self) -> np.ndarray:
+        return self._mean.copy()
+
+    def std(self) -> np.ndarray:
+        """Population standard deviation of each index."""
+        return np.sqrt(self._m2 / self.count)
+
+    def min(self) -> np.ndarray:
+        return self._min.copy()
+
+    def max(self) -> np.ndarray:
+        return self._max.copy()
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Estimated quantile `q` of each index; `q` must be one of `quantiles`."""
+        if q not in self._quantile_estimators:
+            raise ValueError(
+                f"Quantile {q} is not tracked, choose from {self.quantiles}."
+            )
+        return self._quantile_estimators[q].value()
+
+    def band(self, lower: float, upper: float) -> tuple[np.ndarray, np.ndarray]:
+        """Lower and upper quantile curves, e.g. for a shaded plot band."""
+        return self.quantile(lower), self.quantile(upper)
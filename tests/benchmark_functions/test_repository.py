@@ -0,0 +1,23 @@
+from src.projekt_pop_24z.benchmark_functions.base import ScalarBatchAdapter
+from src.projekt_pop_24z.benchmark_functions.repository import ALL_FUNCS
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("benchmark_function", ALL_FUNCS, ids=lambda f: f.name)
+def test_batch_function_matches_scalar_function(benchmark_function):
+    positions = np.random.default_rng(0).uniform(-5, 5, size=(16, 7))
+
+    batch_costs = benchmark_function.batch_function(positions)
+    scalar_costs = [benchmark_function.function(p) for p in positions.tolist()]
+
+    assert batch_costs.shape == (16,)
+    np.testing.assert_allclose(batch_costs, scalar_costs)
+
+
+def test_scalar_batch_adapter():
+    adapter = ScalarBatchAdapter(sum)
+
+    costs = adapter(np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+    np.testing.assert_array_equal(costs, [3.0, 7.0])
@@ -0,0 +1,96 @@
+from src.projekt_pop_24z.benchmark_functions.slow import SlowFunction
+from src.projekt_pop_24z.benchmark_functions.sphere import sphere_function
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.evaluators import Evaluator, ThreadPoolEvaluator
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.stopping import EvaluationBudget
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+import pytest
+import threading
+
+
+def make_swarm(
+    evaluator: Evaluator | None = None, cost_function=sphere_function, **kwargs
+) -> AsynchronousSwarm:
+    return AsynchronousSwarm(
+        swarm_size=8,
+        bounds=[[-5.0, 5.0]] * 2,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=cost_function,
+        logger=SwarmLogger(epsilon=-1, name="async", optimum_position=0),
+        rng=5,
+        evaluator=evaluator,
+        **kwargs,
+    )
+
+
+def run(swarm: Swarm, iterations: int = 30) -> Swarm:
+    swarm.run_optimization(
+        iterations=iterations,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+    )
+    return swarm
+
+
+def test_converges_and_counts_evaluations():
+    swarm = run(make_swarm())
+
+    assert swarm.global_best_cost < 1e-2, f"Got {swarm.global_best_cost}"
+    assert swarm.global_best_cost == sphere_function(swarm.global_best_position)
+    assert swarm.evaluations == 8 * (30 + 1), f"Got {swarm.evaluations}"
+    assert len(swarm.logger.global_best_costs) == 31
+    assert swarm.logger.global_best_costs == sorted(
+        swarm.logger.global_best_costs, reverse=True
+    )
+
+
+def test_serial_runs_are_reproducible():
+    assert run(make_swarm()).global_best_cost == run(make_swarm()).global_best_cost
+
+
+def test_thread_pool_run_logs_throughput():
+    function = SlowFunction(sphere_function, delay=0.001)
+    with ThreadPoolEvaluator(max_workers=4) as evaluator:
+        swarm = run(make_swarm(evaluator, function), iterations=10)
+
+    assert swarm.evaluations == 8 * (10 + 1)
+    assert swarm.logger.evaluations == 8 * 10
+    assert swarm.logger.evaluations_per_second > 0
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_evaluations_left_in_flight_are_counted(threads):
+    calls = []
+    lock = threading.Lock()
+
+    def counted(position):
+        with lock:
+            calls.append(position)
+        return sphere_function(position)
+
+    evaluator = ThreadPoolEvaluator(max_workers=2) if threads else None
+    swarm = make_swarm(
+        evaluator, counted, stopping_criteria=[EvaluationBudget(max_evaluations=50)]
+    )
+    run(swarm)
+    if evaluator is not None:
+        evaluator.close()
+
+    assert swarm.logger.stop_reason == "evaluation budget exhausted"
+    assert swarm.current_iteration == 6
+    # Particles already resubmitted for the next iteration count as well
+    assert swarm.evaluations == len(calls) >= 8 * (6 + 1)
+    assert not swarm._in_flight
+
+
+def test_checkpoint_while_evaluations_are_in_flight(tmp_path):
+    path = tmp_path / "async.pkl"
+    with ThreadPoolEvaluator(max_workers=4) as evaluator:
+        run(make_swarm(evaluator, checkpoint_path=path, checkpoint_interval=0), 5)
+
+    resumed = AsynchronousSwarm.load_checkpoint(path)
+    assert resumed.current_iteration == 5
+    assert resumed.global_best_cost == sphere_function(resumed.global_best_position)
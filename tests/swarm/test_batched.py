@@ -0,0 +1,68 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Rastrigin
+from src.projekt_pop_24z.swarm.batched import BatchedSwarms
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+from src.projekt_pop_24z.utils.logger import HistoryMode, SwarmLogger
+import numpy as np
+import pytest
+
+
+def make_logger() -> SwarmLogger:
+    return SwarmLogger(
+        epsilon=1e-3,
+        name="batched",
+        optimum_position=0,
+        history_mode=HistoryMode.FULL,
+    )
+
+
+ARGS = dict(
+    swarm_size=7,
+    bounds=[[-5.12, 5.12]] * 3,
+    dimensions=3,
+    task=Task.MINIMIZE,
+    cost_function=Rastrigin.function,
+    dynamic_inertia=True,
+    inertia_decay=1.002,
+)
+RUN = dict(
+    iterations=20, initial_inertia=0.8, cognitive_constant=1.5, social_constant=1.5
+)
+
+
+@pytest.mark.parametrize("batch_cost_function", [None, Rastrigin.batch_function])
+def test_each_swarm_matches_a_vectorized_swarm(batch_cost_function):
+    seeds = [3, 1, 4, 1, 5]
+    swarms = BatchedSwarms(
+        **ARGS,
+        loggers=[make_logger() for _ in seeds],
+        batch_cost_function=batch_cost_function,
+        seeds=seeds,
+    )
+    best_positions = swarms.run_optimization(**RUN)
+
+    for run, seed in enumerate(seeds):
+        single = VectorizedSwarm(
+            **ARGS,
+            logger=make_logger(),
+            batch_cost_function=batch_cost_function,
+            rng=seed,
+        )
+        single.run_optimization(**RUN)
+
+        logger = swarms.loggers[run]
+        assert best_positions[run].tolist() == single.global_best_position
+        assert logger.global_best_costs == single.logger.global_best_costs
+        assert logger.inertia_history == single.logger.inertia_history
+        assert logger.iterations_until_epsilon == single.logger.iterations_until_epsilon
+        np.testing.assert_array_equal(
+            logger.particle_positions_history,
+            single.logger.particle_positions_history,
+        )
+
+    assert swarms.evaluations == len(seeds) * 7 * (20 + 1)
+
+
+def test_seeds_have_to_match_the_loggers():
+    with pytest.raises(ValueError):
+        BatchedSwarms(**ARGS, loggers=[make_logger()], seeds=[1, 2])
@@ -0,0 +1,104 @@
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.boundary import (
+    Absorb,
+    BoundaryStrategy,
+    Clamp,
+    Periodic,
+    RandomReinit,
+    Reflect,
+)
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import numpy as np
+import pytest
+
+
+LOWER = np.array([-5.0, 0.0])
+UPPER = np.array([5.0, 1.0])
+
+
+def apply(strategy: BoundaryStrategy, positions, velocities):
+    positions = np.array(positions, dtype=np.float64)
+    velocities = np.array(velocities, dtype=np.float64)
+    strategy.apply(positions, velocities, LOWER, UPPER, np.random.default_rng(0))
+    return positions, velocities
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected_positions", "expected_velocities"),
+    [
+        (Clamp(), [[5.0, 0.5], [-5.0, 1.0]], [[2.0, 0.1], [-3.0, 0.7]]),
+        (Absorb(), [[5.0, 0.5], [-5.0, 1.0]], [[0.0, 0.1], [0.0, 0.0]]),
+        (Reflect(), [[4.5, 0.5], [3.0, 0.8]], [[-2.0, 0.1], [3.0, -0.7]]),
+        (Periodic(), [[-4.5, 0.5], [-3.0, 0.2]], [[2.0, 0.1], [-3.0, 0.7]]),
+    ],
+)
+def test_strategies(strategy, expected_positions, expected_velocities):
+    positions, velocities = apply(
+        strategy, [[5.5, 0.5], [-13.0, 1.2]], [[2.0, 0.1], [-3.0, 0.7]]
+    )
+
+    np.testing.assert_allclose(positions, expected_positions)
+    np.testing.assert_allclose(velocities, expected_velocities)
+
+
+def test_random_reinit_only_redraws_the_coordinates_outside():
+    positions, velocities = apply(
+        RandomReinit(), [[5.5, 0.5], [-1.0, 1.2]], [[2.0, 0.1], [-3.0, 0.7]]
+    )
+
+    assert positions[0, 1] == 0.5 and positions[1, 0] == -1.0
+    assert -5 <= positions[0, 0] <= 5 and 0 <= positions[1, 1] <= 1
+    np.testing.assert_array_equal(velocities, [[2.0, 0.1], [-3.0, 0.7]])
+
+
+@pytest.mark.parametrize(
+    "strategy", [Clamp(), Absorb(), Reflect(), Periodic(), RandomReinit()]
+)
+def test_strategies_apply_to_a_single_particle(strategy):
+    positions, _ = apply(strategy, [7.0, -0.5], [2.0, -1.0])
+
+    assert np.all((LOWER <= positions) & (positions <= UPPER))
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+@pytest.mark.parametrize("strategy", [Reflect(), Periodic(), RandomReinit()])
+def test_swarm_stays_in_bounds_with_limited_velocity(swarm_class, strategy):
+    swarm = swarm_class(
+        swarm_size=10,
+        bounds=[[-5.0, 5.0], [-5.0, 5.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=lambda position: sum((x - 3.0) ** 2 for x in position),
+        logger=SwarmLogger(epsilon=-1, name="boundary", optimum_position=0),
+        rng=0,
+        boundary=strategy,
+        v_max=1.0,
+    )
+    swarm.run_optimization(
+        iterations=30, initial_inertia=0.9, cognitive_constant=2, social_constant=2
+    )
+
+    positions = swarm.positions_array()
+    velocities = (
+        swarm.velocities
+        if swarm_class is VectorizedSwarm
+        else np.array([particle.velocity for particle in swarm.particles])
+    )
+    assert np.all(np.abs(positions) <= 5)
+    assert np.all(np.abs(velocities) <= 1.0)
+    assert swarm.global_best_cost < 0.1
+
+
+def test_v_max_has_to_be_positive():
+    with pytest.raises(ValueError):
+        Swarm(
+            swarm_size=10,
+            bounds=[[-5.0, 5.0]],
+            dimensions=1,
+            task=Task.MINIMIZE,
+            cost_function=lambda position: position[0] ** 2,
+            logger=SwarmLogger(epsilon=-1, name="boundary", optimum_position=0),
+            v_max=0.0,
+        )
@@ -0,0 +1,84 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Sphere
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.cache import EvaluationCache
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+import numpy as np
+import pytest
+
+
+class CountingSphere:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        self.calls += len(positions)
+        return Sphere.batch_function(positions)
+
+
+def test_near_duplicates_share_an_entry():
+    cache = EvaluationCache(tolerance=1e-6)
+    function = CountingSphere()
+    positions = np.array([[1.0, 2.0], [1.0 + 1e-8, 2.0], [3.0, 4.0], [1.0, 2.0]])
+
+    costs = cache.evaluate(positions, function)
+
+    np.testing.assert_array_equal(costs, [5.0, 5.0, 25.0, 5.0])
+    assert function.calls == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    cache.evaluate(positions[2:3], function)
+    assert function.calls == 2 and cache.hits == 3
+
+
+def test_exact_keys_without_tolerance():
+    cache = EvaluationCache(tolerance=0)
+    assert cache.get([1.0, 2.0]) is None
+    cache.put([1.0, 2.0], 5.0)
+    assert cache.get([1.0, 2.0]) == 5.0
+    assert cache.get([1.0, 2.0 + 1e-12]) is None
+
+
+def test_least_recently_used_is_evicted():
+    cache = EvaluationCache(tolerance=0, max_size=2)
+    cache.put([1.0], 1.0)
+    cache.put([2.0], 2.0)
+    cache.get([1.0])
+    cache.put([3.0], 3.0)
+
+    assert len(cache) == 2
+    assert cache.get([2.0]) is None
+    assert cache.get([1.0]) == 1.0
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        EvaluationCache(tolerance=-1)
+    with pytest.raises(ValueError):
+        EvaluationCache(max_size=0)
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+def test_collapsed_swarm_hits_the_cache(swarm_class):
+    swarm = swarm_class(
+        swarm_size=5,
+        # Every move beyond the narrow bounds is clamped onto them
+        bounds=[[0.0, 1e-3]] * 2,
+        dimensions=2,
+        task=Task.MAXIMIZE,
+        cost_function=Sphere.function,
+        logger=SwarmLogger(epsilon=-1, name="Sphere", optimum_position=0),
+        batch_cost_function=Sphere.batch_function,
+        rng=0,
+        cache=EvaluationCache(tolerance=1e-9),
+    )
+    swarm.run_optimization(
+        iterations=30, initial_inertia=0.9, cognitive_constant=2.0, social_constant=2.0
+    )
+
+    assert swarm.evaluations < 5 * 31
+    assert swarm.evaluations == swarm.cache.misses
+    assert swarm.global_best_cost == 2e-6
+    assert 0 < swarm.logger.cache_hit_rate < 1
+    assert swarm.logger.cache_lookups == 5 * 30
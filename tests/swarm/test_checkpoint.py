@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+
+from src.projekt_pop_24z.benchmark_functions.sphere import sphere_function
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.constraints import Constraints
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.stopping import StoppingCriterion
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import pickle
+import pytest
+
+
+class Crash(Exception):
+    pass
+
+
+@dataclass
+class CrashingSphere:
+    crash_after: int
+    calls: int = 0
+
+    def __call__(self, position: list[float]) -> float:
+        self.calls += 1
+        if self.calls > self.crash_after:
+            raise Crash()
+        return sphere_function(position)
+
+
+@dataclass
+class CountingResumes(StoppingCriterion):
+    resumes: int = 0
+
+    def resume(self, swarm: Swarm) -> None:
+        self.resumes += 1
+
+    def should_stop(self, swarm: Swarm) -> bool:
+        return False
+
+
+def make_swarm(swarm_class, cost_function, checkpoint_path=None) -> Swarm:
+    return swarm_class(
+        swarm_size=6,
+        bounds=[[-5.0, 5.0]] * 3,
+        dimensions=3,
+        task=Task.MINIMIZE,
+        cost_function=cost_function,
+        logger=SwarmLogger(epsilon=-1, name="checkpoint", optimum_position=0),
+        dynamic_inertia=True,
+        inertia_decay=1.001,
+        rng=7,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=0,
+        stopping_criteria=[CountingResumes()],
+    )
+
+
+def run(swarm: Swarm) -> None:
+    swarm.run_optimization(
+        iterations=20, initial_inertia=0.8, cognitive_constant=2.0, social_constant=2.0
+    )
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+def test_resume_is_bit_identical(tmp_path, swarm_class):
+    reference = make_swarm(swarm_class, sphere_function)
+    run(reference)
+
+    checkpoint = tmp_path / "swarm.ckpt"
+    crashing = make_swarm(
+        swarm_class, CrashingSphere(crash_after=6 * 12 + 3), checkpoint
+    )
+    with pytest.raises(Crash):
+        run(crashing)
+
+    resumed = Swarm.resume(checkpoint, cost_function=sphere_function)
+
+    assert type(resumed) is swarm_class
+    assert resumed.current_iteration == 20
+    assert resumed.evaluations == reference.evaluations
+    assert resumed.global_best_position == reference.global_best_position
+    assert resumed.logger.global_best_costs == reference.logger.global_best_costs
+    assert resumed.logger.inertia_history == reference.logger.inertia_history
+    assert resumed.stopping_criteria[0].resumes == 1
+
+
+def test_unpicklable_cost_function_must_be_passed_to_resume(tmp_path):
+    checkpoint = tmp_path / "swarm.ckpt"
+    run(make_swarm(Swarm, lambda position: sum(x**2 for x in position), checkpoint))
+
+    with pytest.raises(ValueError):
+        Swarm.load_checkpoint(checkpoint)
+
+    swarm = Swarm.load_checkpoint(checkpoint, cost_function=sphere_function)
+    assert swarm.current_iteration == 20
+
+
+def test_unpicklable_swarm_warns_and_keeps_running(tmp_path):
+    checkpoint = tmp_path / "swarm.ckpt"
+    swarm = make_swarm(Swarm, sphere_function, checkpoint)
+    swarm.constraints = Constraints([lambda positions: positions[:, 0] - 1.0])
+
+    with pytest.warns(RuntimeWarning, match="could not be checkpointed"):
+        run(swarm)
+
+    assert swarm.current_iteration == 20
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        swarm.save_checkpoint(checkpoint)
+    assert list(tmp_path.iterdir()) == []
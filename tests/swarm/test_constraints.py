@@ -0,0 +1,95 @@
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.constraints import ConstraintHandling, Constraints
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.topology import Ring
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import numpy as np
+import pytest
+
+
+def x_at_least_one(positions: np.ndarray) -> np.ndarray:
+    return 1 - positions[:, 0]
+
+
+def test_violations():
+    constraints = Constraints([x_at_least_one, lambda p: p[:, 1] - 2], tolerance=0.1)
+
+    violations = constraints.violations(np.array([[2.0, 0.0], [0.5, 3.0], [0.95, 2]]))
+
+    np.testing.assert_allclose(violations, [0.0, 0.4 + 0.9, 0.0])
+
+
+def test_feasibility_rules_rank():
+    constraints = Constraints([x_at_least_one])
+    costs = np.array([3.0, 5.0, -10.0, -20.0])
+    violations = np.array([0.0, 0.0, 0.5, 0.2])
+
+    ranked, worst_feasible = constraints.rank(costs, violations, None)
+
+    # Feasible by cost, then infeasible by violation
+    assert worst_feasible == 5.0
+    assert list(np.argsort(ranked)) == [0, 1, 3, 2]
+    ranked, worst_feasible = constraints.rank(costs[2:], violations[2:], None)
+    np.testing.assert_allclose(ranked, [0.5, 0.2])
+    assert worst_feasible is None
+
+
+def test_penalty():
+    constraints = Constraints(
+        [x_at_least_one], handling=ConstraintHandling.PENALTY, penalty=10
+    )
+
+    np.testing.assert_allclose(
+        constraints.penalize(np.array([1.0, 2.0]), np.array([0.0, 0.5])), [1.0, 7.0]
+    )
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+@pytest.mark.parametrize("handling", list(ConstraintHandling))
+@pytest.mark.parametrize("task", list(Task))
+def test_swarm_finds_constrained_optimum(swarm_class, handling, task):
+    sign = 1 if task is Task.MINIMIZE else -1
+    swarm = swarm_class(
+        swarm_size=20,
+        bounds=[[-5.0, 5.0], [-5.0, 5.0]],
+        dimensions=2,
+        task=task,
+        cost_function=lambda position: sign * sum(x**2 for x in position),
+        logger=SwarmLogger(epsilon=-1, name="constraints", optimum_position=0),
+        rng=1,
+        constraints=Constraints([x_at_least_one], handling=handling),
+    )
+    best = swarm.run_optimization(
+        iterations=100, initial_inertia=0.7, cognitive_constant=1.5, social_constant=1.5
+    )
+
+    assert best[0] >= 1
+    assert best == pytest.approx([1, 0], abs=1e-2)
+    assert swarm.global_best_cost == pytest.approx(sign * 1, abs=1e-2)
+
+
+def test_infeasible_bests_follow_the_worst_feasible_cost():
+    # Only a sliver of the space is feasible, most particles start infeasible
+    swarm = Swarm(
+        swarm_size=10,
+        bounds=[[-5.0, 5.0], [-5.0, 5.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=lambda position: sum(x**2 for x in position),
+        logger=SwarmLogger(epsilon=-1, name="constraints", optimum_position=0),
+        rng=0,
+        topology=Ring(),
+        constraints=Constraints([lambda p: 3 - p[:, 0]]),
+    )
+    swarm.run_optimization(
+        iterations=2, initial_inertia=0.7, cognitive_constant=1.5, social_constant=1.5
+    )
+
+    positions = np.array([p.personal_best_position for p in swarm.particles])
+    costs = np.array([p.personal_best_cost for p in swarm.particles])
+    feasible = positions[:, 0] >= 3
+    assert feasible.any() and not feasible.all()
+    # Every infeasible personal best ranks behind every feasible one
+    assert costs[~feasible].min() > costs[feasible].max()
+    assert swarm.global_best_position[0] >= 3
@@ -0,0 +1,91 @@
+from src.projekt_pop_24z.benchmark_functions.slow import AsyncSlowFunction
+from src.projekt_pop_24z.benchmark_functions.sphere import sphere_function
+from src.projekt_pop_24z.swarm.evaluators import (
+    AsyncioEvaluator,
+    ProcessPoolEvaluator,
+    SerialEvaluator,
+    ThreadPoolEvaluator,
+)
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+import numpy as np
+import pytest
+import threading
+
+
+POSITIONS = np.random.default_rng(0).uniform(-5, 5, size=(8, 3))
+
+
+@pytest.mark.parametrize(
+    "evaluator",
+    [
+        SerialEvaluator(),
+        ThreadPoolEvaluator(max_workers=4),
+        ProcessPoolEvaluator(max_workers=2),
+        AsyncioEvaluator(max_concurrency=4),
+    ],
+)
+def test_evaluators_match_serial(evaluator):
+    expected = np.array([sphere_function(p) for p in POSITIONS.tolist()])
+    with evaluator:
+        np.testing.assert_allclose(
+            evaluator.evaluate(sphere_function, POSITIONS), expected
+        )
+
+
+def test_thread_pool_overlaps_slow_evaluations():
+    lock = threading.Lock()
+    # Every call waits for all the others, which only returns if they overlap
+    barrier = threading.Barrier(len(POSITIONS), timeout=10)
+    running = peak = 0
+
+    def function(position: list[float]) -> float:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        barrier.wait()
+        with lock:
+            running -= 1
+        return sphere_function(position)
+
+    with ThreadPoolEvaluator(max_workers=len(POSITIONS)) as evaluator:
+        costs = evaluator.evaluate(function, POSITIONS)
+
+    assert peak == len(POSITIONS)
+    np.testing.assert_allclose(costs, [sphere_function(p) for p in POSITIONS.tolist()])
+
+
+def test_asyncio_evaluator_awaits_coroutine_functions():
+    function = AsyncSlowFunction(sphere_function, delay=0.01)
+    with AsyncioEvaluator() as evaluator:
+        costs = evaluator.evaluate(function, POSITIONS)
+    np.testing.assert_allclose(costs, [sphere_function(p) for p in POSITIONS.tolist()])
+
+
+def test_swarm_with_evaluator_matches_default():
+    def run(evaluator):
+        swarm = Swarm(
+            swarm_size=6,
+            bounds=[[-5.0, 5.0]] * 2,
+            dimensions=2,
+            task=Task.MINIMIZE,
+            cost_function=sphere_function,
+            logger=SwarmLogger(epsilon=1e-5, name="test", optimum_position=0),
+            rng=3,
+            evaluator=evaluator,
+        )
+        swarm.run_optimization(
+            iterations=5,
+            initial_inertia=0.7,
+            cognitive_constant=2.0,
+            social_constant=2.0,
+        )
+        return swarm
+
+    with ThreadPoolEvaluator(max_workers=3) as evaluator:
+        threaded = run(evaluator)
+    serial = run(None)
+
+    assert threaded.global_best_cost == serial.global_best_cost
+    assert threaded.evaluations == serial.evaluations == 6 * 6
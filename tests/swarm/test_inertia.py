@@ -0,0 +1,169 @@
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.inertia import (
+    Chaotic,
+    DiversityFeedback,
+    InertiaStrategy,
+    LinearDecreasing,
+    SuccessRate,
+    SwarmStatistics,
+)
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import numpy as np
+import pytest
+
+
+def run_swarm(
+    swarm_class: type[Swarm], strategy: InertiaStrategy, iterations: int = 50
+) -> Swarm:
+    swarm = swarm_class(
+        swarm_size=10,
+        bounds=[[-5.0, 5.0], [-5.0, 5.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=lambda position: sum(x**2 for x in position),
+        logger=SwarmLogger(epsilon=-1, name="inertia", optimum_position=0),
+        rng=0,
+        inertia_strategy=strategy,
+    )
+    swarm.run_optimization(
+        iterations=iterations,
+        initial_inertia=0.9,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+    )
+    return swarm
+
+
+def test_statistics_diversity_matches_positions():
+    positions = np.random.default_rng(0).uniform(-3, 7, (20, 3))
+    statistics = SwarmStatistics(swarm_size=20, dimensions=3)
+    statistics.set_positions(positions)
+
+    distances = np.linalg.norm(positions - positions.mean(axis=0), axis=1)
+    assert statistics.diversity == pytest.approx(np.sqrt(np.mean(distances**2)))
+
+    # Moving one particle updates the summary without another pass
+    new_position = np.array([1.0, -2.0, 0.5])
+    statistics.move(positions[4], new_position)
+    positions[4] = new_position
+    expected = SwarmStatistics(swarm_size=20, dimensions=3)
+    expected.set_positions(positions)
+    assert statistics.diversity == pytest.approx(expected.diversity)
+
+
+def test_linear_decreasing():
+    statistics = SwarmStatistics(
+        swarm_size=10, dimensions=2, start_iteration=0, final_iteration=10
+    )
+    strategy = LinearDecreasing(final=0.4)
+    strategy.start(0.9, statistics)
+
+    assert strategy.update(0.9, statistics) == pytest.approx(0.85)
+    statistics.iteration = 4
+    assert strategy.update(0.9, statistics) == pytest.approx(0.65)
+    # The last iteration of the run reaches the final inertia
+    statistics.iteration = 9
+    assert strategy.update(0.9, statistics) == pytest.approx(0.4)
+    statistics.iteration = 10
+    assert strategy.update(0.9, statistics) == pytest.approx(0.4)
+
+
+def test_chaotic_stays_in_range_and_restarts():
+    statistics = SwarmStatistics(swarm_size=10, dimensions=2, final_iteration=100)
+    strategy = Chaotic(final=0.4)
+    strategy.start(0.9, statistics)
+
+    values = []
+    for iteration in range(100):
+        statistics.iteration = iteration
+        values.append(strategy.update(0.9, statistics))
+
+    assert all(0 < value < 0.9 for value in values)
+    assert len(set(values)) == len(values)
+
+    strategy.start(0.9, statistics)
+    statistics.iteration = 0
+    assert strategy.update(0.9, statistics) == values[0]
+
+    with pytest.raises(ValueError):
+        Chaotic(seed=0.5)
+
+
+def test_success_rate():
+    statistics = SwarmStatistics(swarm_size=10, dimensions=2, improved=3)
+
+    assert SuccessRate(minimum=0.2, maximum=1.0).update(0.9, statistics) == (
+        pytest.approx(0.44)
+    )
+    with pytest.raises(ValueError):
+        SuccessRate(minimum=1.0, maximum=0.5)
+
+
+def test_diversity_feedback():
+    positions = np.random.default_rng(0).uniform(-5, 5, (10, 2))
+    statistics = SwarmStatistics(swarm_size=10, dimensions=2)
+    statistics.set_positions(positions)
+    strategy = DiversityFeedback(minimum=0.4)
+    strategy.start(0.9, statistics)
+
+    assert strategy.update(0.9, statistics) == pytest.approx(0.9)
+    statistics.set_positions(positions / 2)
+    assert strategy.update(0.9, statistics) == pytest.approx(0.65)
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+def test_swarm_counts_improved_particles(swarm_class):
+    iterations = []
+
+    class Recording(InertiaStrategy):
+        def update(self, inertia, statistics):
+            iterations.append((statistics.iteration, statistics.improved))
+            return inertia
+
+    swarm = run_swarm(swarm_class, Recording(), iterations=20)
+
+    # Every particle improved on its first, initial evaluation
+    assert iterations[0] == (0, 10)
+    assert [iteration for iteration, _ in iterations] == list(range(20))
+    assert all(0 <= improved <= 10 for _, improved in iterations)
+    assert sum(improved for _, improved in iterations[1:]) > 0
+    assert swarm.logger.inertia_history == [0.9] * 21
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+def test_swarm_tracks_diversity(swarm_class):
+    swarm = run_swarm(swarm_class, DiversityFeedback(minimum=0.4))
+
+    expected = SwarmStatistics(swarm_size=10, dimensions=2)
+    expected.set_positions(swarm.positions_array())
+    assert swarm.statistics.diversity == pytest.approx(expected.diversity, abs=1e-6)
+
+    inertia = swarm.logger.inertia_history
+    assert inertia[0] == 0.9
+    assert all(0.4 <= w <= 0.9 for w in inertia)
+    assert inertia[-1] < 0.5
+
+
+def test_linear_decreasing_in_swarm():
+    swarm = run_swarm(Swarm, LinearDecreasing(final=0.4), iterations=50)
+
+    inertia = swarm.logger.inertia_history
+    # The initial inertia is logged before the first iteration
+    np.testing.assert_allclose(inertia, np.linspace(0.9, 0.4, 51))
+
+
+def test_strategy_excludes_dynamic_inertia():
+    with pytest.raises(ValueError):
+        Swarm(
+            swarm_size=10,
+            bounds=[[-5.0, 5.0]],
+            dimensions=1,
+            task=Task.MINIMIZE,
+            cost_function=lambda position: position[0] ** 2,
+            logger=SwarmLogger(epsilon=-1, name="inertia", optimum_position=0),
+            dynamic_inertia=True,
+            inertia_decay=1.001,
+            inertia_strategy=LinearDecreasing(),
+        )
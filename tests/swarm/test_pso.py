@@ -1,5 +1,12 @@
 from src.projekt_pop_24z.utils.logger import SwarmLogger
-from src.projekt_pop_24z.swarm.pso import Swarm, Particle, Task
+from src.projekt_pop_24z.swarm.pso import (
+    Particle,
+    ParticleStorage,
+    Swarm,
+    Task,
+    spawn_generators,
+)
+import numpy as np
 import pytest
 
 logger = SwarmLogger(
@@ -89,3 +96,102 @@ def test_current_iteration_min():
     )
     assert res == [0.0, 0.0], f"Expected [0.0, 0.0], got {res}"
     assert swarm.current_iteration == 10, f"Expected 10, got {swarm.current_iteration}"
+
+
+def test_evaluations_per_iteration():
+    bounds = [[0.0, 10.0], [0.0, 10.0]]
+
+    swarm = Swarm(
+        swarm_size=5,
+        bounds=bounds,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=sum,
+        logger=SwarmLogger(epsilon=-1, name="evaluations", optimum_position=0),
+    )
+
+    swarm.run_optimization(
+        iterations=7, initial_inertia=0.7, cognitive_constant=2.0, social_constant=2.0
+    )
+    assert swarm.evaluations == 5 * (7 + 1), f"Expected 40, got {swarm.evaluations}"
+    assert swarm.global_best_cost == sum(swarm.global_best_position)
+    assert swarm.global_best_cost == min(p.personal_best_cost for p in swarm.particles)
+
+
+def test_seeded_runs_are_reproducible():
+    def run(rng):
+        swarm = Swarm(
+            swarm_size=5,
+            bounds=[[-3.0, 3.0], [-3.0, 3.0], [-3.0, 3.0]],
+            dimensions=3,
+            task=Task.MINIMIZE,
+            cost_function=sum,
+            logger=SwarmLogger(epsilon=-1, name="seeded", optimum_position=0),
+            rng=rng,
+        )
+        swarm.run_optimization(
+            iterations=10,
+            initial_inertia=0.7,
+            cognitive_constant=2.0,
+            social_constant=2.0,
+        )
+        return swarm.logger.global_best_costs
+
+    first, second = spawn_generators(42, 2)
+
+    assert run(11) == run(11)
+    assert run(spawn_generators(42, 2)[0]) == run(first)
+    assert run(first) != run(second)
+
+
+def test_particle_is_a_view_of_the_storage():
+    storage = ParticleStorage.empty(2, 3)
+    particle = Particle(dimensions=3, storage=storage, index=1)
+
+    particle.position = [1.0, 2.0, 3.0]
+    particle.personal_best_position = particle.position
+    particle.position += 1.0
+
+    np.testing.assert_array_equal(storage.positions[1], [2.0, 3.0, 4.0])
+    # Assigning copies the values, it does not alias the rows
+    np.testing.assert_array_equal(storage.personal_best_positions[1], [1.0, 2.0, 3.0])
+    assert particle.personal_best_cost is None
+    particle.personal_best_cost = 4.0
+    assert storage.personal_best_costs.tolist()[1] == 4.0
+
+
+def test_swarm_stores_particles_as_arrays():
+    particles = [
+        Particle(dimensions=2, personal_best_position=[2, 3], personal_best_cost=5.0),
+        Particle(dimensions=2, personal_best_position=[1, 1]),
+    ]
+    swarm = Swarm(
+        swarm_size=2,
+        bounds=[[0.0, 10.0], [0.0, 10.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=sum,
+        particles=particles,
+        logger=SwarmLogger(epsilon=-1, name="storage", optimum_position=0),
+    )
+
+    assert swarm.update_global_best() == [1.0, 1.0]
+    # Only the particle without a cached cost was evaluated
+    assert swarm.evaluations == 1
+    assert particles[0].personal_best_cost == 5.0
+    np.testing.assert_array_equal(
+        swarm._personal_best_positions(), [[2.0, 3.0], [1.0, 1.0]]
+    )
+
+    swarm = Swarm(
+        swarm_size=1000,
+        bounds=[[0.0, 10.0]] * 8,
+        dimensions=8,
+        task=Task.MINIMIZE,
+        cost_function=sum,
+        logger=SwarmLogger(epsilon=-1, name="storage", optimum_position=0),
+    )
+    swarm.init_swarm()
+    positions = swarm.positions_array()
+    assert positions.shape == (1000, 8)
+    assert all(p.position.base is positions for p in swarm.particles)
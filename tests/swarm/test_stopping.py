@@ -0,0 +1,97 @@
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.stopping import (
+    EvaluationBudget,
+    NoImprovement,
+    StoppingCriterion,
+    SwarmDiameter,
+    TargetCost,
+    WallClockBudget,
+)
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import pickle
+import pytest
+import time
+
+
+def run_swarm(
+    swarm_class: type[Swarm], criteria: list[StoppingCriterion], iterations: int = 200
+) -> Swarm:
+    swarm = swarm_class(
+        swarm_size=10,
+        bounds=[[-5.0, 5.0], [-5.0, 5.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=lambda position: sum(x**2 for x in position),
+        logger=SwarmLogger(epsilon=-1, name="stopping", optimum_position=0),
+        stopping_criteria=criteria,
+    )
+    swarm.run_optimization(
+        iterations=iterations,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+    )
+    return swarm
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm])
+def test_target_cost(swarm_class):
+    swarm = run_swarm(swarm_class, [TargetCost(target=1e-3)])
+
+    assert swarm.global_best_cost <= 1e-3
+    assert swarm.current_iteration < 200
+    assert swarm.logger.stop_reason == "target cost reached"
+    assert len(swarm.logger.global_best_costs) == swarm.current_iteration + 1
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm])
+def test_evaluation_budget(swarm_class):
+    swarm = run_swarm(swarm_class, [EvaluationBudget(max_evaluations=55)])
+
+    assert swarm.evaluations == 60
+    assert swarm.logger.stop_reason == "evaluation budget exhausted"
+
+
+def test_no_improvement():
+    swarm = run_swarm(Swarm, [NoImprovement(patience=5, tolerance=1e-12)], 2000)
+
+    costs = swarm.logger.global_best_costs
+    assert swarm.logger.stop_reason == "no improvement"
+    assert costs[-1] >= costs[-6] - 1e-12
+
+
+def test_swarm_diameter():
+    swarm = run_swarm(VectorizedSwarm, [SwarmDiameter(threshold=1e-3)], 2000)
+
+    assert swarm.diameter() < 1e-3
+    assert swarm.logger.stop_reason == "swarm diameter below threshold"
+
+
+def test_wall_clock_budget():
+    swarm = run_swarm(Swarm, [WallClockBudget(seconds=0)])
+
+    assert swarm.current_iteration == 1
+    assert swarm.logger.stop_reason == "wall-clock budget exhausted"
+
+
+def test_wall_clock_budget_survives_resume():
+    budget = WallClockBudget(seconds=10)
+    budget.start(None)
+    budget._started_at -= 4
+    assert not budget.should_stop(None)
+
+    # A new process measures `perf_counter` from an unrelated reference point
+    for started_at in (-1e9, time.perf_counter() + 1e9):
+        restored = pickle.loads(pickle.dumps(budget))
+        restored._started_at = started_at
+        restored.resume(None)
+
+        assert not restored.should_stop(None)
+        assert restored._elapsed == pytest.approx(4, abs=0.5)
+
+
+def test_first_fired_criterion_is_reported():
+    swarm = run_swarm(Swarm, [EvaluationBudget(max_evaluations=0), WallClockBudget(0)])
+
+    assert swarm.logger.stop_reason == "evaluation budget exhausted"
@@ -0,0 +1,81 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Sphere
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.surrogate import Archive, KNNSurrogate, Screening
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+import numpy as np
+import pytest
+
+
+def test_knn_interpolates_archived_points():
+    rng = np.random.default_rng(0)
+    archive = Archive(dimensions=3)
+    positions = rng.uniform(-1, 1, (50, 3))
+    costs = Sphere.batch_function(positions)
+    archive.add(positions, costs)
+
+    predicted = KNNSurrogate(k=4).predict(archive, positions[:10])
+    np.testing.assert_allclose(predicted, costs[:10])
+
+
+def test_archive_keeps_most_recent_evaluations():
+    archive = Archive(dimensions=1, capacity=4)
+    archive.add(np.arange(3.0)[:, None], np.arange(3.0))
+    archive.add(np.arange(3.0, 6.0)[:, None], np.arange(3.0, 6.0))
+
+    assert archive.size == 4
+    assert sorted(archive.costs.tolist()) == [2.0, 3.0, 4.0, 5.0]
+    np.testing.assert_array_equal(archive.squared_norms, archive.positions[:, 0] ** 2)
+
+
+@pytest.mark.parametrize("maximize", [False, True])
+def test_select_most_promising(maximize):
+    archive = Archive(dimensions=1)
+    archive.add(np.arange(10.0)[:, None], np.arange(10.0))
+    screening = Screening(KNNSurrogate(k=1), fraction=0.3, min_archive=5)
+
+    selected = screening.select(archive, np.arange(10.0)[:, None], maximize)
+    assert selected.tolist() == ([7, 8, 9] if maximize else [0, 1, 2])
+
+    assert Screening(min_archive=11).select(archive, archive.positions, False) is None
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm])
+def test_screening_saves_evaluations(swarm_class):
+    swarm = swarm_class(
+        swarm_size=10,
+        bounds=[[-5.12, 5.12]] * 3,
+        dimensions=3,
+        task=Task.MINIMIZE,
+        cost_function=Sphere.function,
+        logger=SwarmLogger(epsilon=-1, name="Sphere", optimum_position=0),
+        batch_cost_function=Sphere.batch_function,
+        rng=0,
+        screening=Screening(fraction=0.3, min_archive=20),
+    )
+    swarm.run_optimization(
+        iterations=20, initial_inertia=0.7, cognitive_constant=1.5, social_constant=1.5
+    )
+
+    # Initialisation and the first iteration fill the archive
+    assert swarm.evaluations == 10 + 10 + 19 * 3
+    assert swarm.global_best_cost == pytest.approx(
+        Sphere.function(swarm.global_best_position)
+    )
+    assert np.isfinite(swarm._personal_best_costs()).all()
+
+
+def test_invalid_screening():
+    with pytest.raises(ValueError):
+        Screening(fraction=0)
+    with pytest.raises(ValueError):
+        AsynchronousSwarm(
+            swarm_size=2,
+            bounds=[[0.0, 1.0]],
+            dimensions=1,
+            task=Task.MINIMIZE,
+            cost_function=sum,
+            logger=SwarmLogger(epsilon=-1, name="async", optimum_position=0),
+            screening=Screening(),
+        )
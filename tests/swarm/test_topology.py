@@ -0,0 +1,83 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Rastrigin
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.topology import (
+    Neighbourhoods,
+    RandomK,
+    Ring,
+    VonNeumann,
+)
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+import numpy as np
+import pytest
+
+
+def test_ring_neighbours():
+    neighbours = Ring(radius=1).neighbours(5, np.random.default_rng(0))
+    assert neighbours.tolist()[0] == [4, 0, 1]
+    assert neighbours.tolist()[4] == [3, 4, 0]
+
+
+def test_von_neumann_neighbours():
+    neighbours = VonNeumann().neighbours(12, np.random.default_rng(0))
+    # 3 x 4 grid, particle 5 is in the middle row
+    assert sorted(neighbours[5].tolist()) == [1, 4, 5, 6, 9]
+    assert sorted(neighbours[0].tolist()) == [0, 1, 3, 4, 8]
+
+
+def test_random_k_neighbours():
+    neighbours = RandomK(k=3).neighbours(10, np.random.default_rng(0))
+    assert neighbours.shape == (10, 4)
+    assert neighbours[:, 0].tolist() == list(range(10))
+    for i, row in enumerate(neighbours.tolist()):
+        assert len(set(row)) == 4 and i not in row[1:]
+
+
+@pytest.mark.parametrize("maximize", [False, True])
+def test_incremental_update_matches_refresh(maximize):
+    rng = np.random.default_rng(1)
+    indices = RandomK(k=4).neighbours(20, rng)
+    costs = rng.random(20)
+    neighbourhoods = Neighbourhoods(indices, costs, maximize)
+
+    for _ in range(50):
+        particle = int(rng.integers(20))
+        step = rng.random()
+        costs[particle] += step if maximize else -step
+        neighbourhoods.improve(particle, costs[particle])
+
+    incremental = neighbourhoods.best.copy()
+    neighbourhoods.refresh(costs)
+    assert incremental.tolist() == neighbourhoods.best.tolist()
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+@pytest.mark.parametrize("topology", [Ring(), VonNeumann(), RandomK(k=3)])
+def test_local_best_swarm(swarm_class, topology):
+    swarm = swarm_class(
+        swarm_size=12,
+        bounds=[[-5.12, 5.12]] * 2,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=Rastrigin.function,
+        logger=SwarmLogger(epsilon=-1, name="lbest", optimum_position=0),
+        rng=2,
+        topology=topology,
+    )
+    swarm.run_optimization(
+        iterations=30,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+    )
+
+    costs = swarm._personal_best_costs()
+    expected = swarm._neighbourhoods.indices[
+        np.arange(12), costs[swarm._neighbourhoods.indices].argmin(axis=1)
+    ]
+    assert swarm._neighbourhoods.best.tolist() == expected.tolist()
+    assert swarm.global_best_cost == costs.min()
+    assert swarm.logger.global_best_costs == sorted(
+        swarm.logger.global_best_costs, reverse=True
+    )
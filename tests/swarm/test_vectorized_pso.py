@@ -0,0 +1,71 @@
+from src.projekt_pop_24z.utils.logger import HistoryMode, SwarmLogger
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+import numpy as np
+
+
+def make_logger(history_mode: HistoryMode = HistoryMode.FIRST_LAST) -> SwarmLogger:
+    return SwarmLogger(
+        epsilon=1e-5,
+        name="This is a test logger",
+        optimum_position=0,
+        history_mode=history_mode,
+    )
+
+
+def test_run_optimization_min():
+    logger = make_logger()
+    swarm = VectorizedSwarm(
+        swarm_size=10,
+        bounds=[[0.0, 10.0], [0.0, 10.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=sum,
+        logger=logger,
+        rng=np.random.default_rng(0),
+    )
+
+    res = swarm.run_optimization(
+        iterations=20, initial_inertia=0.7, cognitive_constant=2.0, social_constant=2.0
+    )
+    assert res == [0.0, 0.0], f"Expected [0.0, 0.0], got {res}"
+    assert swarm.current_iteration == 20, f"Expected 20, got {swarm.current_iteration}"
+
+
+def test_logger_output_matches_python_engine_shape():
+    logger = make_logger(HistoryMode.FULL)
+    swarm = VectorizedSwarm(
+        swarm_size=4,
+        bounds=[[-1.0, 1.0]] * 3,
+        dimensions=3,
+        task=Task.MAXIMIZE,
+        cost_function=sum,
+        logger=logger,
+        rng=np.random.default_rng(1),
+    )
+
+    swarm.run_optimization(
+        iterations=5, initial_inertia=0.7, cognitive_constant=2.0, social_constant=2.0
+    )
+
+    assert len(logger.global_best_costs) == 6
+    assert len(logger.inertia_history) == 6
+    assert logger.particle_positions_history.shape == (6, 4, 3)
+    assert logger.global_best_costs == sorted(logger.global_best_costs)
+
+
+def test_evaluations_per_iteration():
+    swarm = VectorizedSwarm(
+        swarm_size=5,
+        bounds=[[0.0, 10.0], [0.0, 10.0]],
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=sum,
+        logger=make_logger(),
+    )
+
+    swarm.run_optimization(
+        iterations=7, initial_inertia=0.7, cognitive_constant=2.0, social_constant=2.0
+    )
+    assert swarm.evaluations == 5 * (7 + 1), f"Expected 40, got {swarm.evaluations}"
+    assert swarm.global_best_cost == sum(swarm.global_best_position)
@@ -0,0 +1,51 @@
+from src.projekt_pop_24z.benchmark import (
+    AlgorithmParameters,
+    Engine,
+    derive_run_seeds,
+    run_benchmark_and_plot_aggregated,
+)
+from src.projekt_pop_24z.benchmark_functions.repository import Sphere
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.utils.logger import LogParameters
+from src.projekt_pop_24z.utils.plotter import PlotDescription
+import pytest
+
+
+def make_parameters(engine: Engine) -> AlgorithmParameters:
+    return AlgorithmParameters(
+        swarm_size=8,
+        bounds=[[-5.0, 5.0]] * 3,
+        dimensions=3,
+        task=Task.MINIMIZE,
+        iterations=15,
+        initial_inertia=0.7,
+        cognitive_constant=2.0,
+        social_constant=2.0,
+        engine=engine,
+    )
+
+
+def test_derive_run_seeds_is_deterministic():
+    assert derive_run_seeds(7, 4) == derive_run_seeds(7, 4)
+    assert len(set(derive_run_seeds(7, 4))) == 4
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_aggregated_result_does_not_depend_on_workers(engine):
+    def run(workers: int):
+        return run_benchmark_and_plot_aggregated(
+            cost_function=Sphere.function,
+            parameters=make_parameters(engine),
+            log_params=LogParameters(name=Sphere.name),
+            plot_description=PlotDescription(problem_name=Sphere.name, save_path=""),
+            plot_types=[],
+            n_times=4,
+            workers=workers,
+            seed=123,
+        )
+
+    serial, parallel = run(1), run(2)
+
+    assert serial.best_cost == parallel.best_cost
+    assert serial.logger.global_best_costs == parallel.logger.global_best_costs
+    assert len(parallel.logger.particle_positions_history) == 2
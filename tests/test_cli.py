@@ -0,0 +1,50 @@
+import json
+
+from src.projekt_pop_24z.cli import main, make_parameters, parse_args
+from src.projekt_pop_24z.swarm.inertia import SuccessRate
+import pytest
+
+
+ARGUMENTS = [
+    "--function", "Sphere",
+    "--dimensions", "2",
+    "--iterations", "10",
+    "--runs", "3",
+    "--workers", "1",
+    "--swarm-size", "5",
+]  # fmt: skip
+
+
+def test_json_output(capsys):
+    assert main([*ARGUMENTS, "--format", "json"]) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["function"] == "Sphere"
+    assert summary["runs"] == 3
+    assert summary["evaluations"] == 5 * (10 + 1)
+    assert len(summary["best_position"]) == 2
+    assert len(summary["global_best_costs"]) == 10 + 1
+
+
+def test_table_output(capsys):
+    assert main(ARGUMENTS) == 0
+
+    output = capsys.readouterr().out
+    assert "Benchmark Result for Function: Sphere" in output
+    assert "- Runs: 3" in output
+
+
+@pytest.mark.parametrize(
+    ("inertia", "dynamic_inertia", "strategy"),
+    [
+        ("constant", False, type(None)),
+        ("geometric", True, type(None)),
+        ("success-rate", False, SuccessRate),
+    ],
+)
+def test_inertia_options(inertia, dynamic_inertia, strategy):
+    parameters = make_parameters(parse_args([*ARGUMENTS, "--inertia", inertia]))
+
+    assert parameters.dynamic_inertia == dynamic_inertia
+    assert isinstance(parameters.inertia_strategy, strategy)
+    assert parameters.bounds == [[-2.048, 2.048]] * 2
@@ -0,0 +1,148 @@
+from src.projekt_pop_24z.benchmark import AlgorithmParameters, Engine
+from src.projekt_pop_24z.benchmark_functions.repository import Sphere
+from src.projekt_pop_24z.islands import (
+    IslandParameters,
+    MigrationTopology,
+    run_islands,
+)
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters, SwarmLogger
+import numpy as np
+import pytest
+import threading
+
+
+def make_parameters(engine: Engine = Engine.NUMPY) -> AlgorithmParameters:
+    return AlgorithmParameters(
+        swarm_size=6,
+        bounds=[[-5.0, 5.0]] * 2,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        iterations=12,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+        engine=engine,
+    )
+
+
+def run(topology: MigrationTopology, processes: bool, engine=Engine.NUMPY):
+    return run_islands(
+        cost_function=Sphere.function,
+        parameters=make_parameters(engine),
+        log_params=LogParameters(name=Sphere.name, history_mode=HistoryMode.FULL),
+        island_parameters=IslandParameters(
+            n_islands=3, migration_interval=5, topology=topology, migrants=2
+        ),
+        batch_cost_function=Sphere.batch_function,
+        seed=11,
+        processes=processes,
+    )
+
+
+def test_topologies():
+    assert MigrationTopology.RING.sources(0, 4) == [3]
+    assert MigrationTopology.RING.targets(0, 4) == [1]
+    assert MigrationTopology.FULLY_CONNECTED.sources(1, 3) == [0, 2]
+    assert MigrationTopology.FULLY_CONNECTED.targets(1, 3) == [0, 2]
+    assert MigrationTopology.RING.sources(0, 1) == []
+
+
+@pytest.mark.parametrize("topology", list(MigrationTopology))
+@pytest.mark.parametrize("engine", [Engine.PYTHON, Engine.NUMPY])
+def test_processes_match_running_in_turn(topology, engine):
+    in_turn = run(topology, processes=False, engine=engine)
+    in_processes = run(topology, processes=True, engine=engine)
+
+    assert in_turn.best_cost == in_processes.best_cost
+    assert in_turn.logger.global_best_costs == in_processes.logger.global_best_costs
+
+
+def test_merged_result():
+    result = run(MigrationTopology.RING, processes=False)
+    costs = result.logger.global_best_costs
+
+    assert len(costs) == 12 + 1
+    assert costs == sorted(costs, reverse=True)
+    assert costs[-1] == result.best_cost
+    assert result.evaluations == 3 * 6 * (12 + 1)
+    assert result.logger.particle_positions_history.shape == (13, 3 * 6, 2)
+
+
+def test_immigrants_replace_the_worst_particles():
+    swarm = Swarm(
+        swarm_size=4,
+        bounds=[[-5.0, 5.0]] * 2,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        cost_function=Sphere.function,
+        logger=SwarmLogger(epsilon=-1, name="islands", optimum_position=0),
+        rng=0,
+    )
+    swarm.init_swarm()
+    worst = int(np.argmax(swarm._personal_best_costs()))
+
+    swarm.immigrate(np.array([[0.0, 0.0], [9.0, 9.0]]), np.array([0.0, 162.0]))
+
+    assert swarm.particles[worst].personal_best_cost == 0.0
+    assert swarm.global_best_cost == 0.0
+    assert swarm.global_best_position == [0.0, 0.0]
+    positions, costs = swarm.emigrants(1)
+    assert positions.tolist() == [[0.0, 0.0]] and costs.tolist() == [0.0]
+
+
+def failing_function(position: list[float]) -> float:
+    raise ArithmeticError("cannot evaluate")
+
+
+def test_error_in_an_island_is_raised():
+    with pytest.raises(ArithmeticError, match="cannot evaluate"):
+        run_islands(
+            cost_function=failing_function,
+            parameters=make_parameters(Engine.PYTHON),
+            log_params=LogParameters(name="failing"),
+            island_parameters=IslandParameters(n_islands=2, migration_interval=5),
+        )
+
+
+def test_migrants_larger_than_the_pipe_buffer():
+    dimensions = 100
+    parameters = AlgorithmParameters(
+        swarm_size=150,
+        bounds=[[-5.0, 5.0]] * dimensions,
+        dimensions=dimensions,
+        task=Task.MINIMIZE,
+        iterations=4,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+        engine=Engine.NUMPY,
+    )
+    results = []
+
+    # 150 migrants of 100 coordinates are far more than a pipe buffers, a
+    # deadlock would block the thread instead of the test session
+    def run_model():
+        results.append(
+            run_islands(
+                cost_function=Sphere.function,
+                parameters=parameters,
+                log_params=LogParameters(name=Sphere.name),
+                island_parameters=IslandParameters(
+                    n_islands=3,
+                    migration_interval=2,
+                    topology=MigrationTopology.FULLY_CONNECTED,
+                    migrants=150,
+                ),
+                batch_cost_function=Sphere.batch_function,
+                seed=3,
+                processes=True,
+            )
+        )
+
+    thread = threading.Thread(target=run_model, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+
+    assert not thread.is_alive()
+    assert len(results[0].logger.global_best_costs) == 5
@@ -0,0 +1,135 @@
+from dataclasses import replace
+import json
+
+from src.projekt_pop_24z.benchmark import Engine
+from src.projekt_pop_24z.perf import (
+    IMPORT_BUDGETS,
+    PerfCase,
+    compare,
+    load_results,
+    main,
+    make_cases,
+    make_slow_cases,
+    measure,
+    measure_import,
+    write_results,
+)
+import pytest
+
+
+CASE = PerfCase(
+    function_name="Sphere",
+    engine="NUMPY",
+    evaluator="batch",
+    swarm_size=5,
+    dimensions=2,
+    iterations=4,
+)
+
+
+def test_batched_engine_only_runs_without_evaluator():
+    cases = make_cases(
+        ["Sphere"], [Engine.NUMPY, Engine.BATCHED], ["batch", "threads"], [5], [2], [4]
+    )
+
+    assert [(c.engine, c.evaluator) for c in cases] == [
+        ("NUMPY", "batch"),
+        ("NUMPY", "threads"),
+        ("BATCHED", "batch"),
+    ]
+
+
+@pytest.mark.parametrize("evaluator", ["batch", "serial", "threads", "asyncio"])
+def test_measure(evaluator):
+    measurement = measure(replace(CASE, evaluator=evaluator), repeats=2)
+
+    assert measurement.evaluations == 5 * (4 + 1)
+    assert measurement.particle_updates == 5 * 4
+    assert measurement.evaluations_per_second > 0
+
+
+@pytest.mark.parametrize("engine", ["NUMPY", "BATCHED"])
+def test_measure_several_runs(engine):
+    measurement = measure(replace(CASE, engine=engine, runs=3), repeats=1)
+
+    assert measurement.evaluations == 3 * 5 * (4 + 1)
+    assert measurement.particle_updates == 3 * 5 * 4
+    assert measurement.case.key().endswith("/runs=3")
+
+
+@pytest.mark.parametrize("evaluator", ["serial", "threads", "asyncio"])
+def test_measure_slow_objective(evaluator):
+    case = replace(CASE, evaluator=evaluator, delay=0.001)
+    measurement = measure(case, repeats=1)
+
+    assert measurement.evaluations == 5 * (4 + 1)
+    if evaluator == "serial":
+        # Every evaluation sleeps in turn
+        assert measurement.seconds >= 25 * 0.001
+
+
+def test_slow_cases_take_an_evaluator():
+    cases = make_slow_cases(
+        "Sphere", [Engine.NUMPY, Engine.BATCHED], ["serial", "threads"], 5, 2, 4, 0.01
+    )
+
+    assert [(c.engine, c.evaluator, c.delay) for c in cases] == [
+        ("NUMPY", "serial", 0.01),
+        ("NUMPY", "threads", 0.01),
+    ]
+    assert cases[0].key() == "Sphere/NUMPY/serial/5/2/4/delay=0.01"
+
+
+def test_results_round_trip(tmp_path):
+    measurement = measure(CASE, repeats=1)
+    write_results(tmp_path / "perf.json", [measurement])
+
+    loaded = load_results(tmp_path / "perf.json")
+    assert loaded == {CASE.key(): measurement}
+    payload = json.loads((tmp_path / "perf.json").read_text())
+    assert payload["results"][0]["evaluations_per_second"] > 0
+    assert "numpy" in payload["metadata"]
+
+
+def test_compare_flags_regressions():
+    baseline = measure(CASE, repeats=1)
+    slower = replace(baseline, seconds=baseline.seconds * 2)
+    faster = replace(baseline, seconds=baseline.seconds / 2)
+
+    [regression] = compare({CASE.key(): baseline}, {CASE.key(): slower})
+    [improvement] = compare({CASE.key(): baseline}, {CASE.key(): faster})
+
+    assert regression.regression and regression.ratio == pytest.approx(0.5)
+    assert not improvement.regression
+
+
+def test_main_run_and_compare(tmp_path, capsys):
+    arguments = [
+        "--functions", "Sphere",
+        "--engines", "NUMPY",
+        "--evaluators", "batch",
+        "--swarm-size", "5",
+        "--dimensions", "2",
+        "--iterations", "4",
+        "--repeats", "1",
+    ]  # fmt: skip
+    assert main(["run", *arguments, "--output", str(tmp_path / "base.json")]) == 0
+
+    # A baseline that is far faster than anything the machine can do
+    payload = json.loads((tmp_path / "base.json").read_text())
+    payload["results"][0]["seconds"] = 1e-9
+    (tmp_path / "fast.json").write_text(json.dumps(payload))
+
+    assert (
+        main(["compare", str(tmp_path / "base.json"), str(tmp_path / "base.json")]) == 0
+    )
+    assert main(["run", *arguments, "--baseline", str(tmp_path / "fast.json")]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+# The import time itself depends on the machine, `perf imports` checks it
+@pytest.mark.parametrize("module", IMPORT_BUDGETS)
+def test_import_defers_heavy_modules(module):
+    _, loaded = measure_import(module, repeats=1)
+
+    assert loaded == []
@@ -0,0 +1,125 @@
+from dataclasses import replace
+
+from src.projekt_pop_24z.benchmark import AlgorithmParameters, Engine
+from src.projekt_pop_24z.swarm.constraints import Constraints
+from src.projekt_pop_24z.swarm.pso import Task
+from src.projekt_pop_24z.swarm.surrogate import Screening
+from src.projekt_pop_24z.sweep import (
+    ResultCache,
+    SweepCell,
+    grid,
+    main,
+    make_cells,
+    random_sample,
+    run_sweep,
+    screening_report,
+)
+import pytest
+
+
+BASE = AlgorithmParameters(
+    swarm_size=6,
+    bounds=[[-2.0, 2.0]],
+    dimensions=2,
+    task=Task.MINIMIZE,
+    iterations=10,
+    initial_inertia=0.7,
+    cognitive_constant=2.0,
+    social_constant=2.0,
+    engine=Engine.NUMPY,
+)
+
+
+def above_zero(positions):
+    return -positions[:, 0]
+
+
+def below_one(positions):
+    return positions[:, 0] - 1
+
+
+def test_cell_key_addresses_constraints_by_name():
+    def key(*inequalities):
+        parameters = replace(BASE, constraints=Constraints(list(inequalities)))
+        return SweepCell(parameters, "Sphere", 1).key()
+
+    assert key(above_zero) == key(above_zero)
+    assert key(above_zero) != key(below_one)
+    with pytest.raises(ValueError, match="addressed by name"):
+        key(lambda positions: positions[:, 0])
+
+
+def test_grid_is_cartesian_product_with_matching_bounds():
+    parameter_sets = grid(BASE, dimensions=[2, 3], initial_inertia=[0.5, 0.7, 0.9])
+
+    assert len(parameter_sets) == 6
+    assert [len(p.bounds) for p in parameter_sets] == [2, 2, 2, 3, 3, 3]
+    assert {p.initial_inertia for p in parameter_sets} == {0.5, 0.7, 0.9}
+
+
+def test_random_sample():
+    parameter_sets = random_sample(
+        BASE, 5, seed=0, initial_inertia=(0.4, 0.9), swarm_size=[4, 8]
+    )
+
+    assert len(parameter_sets) == 5
+    assert all(0.4 <= p.initial_inertia <= 0.9 for p in parameter_sets)
+    assert {p.swarm_size for p in parameter_sets} <= {4, 8}
+
+
+def test_extended_sweep_only_computes_missing_cells(tmp_path):
+    parameter_sets = grid(BASE, initial_inertia=[0.5, 0.7])
+
+    first_cache = ResultCache(tmp_path)
+    first = run_sweep(make_cells(parameter_sets, ["Sphere"], [1, 2]), first_cache)
+
+    extended_cache = ResultCache(tmp_path)
+    extended = run_sweep(
+        make_cells(parameter_sets, ["Sphere"], [1, 2, 3]), extended_cache, workers=2
+    )
+
+    assert (first_cache.hits, first_cache.misses) == (0, 4)
+    assert (extended_cache.hits, extended_cache.misses) == (4, 2)
+    assert [r.best_cost for r in extended if r.seed != 3] == [
+        r.best_cost for r in first
+    ]
+
+
+def test_cli(tmp_path, capsys):
+    output = tmp_path / "results.jsonl"
+
+    main(
+        [
+            "--functions",
+            "Sphere",
+            "Ackley",
+            "--iterations",
+            "5",
+            "--inertia-decay",
+            "1.001",
+            "--seeds",
+            "2",
+            "--workers",
+            "1",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--output",
+            str(output),
+        ]
+    )
+
+    assert "8 cells, 0 from cache, 8 computed." in capsys.readouterr().out
+    assert len(output.read_text().splitlines()) == 8
+
+
+def test_screening_report():
+    parameter_sets = grid(
+        BASE, screening=[None, Screening(fraction=0.5, min_archive=12)]
+    )
+    results = run_sweep(make_cells(parameter_sets, ["Sphere"], [1, 2]))
+
+    [row] = screening_report(results)
+    function_name, fraction, seeds, evaluations, screened_evaluations = row[:5]
+    assert (function_name, fraction, seeds) == ("Sphere", 0.5, 2)
+    # 6 particles: initialisation and the first iteration, then 3 per iteration
+    assert (evaluations, screened_evaluations) == (66, 6 + 6 + 9 * 3)
@@ -0,0 +1,104 @@
+from src.projekt_pop_24z.utils.logger import HistoryMode, LoggerAggregator, SwarmLogger
+import numpy as np
+import pytest
+
+
+def make_logger(history_mode: HistoryMode, history_interval: int = 10) -> SwarmLogger:
+    return SwarmLogger(
+        epsilon=-1,
+        name="This is a test logger",
+        optimum_position=0,
+        history_mode=history_mode,
+        history_interval=history_interval,
+    )
+
+
+def add_epochs(logger: SwarmLogger, n_epochs: int) -> None:
+    for epoch in range(n_epochs):
+        logger.add_particle_epoch([[epoch, -epoch], [epoch + 0.5, 0.0]])
+
+
+@pytest.mark.parametrize(
+    "history_mode, expected_epochs",
+    [
+        (HistoryMode.NONE, []),
+        (HistoryMode.FIRST_LAST, [0, 39]),
+        (HistoryMode.EVERY_K, [0, 7, 14, 21, 28, 35, 39]),
+        (HistoryMode.FULL, list(range(40))),
+    ],
+)
+def test_history_modes(history_mode, expected_epochs):
+    logger = make_logger(history_mode, history_interval=7)
+
+    add_epochs(logger, 40)
+
+    assert logger.particle_positions_epochs == expected_epochs
+    assert len(logger.particle_positions_history) == len(expected_epochs)
+    for history, epoch in zip(logger.particle_positions_history, expected_epochs):
+        np.testing.assert_array_equal(history, [[epoch, -epoch], [epoch + 0.5, 0.0]])
+
+
+@pytest.mark.parametrize("n_epochs, expected_epochs", [(1, [0]), (8, [0, 7])])
+def test_every_k_keeps_the_latest_epoch_once(n_epochs, expected_epochs):
+    logger = make_logger(HistoryMode.EVERY_K, history_interval=7)
+
+    add_epochs(logger, n_epochs)
+
+    assert logger.particle_positions_epochs == expected_epochs
+    assert len(logger.particle_positions_history) == len(expected_epochs)
+
+
+def test_positions_are_copied():
+    logger = make_logger(HistoryMode.FULL)
+    positions = [[1.0, 2.0]]
+
+    logger.add_particle_epoch(positions)
+    positions[0][0] = 5.0
+
+    assert logger.particle_positions_history[0][0][0] == 1.0
+
+
+def test_compact_keeps_first_and_last_epoch():
+    logger = make_logger(HistoryMode.FULL)
+    add_epochs(logger, 5)
+
+    compacted = logger.compact()
+
+    assert compacted.particle_positions_epochs == [0, 4]
+    np.testing.assert_array_equal(
+        compacted.particle_positions_history,
+        logger.particle_positions_history[[0, -1]],
+    )
+
+
+def test_aggregate_averages_curves():
+    first, second = make_logger(HistoryMode.FULL), make_logger(HistoryMode.FULL)
+    for logger, offset in ((first, 0.0), (second, 2.0)):
+        for cost in (3.0, 2.0, 1.0):
+            logger.log_global_best_cost(cost + offset)
+            logger.add_inertia(0.5 + offset)
+        add_epochs(logger, 3)
+
+    aggregated = SwarmLogger.aggregate([first, second])
+
+    assert aggregated.global_best_costs == [4.0, 3.0, 2.0]
+    assert aggregated.inertia_history == [1.5, 1.5, 1.5]
+    np.testing.assert_array_equal(
+        aggregated.particle_positions_history, first.particle_positions_history
+    )
+
+
+def test_aggregator_pads_runs_that_stopped_early():
+    aggregator = LoggerAggregator(length=4)
+    for costs in ([4.0, 3.0, 2.0, 1.0], [4.0, 2.0]):
+        logger = make_logger(HistoryMode.NONE)
+        for cost in costs:
+            logger.log_global_best_cost(cost)
+            logger.add_inertia(0.7)
+        aggregator.add(logger)
+
+    statistics = aggregator.global_best_costs
+    np.testing.assert_array_equal(statistics.mean(), [4.0, 2.5, 2.0, 1.5])
+    np.testing.assert_array_equal(statistics.std(), [0.0, 0.5, 0.0, 0.5])
+    np.testing.assert_array_equal(statistics.max(), [4.0, 3.0, 2.0, 2.0])
+    assert aggregator.result().global_best_costs == [4.0, 2.5, 2.0, 1.5]
@@ -0,0 +1,65 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Rastrigin
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.utils.plotter import PlotDescription, Plotter
+import numpy as np
+
+
+def make_plotter(cache_dir, batch_func=Rastrigin.batch_function) -> Plotter:
+    return Plotter(
+        logger=SwarmLogger(name="Rastrigin", epsilon=-1, optimum_position=0),
+        plot_description=PlotDescription(problem_name="Rastrigin", save_path=""),
+        bounds=[[-2.0, 2.0], [-1.0, 3.0]],
+        func=Rastrigin.function,
+        batch_func=batch_func,
+        resolution=20,
+        cache_dir=cache_dir,
+    )
+
+
+def test_contour_grid_matches_scalar_function(tmp_path):
+    X, Y, Z = make_plotter(tmp_path).contour_grid()
+
+    assert Z.shape == (20, 20)
+    assert X[0, 0] == -2.4 and Y[-1, -1] == 3.4
+    expected = [[Rastrigin.function([x, y]) for x, y in zip(*row)] for row in zip(X, Y)]
+    np.testing.assert_allclose(Z, expected)
+
+
+def test_contour_grid_is_cached(tmp_path):
+    _, _, Z = make_plotter(tmp_path).contour_grid()
+
+    def fail(positions):
+        raise AssertionError("The cached grid should be used.")
+
+    _, _, cached = make_plotter(tmp_path, batch_func=fail).contour_grid()
+
+    assert len(list(tmp_path.iterdir())) == 1
+    np.testing.assert_array_equal(cached, Z)
+
+
+def test_functions_without_a_name_of_their_own_are_not_cached(tmp_path):
+    plotter = make_plotter(tmp_path)
+    plotter.func = lambda position: Rastrigin.function(position)
+    plotter.contour_grid()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_edited_function_is_not_served_from_the_cache(tmp_path):
+    def rastrigin(position):
+        return Rastrigin.function(position)
+
+    def shifted(position):
+        return Rastrigin.function(position) + 1
+
+    # Same module and name, different code
+    shifted.__qualname__ = rastrigin.__qualname__ = "rastrigin"
+
+    plotter = make_plotter(tmp_path, batch_func=None)
+    plotter.func = rastrigin
+    _, _, Z = plotter.contour_grid()
+    plotter.func = shifted
+    _, _, edited = plotter.contour_grid()
+
+    assert len(list(tmp_path.iterdir())) == 2
+    np.testing.assert_allclose(edited, Z + 1)
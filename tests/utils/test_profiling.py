@@ -0,0 +1,92 @@
+from src.projekt_pop_24z.benchmark_functions.repository import Rastrigin
+from src.projekt_pop_24z.swarm.async_pso import AsynchronousSwarm
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.swarm.vectorized_pso import VectorizedSwarm
+from src.projekt_pop_24z.utils.logger import SwarmLogger
+from src.projekt_pop_24z.utils.profiling import NullPhaseTimer, Phase, PhaseTimer
+import pytest
+
+
+def make_swarm(swarm_class, profile, **kwargs):
+    return swarm_class(
+        swarm_size=10,
+        bounds=[[-5.12, 5.12]] * 3,
+        dimensions=3,
+        task=Task.MINIMIZE,
+        cost_function=Rastrigin.function,
+        logger=SwarmLogger(epsilon=-1, name="Rastrigin", optimum_position=0),
+        batch_cost_function=Rastrigin.batch_function,
+        rng=0,
+        profile=profile,
+        **kwargs,
+    )
+
+
+def run(swarm, iterations=5):
+    swarm.run_optimization(
+        iterations=iterations,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+    )
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm, AsynchronousSwarm])
+def test_phases_are_timed(swarm_class):
+    swarm = make_swarm(swarm_class, profile=True)
+    run(swarm)
+
+    timer = swarm.timer
+    # The initialisation is the first iteration
+    assert timer.iterations == 6
+    assert timer.evaluations == swarm.evaluations
+    for phase in (Phase.VELOCITY, Phase.POSITION, Phase.EVALUATION):
+        assert timer.totals[phase] > 0
+        assert len(timer.per_iteration[phase]) == 6
+    assert timer.total_seconds() == pytest.approx(sum(timer.totals.values()))
+    assert [row[0] for row in timer.summary()][:3] == [
+        "velocity update",
+        "position update",
+        "cost evaluation",
+    ]
+
+
+@pytest.mark.parametrize("swarm_class", [Swarm, VectorizedSwarm])
+def test_profiling_does_not_change_results(swarm_class):
+    plain = make_swarm(swarm_class, profile=False)
+    profiled = make_swarm(swarm_class, profile=True)
+    run(plain)
+    run(profiled)
+
+    assert isinstance(plain.timer, NullPhaseTimer)
+    assert not plain.timer.enabled and plain.timer.iterations == 0
+    assert plain.global_best_cost == profiled.global_best_cost
+
+
+def test_checkpoint_keeps_timer(tmp_path):
+    path = tmp_path / "swarm.pkl"
+    swarm = make_swarm(Swarm, profile=True)
+    run(swarm, iterations=2)
+    swarm.save_checkpoint(path)
+
+    restored = Swarm.load_checkpoint(path)
+    restored.continue_optimization(2)
+    assert restored.timer.iterations == 5
+
+
+def test_mean_of_timers():
+    first, second = PhaseTimer(), PhaseTimer()
+    for timer, seconds in ((first, 1.0), (second, 3.0)):
+        timer.add_evaluations(10)
+        timer._current[Phase.EVALUATION] = seconds
+        timer.end_iteration()
+    second.end_iteration()
+
+    mean = PhaseTimer.mean([first, second])
+    assert mean.evaluations == 10
+    assert mean.totals[Phase.EVALUATION] == 2.0
+    # The second iteration was only reached by the second timer
+    assert mean.per_iteration[Phase.EVALUATION] == [2.0, 0.0]
+
+    with pytest.raises(ValueError):
+        PhaseTimer.mean([])
@@ -0,0 +1,172 @@
+from src.projekt_pop_24z.benchmark import (
+    AlgorithmParameters,
+    Engine,
+    run_single_benchmark,
+)
+from src.projekt_pop_24z.benchmark_functions.repository import Rastrigin
+from src.projekt_pop_24z.swarm.pso import Swarm, Task
+from src.projekt_pop_24z.utils.logger import HistoryMode, LogParameters, SwarmLogger
+from src.projekt_pop_24z.utils.run_log import RunLog, RunLogWriter, open_run_logs
+import numpy as np
+import pickle
+import pytest
+
+
+def make_logger(sink: RunLogWriter) -> SwarmLogger:
+    return SwarmLogger(
+        epsilon=-1,
+        name="Run log",
+        optimum_position=0,
+        history_mode=HistoryMode.NONE,
+        sink=sink,
+    )
+
+
+def log_iterations(logger: SwarmLogger, iterations: range) -> None:
+    for iteration in iterations:
+        logger.log_global_best_cost(1.0 / (iteration + 1))
+        logger.add_inertia(0.5)
+        logger.add_particle_epoch(np.full((3, 2), iteration, dtype=float))
+
+
+def test_columns_round_trip(tmp_path):
+    sink = RunLogWriter(tmp_path / "run", chunk_rows=4, positions_interval=3)
+    logger = make_logger(sink)
+
+    log_iterations(logger, range(10))
+    # Only full chunks are written before closing
+    assert RunLog.open(tmp_path / "run").global_best_costs.shape == (8,)
+    logger.close()
+
+    run = RunLog.open(tmp_path / "run")
+    np.testing.assert_array_equal(
+        run.global_best_costs, [1 / (i + 1) for i in range(10)]
+    )
+    np.testing.assert_array_equal(run.inertia_history, [0.5] * 10)
+    assert run.particle_positions_epochs.tolist() == [0, 3, 6, 9]
+    assert run.particle_positions_history.shape == (4, 3, 2)
+    assert isinstance(run.global_best_costs, np.memmap)
+    assert run.summary["name"] == "Run log"
+
+
+def test_partial_row_is_ignored(tmp_path):
+    sink = RunLogWriter(tmp_path / "run", chunk_rows=1)
+    make_logger(sink).log_global_best_cost(2.0)
+    with (tmp_path / "run" / "global_best_cost.bin").open("ab") as file:
+        file.write(b"\0\0\0")
+
+    assert RunLog.open(tmp_path / "run").global_best_costs.tolist() == [2.0]
+
+
+def test_rewind_truncates_abandoned_rows(tmp_path):
+    logger = make_logger(RunLogWriter(tmp_path / "run", chunk_rows=2))
+    log_iterations(logger, range(3))
+    state = pickle.dumps(logger)
+    log_iterations(logger, range(3, 8))
+    logger.close()
+
+    # Only loading a snapshot, e.g. to inspect it, leaves the run alone
+    resumed = pickle.loads(state)
+    assert len(RunLog.open(tmp_path / "run").global_best_costs) == 8
+
+    resumed.rewind()
+    log_iterations(resumed, range(3, 5))
+    resumed.close()
+
+    run = RunLog.open(tmp_path / "run")
+    np.testing.assert_array_equal(
+        run.global_best_costs, [1 / (i + 1) for i in range(5)]
+    )
+    assert run.particle_positions_epochs.tolist() == list(range(5))
+
+
+def test_create_picks_new_directories(tmp_path):
+    first = RunLogWriter.create(tmp_path, "Rastrigin")
+    second = RunLogWriter.create(tmp_path, "Rastrigin")
+    assert first.path != second.path
+    assert second.path.parent == tmp_path
+
+
+def test_invalid_parameters(tmp_path):
+    with pytest.raises(ValueError):
+        RunLogWriter(tmp_path, chunk_rows=0)
+    with pytest.raises(ValueError):
+        RunLogWriter(tmp_path, positions_interval=0)
+
+
+def test_benchmark_streams_runs(tmp_path):
+    parameters = AlgorithmParameters(
+        swarm_size=5,
+        bounds=[[-5.12, 5.12]] * 2,
+        dimensions=2,
+        task=Task.MINIMIZE,
+        iterations=20,
+        initial_inertia=0.7,
+        cognitive_constant=1.5,
+        social_constant=1.5,
+        engine=Engine.NUMPY,
+    )
+    log_params = LogParameters(
+        name="Rastrigin",
+        history_mode=HistoryMode.NONE,
+        log_dir=str(tmp_path),
+        log_positions_interval=1,
+    )
+
+    results = [
+        run_single_benchmark(
+            Rastrigin.function, parameters, log_params, Rastrigin.batch_function, seed
+        )[0]
+        for seed in range(3)
+    ]
+
+    runs = list(open_run_logs(tmp_path))
+    assert len(runs) == 3
+    for run, result in zip(runs, results):
+        logger = run.to_logger()
+        np.testing.assert_array_equal(
+            logger.global_best_costs, result.logger.global_best_costs
+        )
+        assert logger.iterations == 20
+        assert logger.evaluations == result.logger.evaluations
+        assert logger.particle_positions_history.shape == (21, 5, 2)
+        assert logger.particle_positions_epochs == list(range(21))
+
+
+def test_resume_rewinds_and_closes_the_run_log(tmp_path):
+    def make_swarm(cost_function) -> Swarm:
+        return Swarm(
+            swarm_size=4,
+            bounds=[[-5.12, 5.12]] * 2,
+            dimensions=2,
+            task=Task.MINIMIZE,
+            cost_function=cost_function,
+            logger=make_logger(RunLogWriter(tmp_path / "run", chunk_rows=3)),
+            rng=5,
+            checkpoint_path=tmp_path / "swarm.ckpt",
+            checkpoint_interval=0,
+        )
+
+    calls = 0
+
+    def crashing(position: list[float]) -> float:
+        nonlocal calls
+        calls += 1
+        if calls > 4 * 6:
+            raise ArithmeticError("crashed")
+        return Rastrigin.function(position)
+
+    with pytest.raises(ArithmeticError):
+        make_swarm(crashing).run_optimization(
+            iterations=10,
+            initial_inertia=0.7,
+            cognitive_constant=1.5,
+            social_constant=1.5,
+        )
+
+    swarm = Swarm.resume(tmp_path / "swarm.ckpt", cost_function=Rastrigin.function)
+
+    run = RunLog.open(tmp_path / "run")
+    np.testing.assert_array_equal(run.global_best_costs, swarm.logger.global_best_costs)
+    assert len(run.global_best_costs) == 11
+    assert run.summary["iterations"] == 10
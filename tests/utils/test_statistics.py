@@ -0,0 +1,51 @@
+from src.projekt_pop_24z.utils.statistics import P2Quantile, RunningStatistics
+import numpy as np
+import pytest
+
+
+def test_running_statistics_match_numpy():
+    data = np.random.default_rng(0).normal(size=(200, 3))
+    statistics = RunningStatistics(length=3, quantiles=(0.5,))
+
+    for row in data:
+        statistics.add(row)
+
+    np.testing.assert_allclose(statistics.mean(), data.mean(axis=0))
+    np.testing.assert_allclose(statistics.std(), data.std(axis=0))
+    np.testing.assert_array_equal(statistics.min(), data.min(axis=0))
+    np.testing.assert_array_equal(statistics.max(), data.max(axis=0))
+    np.testing.assert_allclose(
+        statistics.quantile(0.5), np.median(data, axis=0), atol=0.15
+    )
+
+
+@pytest.mark.parametrize("offset", [1e5, 1e8])
+def test_running_std_with_a_large_offset(offset):
+    data = offset + np.random.default_rng(2).normal(scale=0.8, size=(30, 2))
+    statistics = RunningStatistics(length=2, quantiles=(0.5,))
+
+    for row in data:
+        statistics.add(row)
+
+    np.testing.assert_allclose(statistics.mean(), data.mean(axis=0))
+    np.testing.assert_allclose(statistics.std(), data.std(axis=0), rtol=1e-6)
+
+
+@pytest.mark.parametrize("q", [0.1, 0.9])
+def test_p2_quantile_estimate(q):
+    data = np.random.default_rng(1).uniform(size=(1000, 2))
+    estimator = P2Quantile(quantile=q, length=2)
+
+    for row in data:
+        estimator.add(row)
+
+    np.testing.assert_allclose(estimator.value(), [q, q], atol=0.05)
+
+
+def test_p2_quantile_is_exact_for_few_rows():
+    estimator = P2Quantile(quantile=0.5, length=1)
+
+    for value in (3.0, 1.0, 2.0):
+        estimator.add(np.array([value]))
+
+    np.testing.assert_array_equal(estimator.value(), [2.0])